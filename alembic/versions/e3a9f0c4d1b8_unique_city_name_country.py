@@ -0,0 +1,42 @@
+"""Unique constraint on cities (name, country)
+
+Revision ID: e3a9f0c4d1b8
+Revises: d58e0b6c2f71
+Create Date: 2026-10-19 12:21:45.608213
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e3a9f0c4d1b8'
+down_revision: Union[str, None] = 'd58e0b6c2f71'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+CANONICAL_CITY = (
+    "(SELECT k.id FROM cities k JOIN cities c ON k.name = c.name AND k.country = c.country "
+    "WHERE c.id = {table}.city_id ORDER BY k.created_at, k.id LIMIT 1)"
+)
+
+
+def upgrade() -> None:
+    # Repoint references from duplicate cities to the oldest copy before dropping the rest.
+    for table in ('activities', 'itinerary_days'):
+        op.execute(f"UPDATE {table} SET city_id = {CANONICAL_CITY.format(table=table)}")
+    op.execute(
+        "DELETE FROM cities WHERE id <> (SELECT k.id FROM cities k WHERE k.name = cities.name "
+        "AND k.country = cities.country ORDER BY k.created_at, k.id LIMIT 1)"
+    )
+
+    with op.batch_alter_table('cities') as batch_op:
+        batch_op.create_unique_constraint('uq_cities_name_country', ['name', 'country'])
+
+
+def downgrade() -> None:
+    with op.batch_alter_table('cities') as batch_op:
+        batch_op.drop_constraint('uq_cities_name_country', type_='unique')
@@ -1,5 +1,5 @@
 from pydantic_settings import BaseSettings, SettingsConfigDict
-from typing import List
+from typing import List, Optional
 
 
 class Settings(BaseSettings):
@@ -10,22 +10,115 @@ class Settings(BaseSettings):
     APP_NAME: str = "GlobeTrotter API"
     API_VERSION: str = "v1"
     
+    LOG_LEVEL: str = "INFO"
+    LOG_FORMAT: str = "json"
+    LOG_FILE: str = "logs/app.log"
+    LOG_FILE_MAX_BYTES: int = 10485760
+    LOG_FILE_BACKUPS: int = 5
+    LOG_QUEUE_SIZE: int = 10000
+    LOG_DEBUG_SAMPLE_RATE: float = 0.1
+    
     HOST: str = "0.0.0.0"
     PORT: int = 8000
+    WEB_WORKERS: int = 0
+    WEB_PRELOAD: bool = True
+    WEB_MAX_REQUESTS: int = 10000
+    WEB_MAX_REQUESTS_JITTER: int = 1000
+    WEB_GRACEFUL_TIMEOUT_SECONDS: int = 30
+    WEB_WORKER_TIMEOUT_SECONDS: int = 60
+    WEB_KEEPALIVE_SECONDS: int = 5
     
     DATABASE_URL: str
+    DB_ECHO: bool = False
+    DB_POOL_SIZE: int = 10
+    DB_MAX_OVERFLOW: int = 20
+    DB_POOL_TIMEOUT: float = 5.0
+    DB_POOL_RECYCLE: int = 1800
+    DB_POOL_PRE_PING: bool = True
+    DB_POOL_WARMUP: int = 5
+    DATABASE_REPLICA_URLS: str = ""
+    DB_REPLICA_POLICY: str = "round_robin"
+    DB_REPLICA_RETRY_SECONDS: int = 30
+    READ_YOUR_WRITES_SECONDS: int = 5
+    READ_YOUR_WRITES_MAX_KEYS: int = 100000
+    READ_YOUR_WRITES_COOKIE: str = "last_write"
+    DB_STATEMENT_BUDGET: int = 25
+    DB_STATEMENT_BUDGET_STRICT: bool = False
+    DB_N_PLUS_ONE_THRESHOLD: int = 5
+    DB_SLOW_QUERY_MS: int = 200
+    DB_SLOW_QUERY_EXPLAIN_SAMPLE_RATE: float = 0.0
+    DB_SLOW_QUERY_LOG_SIZE: int = 100
+    REQUEST_DEADLINE_SECONDS: float = 10.0
+    REQUEST_ID_HEADER: str = "X-Request-ID"
+    SLOW_REQUEST_MS: int = 1000
+    DB_STREAM_YIELD_PER: int = 500
+    STREAM_CHUNK_BYTES: int = 65536
+    
+    COMPRESSION_ENABLED: bool = True
+    COMPRESSION_MIN_BYTES: int = 1024
+    COMPRESSION_OFFLOAD_BYTES: int = 65536
+    COMPRESSION_WORKERS: int = 2
+    COMPRESSION_CACHE_BYTES: int = 16777216
+    COMPRESSION_GZIP_LEVEL: int = 6
+    COMPRESSION_BROTLI_QUALITY: int = 5
+    COMPRESSION_ZSTD_LEVEL: int = 3
+    
+    METRICS_ENABLED: bool = True
+    METRICS_SAMPLE_INTERVAL_SECONDS: float = 5.0
+    PROMETHEUS_MULTIPROC_DIR: str = ""
+    LOOP_MONITOR_ENABLED: bool = True
+    LOOP_LAG_PROBE_SECONDS: float = 0.25
+    LOOP_LAG_THRESHOLD_MS: int = 100
+    LOOP_LAG_WINDOW_SECONDS: float = 60.0
+    LOOP_BLOCK_STACKS: Optional[bool] = None
+    
+    TRACING_ENABLED: bool = True
+    SERVER_TIMING_ENABLED: bool = True
+    TRACE_EXPORT: str = ""
+    TRACE_SAMPLE_RATE: float = 0.1
+    TRACE_EXPORT_PATH: str = "logs/traces.jsonl"
+    TRACE_OTLP_ENDPOINT: str = "http://localhost:4318/v1/traces"
+    TRACE_EXPORT_BATCH_SIZE: int = 512
+    TRACE_EXPORT_INTERVAL_SECONDS: float = 2.0
+    TRACE_EXPORT_MAX_QUEUE: int = 1000
     
     JWT_SECRET_KEY: str
     JWT_REFRESH_SECRET_KEY: str
     JWT_ALGORITHM: str = "HS256"
     ACCESS_TOKEN_EXPIRE_MINUTES: int = 15
     REFRESH_TOKEN_EXPIRE_DAYS: int = 7
+    ACCESS_TOKEN_CACHE_SIZE: int = 10000
+    REFRESH_TOKEN_PURGE_INTERVAL_SECONDS: int = 3600
+    REFRESH_TOKEN_PURGE_BATCH_SIZE: int = 1000
+    
+    TRIP_ARCHIVE_INTERVAL_SECONDS: int = 3600
+    TRIP_ARCHIVE_BATCH_SIZE: int = 500
+    TRIP_ARCHIVE_GRACE_HOURS: int = 24
+    
+    PASSWORD_HASH_WORKERS: int = 4
+    PASSWORD_HASH_QUEUE_SIZE: int = 32
+    
+    LOGIN_RATE_LIMIT_PER_IP: int = 20
+    LOGIN_RATE_LIMIT_PER_EMAIL: int = 5
+    LOGIN_RATE_LIMIT_WINDOW_SECONDS: int = 60
+    RATE_LIMIT_MAX_KEYS: int = 100000
+    RATE_LIMIT_REDIS_URL: Optional[str] = None
     
     CORS_ORIGINS: str = "http://localhost:3000"
     
     @property
     def cors_origins_list(self) -> List[str]:
         return [origin.strip() for origin in self.CORS_ORIGINS.split(",")]
+    
+    @property
+    def loop_block_stacks_enabled(self) -> bool:
+        if self.LOOP_BLOCK_STACKS is not None:
+            return self.LOOP_BLOCK_STACKS
+        return self.DEBUG or self.ENV == "staging"
+    
+    @property
+    def database_replica_urls_list(self) -> List[str]:
+        return [url.strip() for url in self.DATABASE_REPLICA_URLS.split(",") if url.strip()]
 
 
 settings = Settings()
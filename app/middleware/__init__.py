@@ -1,9 +1,33 @@
 from app.middleware.auth import get_current_user, get_current_user_id, require_admin
-from app.middleware.error_handler import error_handler_middleware
+from app.middleware.error_handler import ErrorHandlerMiddleware
+from app.middleware.request_id import RequestIdMiddleware
+from app.middleware.timing import TimingMiddleware
+from app.middleware.metrics import MetricsMiddleware
+from app.middleware.tracing import TracingMiddleware
+from app.middleware.rate_limit import limit_login_attempts
+from app.middleware.query_budget import QueryBudgetMiddleware, statement_budget, route_statement_budget
+from app.middleware.deadline import DeadlineMiddleware, request_deadline
+from app.middleware.read_your_writes import ReadYourWritesMiddleware
+from app.middleware.fieldsets import sparse_fieldset
+from app.middleware.compression import CompressionMiddleware, cache_compressed_response
 
 __all__ = [
     "get_current_user",
     "get_current_user_id",
     "require_admin",
-    "error_handler_middleware",
+    "ErrorHandlerMiddleware",
+    "RequestIdMiddleware",
+    "TimingMiddleware",
+    "MetricsMiddleware",
+    "TracingMiddleware",
+    "limit_login_attempts",
+    "QueryBudgetMiddleware",
+    "statement_budget",
+    "route_statement_budget",
+    "DeadlineMiddleware",
+    "request_deadline",
+    "ReadYourWritesMiddleware",
+    "sparse_fieldset",
+    "CompressionMiddleware",
+    "cache_compressed_response",
 ]
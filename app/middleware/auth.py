@@ -1,18 +1,20 @@
-from fastapi import Request, HTTPException, status
+from fastapi import Request, HTTPException, Depends, status
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
 from typing import Optional
-from app.utils import verify_access_token
+from app.utils import verify_access_token_cached
 from app.utils.logger import logger
+from app.utils.tracing import span
 import jwt
 
 
 security = HTTPBearer()
 
 
-async def get_current_user(credentials: HTTPAuthorizationCredentials = security) -> dict:
+async def get_current_user(credentials: HTTPAuthorizationCredentials = Depends(security)) -> dict:
     try:
         token = credentials.credentials
-        payload = verify_access_token(token)
+        with span("verify_access_token", "auth"):
+            payload = verify_access_token_cached(token)
         return payload
     except jwt.ExpiredSignatureError:
         raise HTTPException(
@@ -32,11 +34,11 @@ async def get_current_user(credentials: HTTPAuthorizationCredentials = security)
         )
 
 
-async def get_current_user_id(user: dict = get_current_user) -> str:
+async def get_current_user_id(user: dict = Depends(get_current_user)) -> str:
     return user.get("user_id")
 
 
-async def require_admin(user: dict = get_current_user) -> dict:
+async def require_admin(user: dict = Depends(get_current_user)) -> dict:
     if user.get("role") != "ADMIN":
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
@@ -0,0 +1,97 @@
+from fastapi import Depends
+from starlette.datastructures import Headers, MutableHeaders
+from app.config import settings
+from app.utils.compression import ResponseCompression, current_compression, negotiate, response_compressor, track_compression
+
+COMPRESSIBLE_TYPES = ("application/json", "text/", "application/javascript", "application/xml", "image/svg+xml")
+
+
+def cache_compressed_response():
+    async def declare_cache_compressed_response() -> None:
+        state = current_compression()
+        if state is not None:
+            state.cacheable = True
+    
+    return Depends(declare_cache_compressed_response)
+
+
+class CompressionMiddleware:
+    def __init__(self, app):
+        self.app = app
+    
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or not settings.COMPRESSION_ENABLED or scope["method"] == "HEAD":
+            await self.app(scope, receive, send)
+            return
+        
+        encoding = negotiate(Headers(scope=scope).get("accept-encoding", ""))
+        if encoding is None:
+            await self.app(scope, receive, send)
+            return
+        
+        state = ResponseCompression()
+        start = None
+        headers = None
+        buffer = None
+        stream = None
+        passthrough = False
+        
+        async def compressing_send(message):
+            nonlocal start, headers, buffer, stream, passthrough
+            if message["type"] == "http.response.start":
+                start = message
+                return
+            if message["type"] != "http.response.body" or passthrough:
+                await send(message)
+                return
+            
+            body = message.get("body", b"")
+            more_body = message.get("more_body", False)
+            if headers is None:
+                headers = MutableHeaders(raw=list(start["headers"]))
+                if not self._compressible(start["status"], headers):
+                    passthrough = True
+                    await send(start)
+                    await send(message)
+                    return
+                if more_body and "content-length" in headers:
+                    buffer = bytearray()
+                elif more_body:
+                    headers["Content-Encoding"] = encoding
+                    headers.add_vary_header("Accept-Encoding")
+                    del headers["Content-Length"]
+                    stream = response_compressor.stream(encoding)
+                    await send({**start, "headers": headers.raw})
+            
+            if stream is not None:
+                chunk = await response_compressor.run(stream.compress, body) if body else b""
+                if not more_body:
+                    chunk += stream.finish()
+                await send({"type": "http.response.body", "body": chunk, "more_body": more_body})
+                return
+            
+            if buffer is not None:
+                buffer += body
+                if more_body:
+                    return
+                body = bytes(buffer)
+            
+            if len(body) < settings.COMPRESSION_MIN_BYTES:
+                await send(start)
+                await send({"type": "http.response.body", "body": body})
+                return
+            
+            compressed = await response_compressor.compress(encoding, body, state.cacheable)
+            headers["Content-Encoding"] = encoding
+            headers.add_vary_header("Accept-Encoding")
+            headers["Content-Length"] = str(len(compressed))
+            await send({**start, "headers": headers.raw})
+            await send({"type": "http.response.body", "body": compressed})
+        
+        with track_compression(state):
+            await self.app(scope, receive, compressing_send)
+    
+    def _compressible(self, status: int, headers: MutableHeaders) -> bool:
+        if status < 200 or status in (204, 304) or "content-encoding" in headers:
+            return False
+        return headers.get("content-type", "").startswith(COMPRESSIBLE_TYPES)
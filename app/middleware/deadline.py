@@ -0,0 +1,64 @@
+import anyio
+from fastapi import Depends, Request, status
+from fastapi.responses import JSONResponse
+from app.config import settings
+from app.utils import ApiResponse
+from app.utils.deadline import Deadline, current_deadline, track_deadline
+from app.utils.logger import logger
+
+
+def request_deadline(seconds: float, cancel_on_disconnect: bool = True):
+    async def declare_request_deadline(request: Request) -> None:
+        deadline = current_deadline()
+        if deadline is not None:
+            deadline.reset(seconds)
+            if cancel_on_disconnect:
+                deadline.watch_disconnect(request.receive)
+    
+    declare_request_deadline.deadline = seconds
+    return Depends(declare_request_deadline)
+
+
+class DeadlineMiddleware:
+    def __init__(self, app):
+        self.app = app
+    
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        
+        deadline = Deadline(settings.REQUEST_DEADLINE_SECONDS)
+        response_started = False
+        
+        async def guarded_send(message):
+            nonlocal response_started
+            if message["type"] == "http.response.start":
+                response_started = True
+            await send(message)
+        
+        with track_deadline(deadline):
+            try:
+                with anyio.CancelScope() as cancel_scope:
+                    deadline.bind(cancel_scope)
+                    await self.app(scope, receive, guarded_send)
+            finally:
+                deadline.close()
+        
+        if not cancel_scope.cancelled_caught:
+            return
+        
+        name = f"{scope['method']} {scope['path']}"
+        if deadline.disconnected:
+            logger.info(f"Client disconnected, cancelled {name}")
+            return
+        
+        logger.warning(f"{name} exceeded its {deadline.seconds}s deadline")
+        if not response_started:
+            await self._timeout_response(scope, receive, send)
+    
+    async def _timeout_response(self, scope, receive, send) -> None:
+        await JSONResponse(
+            status_code=status.HTTP_504_GATEWAY_TIMEOUT,
+            content=ApiResponse.error("Request deadline exceeded")
+        )(scope, receive, send)
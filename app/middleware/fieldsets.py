@@ -0,0 +1,15 @@
+from typing import List, Optional
+from fastapi import Depends, HTTPException, Query, status
+from app.schemas.fieldsets import parse_fields
+
+
+def sparse_fieldset(schema):
+    async def declare_sparse_fieldset(
+        fields: Optional[str] = Query(None, description=f"Comma-separated {schema.__name__} fields to return")
+    ) -> Optional[List[str]]:
+        try:
+            return parse_fields(schema, fields)
+        except ValueError as e:
+            raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+    
+    return Depends(declare_sparse_fieldset)
@@ -0,0 +1,16 @@
+from fastapi import Request, HTTPException, status
+from app.schemas.user import UserLogin
+from app.utils.rate_limit import login_rate_limiter
+from app.utils.logger import logger
+
+
+async def limit_login_attempts(request: Request, credentials: UserLogin) -> None:
+    ip = request.client.host if request.client else "unknown"
+    retry_after = await login_rate_limiter.check(ip, credentials.email)
+    if retry_after is not None:
+        logger.warning(f"Login rate limit exceeded for {ip}")
+        raise HTTPException(
+            status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+            detail="Too many login attempts, please retry later",
+            headers={"Retry-After": str(retry_after)}
+        )
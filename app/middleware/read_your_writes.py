@@ -0,0 +1,29 @@
+from starlette.datastructures import MutableHeaders
+from app.config import settings
+
+
+class ReadYourWritesMiddleware:
+    def __init__(self, app):
+        self.app = app
+    
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        
+        state = scope.setdefault("state", {})
+        
+        async def send_with_marker(message):
+            if message["type"] == "http.response.start":
+                marker = state.get("write_marker")
+                if marker:
+                    cookie = (
+                        f"{settings.READ_YOUR_WRITES_COOKIE}={marker}; Max-Age={settings.READ_YOUR_WRITES_SECONDS}; "
+                        "Path=/; HttpOnly; SameSite=Lax"
+                    )
+                    if scope.get("scheme") == "https":
+                        cookie += "; Secure"
+                    MutableHeaders(scope=message).append("Set-Cookie", cookie)
+            await send(message)
+        
+        await self.app(scope, receive, send_with_marker)
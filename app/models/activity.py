@@ -1,16 +1,16 @@
-from sqlalchemy import Column, String, Float, Integer, Text, DateTime, ForeignKey
+from sqlalchemy import Column, String, Float, Integer, Text, DateTime, ForeignKey, Uuid
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
-import uuid
 
 from app.database import Base
+from app.utils.ids import new_id
 
 
 class Activity(Base):
     __tablename__ = "activities"
     
-    id = Column(String, primary_key=True, default=lambda: str(uuid.uuid4()))
-    city_id = Column(String, ForeignKey("cities.id", ondelete="CASCADE"), nullable=False, index=True)
+    id = Column(Uuid(as_uuid=False), primary_key=True, default=new_id)
+    city_id = Column(Uuid(as_uuid=False), ForeignKey("cities.id", ondelete="CASCADE"), nullable=False, index=True)
     name = Column(String, nullable=False)
     description = Column(Text, nullable=True)
     category = Column(String, nullable=False, index=True)
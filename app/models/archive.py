@@ -0,0 +1,24 @@
+from sqlalchemy import Column, DateTime, Table
+from sqlalchemy.sql import func
+
+from app.database import Base
+from app.models.trip import Trip
+from app.models.itinerary_day import ItineraryDay
+from app.models.itinerary_item import ItineraryItem
+from app.models.budget import Budget
+
+
+def _archive_table(source: Table) -> Table:
+    return Table(
+        f"{source.name}_archive",
+        Base.metadata,
+        *[Column(column.name, column.type, primary_key=column.primary_key, nullable=column.nullable)
+          for column in source.columns],
+        Column("archived_at", DateTime(timezone=True), server_default=func.now(), nullable=False)
+    )
+
+
+trips_archive = _archive_table(Trip.__table__)
+itinerary_days_archive = _archive_table(ItineraryDay.__table__)
+itinerary_items_archive = _archive_table(ItineraryItem.__table__)
+budgets_archive = _archive_table(Budget.__table__)
@@ -1,15 +1,15 @@
-from sqlalchemy import Column, String, Text, DateTime
+from sqlalchemy import Column, String, Text, DateTime, Uuid, UniqueConstraint
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
-import uuid
 
 from app.database import Base
+from app.utils.ids import new_id
 
 
 class City(Base):
     __tablename__ = "cities"
     
-    id = Column(String, primary_key=True, default=lambda: str(uuid.uuid4()))
+    id = Column(Uuid(as_uuid=False), primary_key=True, default=new_id)
     name = Column(String, nullable=False)
     country = Column(String, nullable=False)
     description = Column(Text, nullable=True)
@@ -21,5 +21,6 @@ class City(Base):
     activities = relationship("Activity", back_populates="city", cascade="all, delete-orphan")
     
     __table_args__ = (
+        UniqueConstraint("name", "country", name="uq_cities_name_country"),
         {"schema": None},
     )
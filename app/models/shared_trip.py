@@ -1,17 +1,17 @@
-from sqlalchemy import Column, String, DateTime, ForeignKey
+from sqlalchemy import Column, String, DateTime, ForeignKey, Uuid
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
-import uuid
 
 from app.database import Base
+from app.utils.ids import new_id
 
 
 class SharedTrip(Base):
     __tablename__ = "shared_trips"
     
-    id = Column(String, primary_key=True, default=lambda: str(uuid.uuid4()))
-    trip_id = Column(String, ForeignKey("trips.id", ondelete="CASCADE"), nullable=False)
-    user_id = Column(String, ForeignKey("users.id", ondelete="CASCADE"), nullable=False)
+    id = Column(Uuid(as_uuid=False), primary_key=True, default=new_id)
+    trip_id = Column(Uuid(as_uuid=False), ForeignKey("trips.id", ondelete="CASCADE"), nullable=False)
+    user_id = Column(Uuid(as_uuid=False), ForeignKey("users.id", ondelete="CASCADE"), nullable=False)
     share_token = Column(String, unique=True, nullable=False, index=True)
     expires_at = Column(DateTime(timezone=True), nullable=True)
     created_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
@@ -1,16 +1,16 @@
-from sqlalchemy import Column, String, Boolean, DateTime, ForeignKey, Text
+from sqlalchemy import Column, String, Boolean, DateTime, ForeignKey, Text, Uuid, Index
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
-import uuid
 
 from app.database import Base
+from app.utils.ids import new_id
 
 
 class Trip(Base):
     __tablename__ = "trips"
     
-    id = Column(String, primary_key=True, default=lambda: str(uuid.uuid4()))
-    user_id = Column(String, ForeignKey("users.id", ondelete="CASCADE"), nullable=False, index=True)
+    id = Column(Uuid(as_uuid=False), primary_key=True, default=new_id)
+    user_id = Column(Uuid(as_uuid=False), ForeignKey("users.id", ondelete="CASCADE"), nullable=False, index=True)
     title = Column(String, nullable=False)
     description = Column(Text, nullable=True)
     start_date = Column(DateTime(timezone=True), nullable=False)
@@ -19,6 +19,15 @@ class Trip(Base):
     created_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
     updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now(), nullable=False)
     
+    __table_args__ = (
+        Index("ix_trips_user_id_created_at_live", user_id, created_at,
+              postgresql_where=is_deleted == False, sqlite_where=is_deleted == False),
+        Index("ix_trips_created_at_live", created_at,
+              postgresql_where=is_deleted == False, sqlite_where=is_deleted == False),
+        Index("ix_trips_updated_at_deleted", updated_at,
+              postgresql_where=is_deleted == True, sqlite_where=is_deleted == True),
+    )
+    
     user = relationship("User", back_populates="trips")
     itinerary_days = relationship("ItineraryDay", back_populates="trip", cascade="all, delete-orphan")
     budget = relationship("Budget", back_populates="trip", uselist=False, cascade="all, delete-orphan")
@@ -5,6 +5,12 @@ from app.repositories.activity_repository import ActivityRepository
 from app.repositories.itinerary_repository import ItineraryRepository
 from app.repositories.budget_repository import BudgetRepository
 from app.repositories.shared_trip_repository import SharedTripRepository
+from app.repositories.refresh_token_repository import RefreshTokenRepository
+from app.repositories.archive_repository import TripArchiveRepository
+from app.repositories.loader import RequestLoader, get_loader
+from app.repositories.upsert import insert_or_ignore
+from app.repositories.fieldsets import load_only_fields
+from app.utils.tracing import trace_methods
 
 __all__ = [
     "UserRepository",
@@ -14,4 +20,14 @@ __all__ = [
     "ItineraryRepository",
     "BudgetRepository",
     "SharedTripRepository",
+    "RefreshTokenRepository",
+    "TripArchiveRepository",
+    "RequestLoader",
+    "get_loader",
+    "insert_or_ignore",
+    "load_only_fields",
 ]
+
+for _name in __all__:
+    if _name.endswith("Repository"):
+        trace_methods(globals()[_name])
@@ -2,23 +2,29 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select, or_
 from typing import Optional, List
 from app.models.city import City
+from app.repositories.loader import get_loader
+from app.repositories.fieldsets import load_only_fields
+from app.repositories.upsert import insert_or_ignore
 
 
 class CityRepository:
     def __init__(self, db: AsyncSession):
         self.db = db
+        self.loader = get_loader(db)
     
     async def create(self, name: str, country: str, description: Optional[str] = None,
-                     image_url: Optional[str] = None) -> City:
-        city = City(name=name, country=country, description=description, image_url=image_url)
-        self.db.add(city)
-        await self.db.commit()
-        await self.db.refresh(city)
+                     image_url: Optional[str] = None) -> Optional[City]:
+        city = await insert_or_ignore(
+            self.db, City,
+            {"name": name, "country": country, "description": description, "image_url": image_url},
+            conflict_columns=[City.name, City.country]
+        )
+        if city:
+            self.loader.prime(City, city)
         return city
     
     async def get_by_id(self, city_id: str) -> Optional[City]:
-        result = await self.db.execute(select(City).where(City.id == city_id))
-        return result.scalar_one_or_none()
+        return await self.loader.load(City, city_id)
     
     async def get_by_name_and_country(self, name: str, country: str) -> Optional[City]:
         result = await self.db.execute(
@@ -26,25 +32,27 @@ class CityRepository:
         )
         return result.scalar_one_or_none()
     
-    async def search(self, query: str, skip: int = 0, limit: int = 50) -> List[City]:
+    async def search(self, query: str, skip: int = 0, limit: int = 50,
+                     fields: Optional[List[str]] = None) -> List[City]:
         search_pattern = f"%{query}%"
-        result = await self.db.execute(
+        statement = (
             select(City)
             .where(or_(City.name.ilike(search_pattern), City.country.ilike(search_pattern)))
             .offset(skip)
             .limit(limit)
         )
+        result = await self.db.execute(load_only_fields(statement, City, fields))
         return list(result.scalars().all())
     
-    async def get_all(self, skip: int = 0, limit: int = 100) -> List[City]:
-        result = await self.db.execute(select(City).offset(skip).limit(limit))
+    async def get_all(self, skip: int = 0, limit: int = 100, fields: Optional[List[str]] = None) -> List[City]:
+        result = await self.db.execute(load_only_fields(select(City).offset(skip).limit(limit), City, fields))
         return list(result.scalars().all())
     
     async def update(self, city: City) -> City:
-        await self.db.commit()
-        await self.db.refresh(city)
+        await self.db.flush()
         return city
     
     async def delete(self, city: City) -> None:
         await self.db.delete(city)
-        await self.db.commit()
+        await self.db.flush()
+        self.loader.clear(City, city.id)
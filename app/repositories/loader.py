@@ -0,0 +1,121 @@
+import asyncio
+from typing import Any, Dict, Iterable, List, Optional
+from sqlalchemy import select, event
+from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.utils.ids import parse_id
+
+
+class RequestLoader:
+    def __init__(self, db: AsyncSession):
+        self.db = db
+        self._cache: Dict[tuple, asyncio.Future] = {}
+        self._pending: Dict[Any, Dict[Any, asyncio.Future]] = {}
+        self._lock = asyncio.Lock()
+        self._tasks = set()
+        self._cancelled = False
+
+    async def load(self, model, key) -> Optional[Any]:
+        key = parse_id(key)
+        if key is None:
+            return None
+        future = self._cache.get((model, key))
+        if future is None:
+            future = self._enqueue(model, key)
+        return await asyncio.shield(future)
+
+    async def load_many(self, model, keys: Iterable) -> List[Optional[Any]]:
+        return list(await asyncio.gather(*(self.load(model, key) for key in keys)))
+
+    def prime(self, model, obj) -> None:
+        future = self._cache.get((model, obj.id))
+        if future is not None and not future.done():
+            return
+        future = asyncio.get_running_loop().create_future()
+        future.set_result(obj)
+        self._cache[(model, obj.id)] = future
+
+    def prime_many(self, model, objs: Iterable) -> None:
+        for obj in objs:
+            if (model, obj.id) not in self._cache:
+                self.prime(model, obj)
+
+    def clear(self, model, key) -> None:
+        self._cache.pop((model, parse_id(key)), None)
+
+    def clear_all(self) -> None:
+        self._cache = {key: future for key, future in self._cache.items() if not future.done()}
+
+    async def cancel(self) -> None:
+        self._cancelled = True
+        for model in list(self._pending):
+            self._fail(model, self._pending.pop(model), None)
+        tasks = list(self._tasks)
+        for task in tasks:
+            task.cancel()
+        if tasks:
+            await asyncio.gather(*tasks, return_exceptions=True)
+
+    def _enqueue(self, model, key) -> asyncio.Future:
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        self._cache[(model, key)] = future
+
+        batch = self._pending.get(model)
+        if batch is None:
+            batch = self._pending[model] = {}
+            loop.call_soon(self._schedule_dispatch, model)
+        batch[key] = future
+        return future
+
+    def _schedule_dispatch(self, model) -> None:
+        if self._cancelled:
+            self._fail(model, self._pending.pop(model, {}), None)
+            return
+        task = asyncio.get_running_loop().create_task(self._dispatch(model))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def _dispatch(self, model) -> None:
+        batch = self._pending.pop(model, {})
+        if not batch:
+            return
+
+        try:
+            async with self._lock:
+                result = await self.db.execute(select(model).where(model.id.in_(list(batch))))
+                rows = {row.id: row for row in result.scalars().all()}
+        except asyncio.CancelledError:
+            self._fail(model, batch, None)
+            raise
+        except Exception as e:
+            self._fail(model, batch, e)
+            return
+
+        for key, future in batch.items():
+            if not future.done():
+                future.set_result(rows.get(key))
+
+    def _fail(self, model, batch: Dict[Any, asyncio.Future], error: Optional[Exception]) -> None:
+        for key, future in batch.items():
+            self._cache.pop((model, key), None)
+            if future.done():
+                continue
+            if error is None:
+                future.cancel()
+            else:
+                future.set_exception(error)
+
+
+def get_loader(db: AsyncSession) -> RequestLoader:
+    loader = db.info.get("loader")
+    if loader is None:
+        loader = db.info["loader"] = RequestLoader(db)
+    return loader
+
+
+@event.listens_for(Session, "after_rollback")
+def _clear_loader_after_rollback(session: Session) -> None:
+    loader = session.info.get("loader")
+    if loader is not None:
+        loader.clear_all()
@@ -0,0 +1,29 @@
+from typing import Any, List, Optional
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncSession
+
+_DIALECT_INSERTS = {
+    "postgresql": postgresql.insert,
+    "sqlite": sqlite.insert,
+}
+
+
+async def insert_or_ignore(db: AsyncSession, model, values: dict, conflict_columns: List) -> Optional[Any]:
+    dialect_insert = _DIALECT_INSERTS.get(db.get_bind().dialect.name)
+    if dialect_insert is not None:
+        result = await db.execute(
+            dialect_insert(model)
+            .values(**values)
+            .on_conflict_do_nothing(index_elements=conflict_columns)
+            .returning(model)
+        )
+        return result.scalar_one_or_none()
+    
+    obj = model(**values)
+    try:
+        async with db.begin_nested():
+            db.add(obj)
+    except IntegrityError:
+        return None
+    return obj
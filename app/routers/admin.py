@@ -0,0 +1,50 @@
+from fastapi import APIRouter, Depends, HTTPException, status, Query
+from typing import Optional
+from app.database import read_session
+from app.services.trip_service import TripService
+from app.schemas.trip import TripResponse
+from app.utils import ApiResponse
+from app.utils.logger import logger
+from app.utils.slow_query_log import slow_query_log
+from app.middleware import require_admin, statement_budget, request_deadline
+
+router = APIRouter(prefix="/admin", tags=["Admin"])
+
+
+@router.get("/slow-queries", response_model=dict)
+async def get_slow_queries(
+    limit: Optional[int] = Query(None, ge=1),
+    admin: dict = Depends(require_admin)
+):
+    try:
+        return ApiResponse.success({
+            **slow_query_log.stats(),
+            "queries": slow_query_log.recent(limit)
+        })
+    except Exception as e:
+        logger.error(f"Get slow queries error: {str(e)}")
+        raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail="Internal server error")
+
+
+@router.delete("/slow-queries", response_model=dict)
+async def clear_slow_queries(admin: dict = Depends(require_admin)):
+    slow_query_log.clear()
+    return ApiResponse.success({"message": "Slow query log cleared"})
+
+
+@router.get("/trips", response_model=dict, dependencies=[statement_budget(1), request_deadline(0, cancel_on_disconnect=False)])
+async def get_all_trips(
+    skip: int = Query(0, ge=0),
+    limit: int = Query(100, ge=1, le=10000),
+    admin: dict = Depends(require_admin)
+):
+    async def trips():
+        async with read_session() as db:
+            async for trip in TripService(db).stream_all_trips(skip, limit):
+                yield TripResponse.model_validate(trip)
+    
+    try:
+        return await ApiResponse.stream(trips())
+    except Exception as e:
+        logger.error(f"Get all trips error: {str(e)}")
+        raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail="Internal server error")
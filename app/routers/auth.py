@@ -3,13 +3,14 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from app.database import get_db
 from app.services.user_service import UserService
 from app.schemas.user import UserCreate, UserLogin, UserResponse, TokenResponse, RefreshTokenRequest
-from app.utils import ApiResponse, verify_refresh_token
+from app.utils import ApiResponse, PasswordHasherBusyError
 from app.utils.logger import logger
+from app.middleware import limit_login_attempts, statement_budget
 
 router = APIRouter(prefix="/auth", tags=["Authentication"])
 
 
-@router.post("/signup", response_model=dict, status_code=status.HTTP_201_CREATED)
+@router.post("/signup", response_model=dict, status_code=status.HTTP_201_CREATED, dependencies=[statement_budget(2)])
 async def signup(user_data: UserCreate, db: AsyncSession = Depends(get_db)):
     try:
         service = UserService(db)
@@ -17,17 +18,23 @@ async def signup(user_data: UserCreate, db: AsyncSession = Depends(get_db)):
         tokens = await service.generate_tokens(user)
         
         return ApiResponse.success({
-            "user": UserResponse.from_orm(user),
+            "user": UserResponse.model_validate(user),
             "tokens": TokenResponse(**tokens)
-        })
+        }, status_code=status.HTTP_201_CREATED)
     except ValueError as e:
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+    except PasswordHasherBusyError:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="Server busy, please retry",
+            headers={"Retry-After": "1"}
+        )
     except Exception as e:
         logger.error(f"Signup error: {str(e)}")
         raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail="Internal server error")
 
 
-@router.post("/login", response_model=dict)
+@router.post("/login", response_model=dict, dependencies=[statement_budget(2), Depends(limit_login_attempts)])
 async def login(credentials: UserLogin, db: AsyncSession = Depends(get_db)):
     try:
         service = UserService(db)
@@ -42,33 +49,31 @@ async def login(credentials: UserLogin, db: AsyncSession = Depends(get_db)):
         tokens = await service.generate_tokens(user)
         
         return ApiResponse.success({
-            "user": UserResponse.from_orm(user),
+            "user": UserResponse.model_validate(user),
             "tokens": TokenResponse(**tokens)
         })
     except HTTPException:
         raise
+    except PasswordHasherBusyError:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="Server busy, please retry",
+            headers={"Retry-After": "1"}
+        )
     except Exception as e:
         logger.error(f"Login error: {str(e)}")
         raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail="Internal server error")
 
 
-@router.post("/refresh", response_model=dict)
+@router.post("/refresh", response_model=dict, dependencies=[statement_budget(3)])
 async def refresh_token(token_data: RefreshTokenRequest, db: AsyncSession = Depends(get_db)):
     try:
-        payload = verify_refresh_token(token_data.refresh_token)
-        user_id = payload.get("user_id")
-        
-        if not user_id:
-            raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Invalid token")
-        
         service = UserService(db)
-        user = await service.get_user_by_id(user_id)
+        tokens = await service.refresh_tokens(token_data.refresh_token)
         
-        if not user or user.refresh_token != token_data.refresh_token:
+        if not tokens:
             raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Invalid token")
         
-        tokens = await service.generate_tokens(user)
-        
         return ApiResponse.success({
             "tokens": TokenResponse(**tokens)
         })
@@ -1,16 +1,18 @@
 from fastapi import APIRouter, Depends, HTTPException, status, Query
 from sqlalchemy.ext.asyncio import AsyncSession
-from typing import Optional
-from app.database import get_db
+from typing import List, Optional
+from app.database import get_db, get_read_db
 from app.services.city_service import CityService
 from app.schemas.city import CityCreate, CityUpdate, CityResponse
+from app.schemas.fieldsets import sparse_model
 from app.utils import ApiResponse
 from app.utils.logger import logger
+from app.middleware import statement_budget, request_deadline, sparse_fieldset, cache_compressed_response
 
 router = APIRouter(prefix="/cities", tags=["Cities"])
 
 
-@router.post("", response_model=dict, status_code=status.HTTP_201_CREATED)
+@router.post("", response_model=dict, status_code=status.HTTP_201_CREATED, dependencies=[statement_budget(1)])
 async def create_city(
     city_data: CityCreate,
     db: AsyncSession = Depends(get_db)
@@ -19,7 +21,7 @@ async def create_city(
         service = CityService(db)
         city = await service.create_city(city_data)
         
-        return ApiResponse.success(CityResponse.from_orm(city))
+        return ApiResponse.success(CityResponse.model_validate(city), status_code=status.HTTP_201_CREATED)
     except ValueError as e:
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
     except Exception as e:
@@ -27,31 +29,33 @@ async def create_city(
         raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail="Internal server error")
 
 
-@router.get("", response_model=dict)
+@router.get("", response_model=dict, dependencies=[statement_budget(2), request_deadline(3), cache_compressed_response()])
 async def search_cities(
     query: Optional[str] = Query(None),
     skip: int = 0,
     limit: int = 50,
-    db: AsyncSession = Depends(get_db)
+    fields: Optional[List[str]] = sparse_fieldset(CityResponse),
+    db: AsyncSession = Depends(get_read_db)
 ):
     try:
         service = CityService(db)
         
         if query:
-            cities = await service.search_cities(query, skip, limit)
+            cities = await service.search_cities(query, skip, limit, fields)
         else:
-            cities = await service.get_all_cities(skip, limit)
+            cities = await service.get_all_cities(skip, limit, fields)
         
-        return ApiResponse.success([CityResponse.from_orm(city) for city in cities])
+        response_model = sparse_model(CityResponse, fields)
+        return ApiResponse.success([response_model.model_validate(city) for city in cities])
     except Exception as e:
         logger.error(f"Search cities error: {str(e)}")
         raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail="Internal server error")
 
 
-@router.get("/{city_id}", response_model=dict)
+@router.get("/{city_id}", response_model=dict, dependencies=[statement_budget(1), cache_compressed_response()])
 async def get_city(
     city_id: str,
-    db: AsyncSession = Depends(get_db)
+    db: AsyncSession = Depends(get_read_db)
 ):
     try:
         service = CityService(db)
@@ -60,7 +64,7 @@ async def get_city(
         if not city:
             raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="City not found")
         
-        return ApiResponse.success(CityResponse.from_orm(city))
+        return ApiResponse.success(CityResponse.model_validate(city))
     except HTTPException:
         raise
     except Exception as e:
@@ -68,7 +72,7 @@ async def get_city(
         raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail="Internal server error")
 
 
-@router.put("/{city_id}", response_model=dict)
+@router.put("/{city_id}", response_model=dict, dependencies=[statement_budget(2)])
 async def update_city(
     city_id: str,
     city_data: CityUpdate,
@@ -81,7 +85,7 @@ async def update_city(
         if not city:
             raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="City not found")
         
-        return ApiResponse.success(CityResponse.from_orm(city))
+        return ApiResponse.success(CityResponse.model_validate(city))
     except HTTPException:
         raise
     except Exception as e:
@@ -89,7 +93,7 @@ async def update_city(
         raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail="Internal server error")
 
 
-@router.delete("/{city_id}", response_model=dict)
+@router.delete("/{city_id}", response_model=dict, dependencies=[statement_budget(4)])
 async def delete_city(
     city_id: str,
     db: AsyncSession = Depends(get_db)
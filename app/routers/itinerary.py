@@ -1,19 +1,21 @@
 from fastapi import APIRouter, Depends, HTTPException, status
 from sqlalchemy.ext.asyncio import AsyncSession
-from app.database import get_db
+from typing import List, Optional
+from app.database import get_db, get_read_db
 from app.services.itinerary_service import ItineraryService
 from app.schemas.itinerary import (
     ItineraryDayCreate, ItineraryDayUpdate, ItineraryDayResponse,
     ItineraryItemCreate, ItineraryItemUpdate, ItineraryItemResponse
 )
+from app.schemas.fieldsets import sparse_model
 from app.utils import ApiResponse
 from app.utils.logger import logger
-from app.middleware import get_current_user_id
+from app.middleware import get_current_user_id, statement_budget, sparse_fieldset
 
 router = APIRouter(prefix="/itinerary", tags=["Itinerary"])
 
 
-@router.post("/days", response_model=dict, status_code=status.HTTP_201_CREATED)
+@router.post("/days", response_model=dict, status_code=status.HTTP_201_CREATED, dependencies=[statement_budget(3)])
 async def create_itinerary_day(
     day_data: ItineraryDayCreate,
     current_user_id: str = Depends(get_current_user_id),
@@ -23,7 +25,7 @@ async def create_itinerary_day(
         service = ItineraryService(db)
         day = await service.create_day(current_user_id, day_data)
         
-        return ApiResponse.success(ItineraryDayResponse.from_orm(day))
+        return ApiResponse.success(ItineraryDayResponse.model_validate(day), status_code=status.HTTP_201_CREATED)
     except ValueError as e:
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
     except Exception as e:
@@ -31,17 +33,19 @@ async def create_itinerary_day(
         raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail="Internal server error")
 
 
-@router.get("/trips/{trip_id}/days", response_model=dict)
+@router.get("/trips/{trip_id}/days", response_model=dict, dependencies=[statement_budget(2)])
 async def get_trip_itinerary_days(
     trip_id: str,
+    fields: Optional[List[str]] = sparse_fieldset(ItineraryDayResponse),
     current_user_id: str = Depends(get_current_user_id),
-    db: AsyncSession = Depends(get_db)
+    db: AsyncSession = Depends(get_read_db)
 ):
     try:
         service = ItineraryService(db)
-        days = await service.get_days_by_trip(trip_id, current_user_id)
+        days = await service.get_days_by_trip(trip_id, current_user_id, fields)
         
-        return ApiResponse.success([ItineraryDayResponse.from_orm(day) for day in days])
+        response_model = sparse_model(ItineraryDayResponse, fields)
+        return ApiResponse.success([response_model.model_validate(day) for day in days])
     except ValueError as e:
         raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail=str(e))
     except Exception as e:
@@ -49,7 +53,7 @@ async def get_trip_itinerary_days(
         raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail="Internal server error")
 
 
-@router.put("/days/{day_id}", response_model=dict)
+@router.put("/days/{day_id}", response_model=dict, dependencies=[statement_budget(3)])
 async def update_itinerary_day(
     day_id: str,
     day_data: ItineraryDayUpdate,
@@ -63,7 +67,7 @@ async def update_itinerary_day(
         if not day:
             raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Itinerary day not found")
         
-        return ApiResponse.success(ItineraryDayResponse.from_orm(day))
+        return ApiResponse.success(ItineraryDayResponse.model_validate(day))
     except ValueError as e:
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
     except HTTPException:
@@ -73,7 +77,7 @@ async def update_itinerary_day(
         raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail="Internal server error")
 
 
-@router.delete("/days/{day_id}", response_model=dict)
+@router.delete("/days/{day_id}", response_model=dict, dependencies=[statement_budget(4)])
 async def delete_itinerary_day(
     day_id: str,
     current_user_id: str = Depends(get_current_user_id),
@@ -94,7 +98,7 @@ async def delete_itinerary_day(
         raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail="Internal server error")
 
 
-@router.post("/items", response_model=dict, status_code=status.HTTP_201_CREATED)
+@router.post("/items", response_model=dict, status_code=status.HTTP_201_CREATED, dependencies=[statement_budget(4)])
 async def create_itinerary_item(
     item_data: ItineraryItemCreate,
     current_user_id: str = Depends(get_current_user_id),
@@ -104,7 +108,7 @@ async def create_itinerary_item(
         service = ItineraryService(db)
         item = await service.create_item(current_user_id, item_data)
         
-        return ApiResponse.success(ItineraryItemResponse.from_orm(item))
+        return ApiResponse.success(ItineraryItemResponse.model_validate(item), status_code=status.HTTP_201_CREATED)
     except ValueError as e:
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
     except Exception as e:
@@ -112,17 +116,19 @@ async def create_itinerary_item(
         raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail="Internal server error")
 
 
-@router.get("/days/{day_id}/items", response_model=dict)
+@router.get("/days/{day_id}/items", response_model=dict, dependencies=[statement_budget(3)])
 async def get_day_itinerary_items(
     day_id: str,
+    fields: Optional[List[str]] = sparse_fieldset(ItineraryItemResponse),
     current_user_id: str = Depends(get_current_user_id),
-    db: AsyncSession = Depends(get_db)
+    db: AsyncSession = Depends(get_read_db)
 ):
     try:
         service = ItineraryService(db)
-        items = await service.get_items_by_day(day_id, current_user_id)
+        items = await service.get_items_by_day(day_id, current_user_id, fields)
         
-        return ApiResponse.success([ItineraryItemResponse.from_orm(item) for item in items])
+        response_model = sparse_model(ItineraryItemResponse, fields)
+        return ApiResponse.success([response_model.model_validate(item) for item in items])
     except ValueError as e:
         raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail=str(e))
     except Exception as e:
@@ -130,7 +136,7 @@ async def get_day_itinerary_items(
         raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail="Internal server error")
 
 
-@router.put("/items/{item_id}", response_model=dict)
+@router.put("/items/{item_id}", response_model=dict, dependencies=[statement_budget(4)])
 async def update_itinerary_item(
     item_id: str,
     item_data: ItineraryItemUpdate,
@@ -144,7 +150,7 @@ async def update_itinerary_item(
         if not item:
             raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Itinerary item not found")
         
-        return ApiResponse.success(ItineraryItemResponse.from_orm(item))
+        return ApiResponse.success(ItineraryItemResponse.model_validate(item))
     except ValueError as e:
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
     except HTTPException:
@@ -154,7 +160,7 @@ async def update_itinerary_item(
         raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail="Internal server error")
 
 
-@router.delete("/items/{item_id}", response_model=dict)
+@router.delete("/items/{item_id}", response_model=dict, dependencies=[statement_budget(4)])
 async def delete_itinerary_item(
     item_id: str,
     current_user_id: str = Depends(get_current_user_id),
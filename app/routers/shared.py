@@ -1,18 +1,18 @@
 from fastapi import APIRouter, Depends, HTTPException, status
 from sqlalchemy.ext.asyncio import AsyncSession
-from app.database import get_db
+from app.database import get_db, get_read_db
 from app.services.shared_trip_service import SharedTripService
 from app.services.trip_service import TripService
 from app.schemas.shared_trip import SharedTripCreate, SharedTripResponse
 from app.schemas.trip import TripResponse
 from app.utils import ApiResponse
 from app.utils.logger import logger
-from app.middleware import get_current_user_id
+from app.middleware import get_current_user_id, statement_budget, request_deadline, cache_compressed_response
 
 router = APIRouter(prefix="/shared", tags=["Shared Trips"])
 
 
-@router.post("", response_model=dict, status_code=status.HTTP_201_CREATED)
+@router.post("", response_model=dict, status_code=status.HTTP_201_CREATED, dependencies=[statement_budget(2)])
 async def create_shared_trip(
     shared_trip_data: SharedTripCreate,
     current_user_id: str = Depends(get_current_user_id),
@@ -22,7 +22,7 @@ async def create_shared_trip(
         service = SharedTripService(db)
         shared_trip = await service.create_shared_trip(current_user_id, shared_trip_data)
         
-        return ApiResponse.success(SharedTripResponse.from_orm(shared_trip))
+        return ApiResponse.success(SharedTripResponse.model_validate(shared_trip), status_code=status.HTTP_201_CREATED)
     except ValueError as e:
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
     except Exception as e:
@@ -30,10 +30,10 @@ async def create_shared_trip(
         raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail="Internal server error")
 
 
-@router.get("/{share_token}", response_model=dict)
+@router.get("/{share_token}", response_model=dict, dependencies=[statement_budget(3), request_deadline(5), cache_compressed_response()])
 async def get_shared_trip(
     share_token: str,
-    db: AsyncSession = Depends(get_db)
+    db: AsyncSession = Depends(get_read_db)
 ):
     try:
         service = SharedTripService(db)
@@ -45,8 +45,8 @@ async def get_shared_trip(
         shared_trip, trip = result
         
         return ApiResponse.success({
-            "shared_trip": SharedTripResponse.from_orm(shared_trip),
-            "trip": TripResponse.from_orm(trip)
+            "shared_trip": SharedTripResponse.model_validate(shared_trip),
+            "trip": TripResponse.model_validate(trip)
         })
     except HTTPException:
         raise
@@ -55,7 +55,7 @@ async def get_shared_trip(
         raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail="Internal server error")
 
 
-@router.delete("/{shared_trip_id}", response_model=dict)
+@router.delete("/{shared_trip_id}", response_model=dict, dependencies=[statement_budget(3)])
 async def revoke_shared_trip(
     shared_trip_id: str,
     current_user_id: str = Depends(get_current_user_id),
@@ -36,24 +36,3 @@ class TripResponse(BaseModel):
     
     class Config:
         from_attributes = True
-    
-    @classmethod
-    def from_orm(cls, obj):
-        data = {
-            'id': obj.id,
-            'user_id': obj.user_id,
-            'title': obj.title,
-            'description': obj.description,
-            'start_date': obj.start_date,
-            'end_date': obj.end_date,
-            'duration_days': getattr(obj, 'duration_days', 0),
-            'total_budget': getattr(obj, 'total_budget', 0.0),
-            'total_spent': getattr(obj, 'total_spent', 0.0),
-            'remaining_budget': getattr(obj, 'remaining_budget', 0.0),
-            'itinerary_days_count': getattr(obj, 'itinerary_days_count', 0),
-            'cities_count': getattr(obj, 'cities_count', 0),
-            'activities_count': getattr(obj, 'activities_count', 0),
-            'created_at': obj.created_at,
-            'updated_at': obj.updated_at
-        }
-        return cls(**data)
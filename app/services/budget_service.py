@@ -1,13 +1,12 @@
 from typing import Optional, Dict
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select
+from app.database import get_uow
 from app.repositories.budget_repository import BudgetRepository
 from app.repositories.trip_repository import TripRepository
 from app.repositories.itinerary_repository import ItineraryRepository
+from app.repositories.activity_repository import ActivityRepository
 from app.schemas.budget import BudgetCreate, BudgetUpdate
 from app.models.budget import Budget
-from app.models.itinerary_item import ItineraryItem
-from app.models.activity import Activity
 
 
 class BudgetService:
@@ -15,6 +14,8 @@ class BudgetService:
         self.repository = BudgetRepository(db)
         self.trip_repository = TripRepository(db)
         self.itinerary_repository = ItineraryRepository(db)
+        self.activity_repository = ActivityRepository(db)
+        self.uow = get_uow(db)
         self.db = db
     
     async def create_budget(self, user_id: str, budget_data: BudgetCreate) -> Budget:
@@ -22,20 +23,19 @@ class BudgetService:
         if not trip or trip.user_id != user_id:
             raise ValueError("Trip not found or access denied")
         
-        existing_budget = await self.repository.get_by_trip(budget_data.trip_id)
-        if existing_budget:
+        async with self.uow.transaction():
+            budget = await self.repository.create(
+                trip_id=budget_data.trip_id,
+                total_budget=budget_data.total_budget,
+                accommodation=budget_data.accommodation,
+                transportation=budget_data.transportation,
+                food=budget_data.food,
+                activities=budget_data.activities,
+                shopping=budget_data.shopping,
+                other=budget_data.other
+            )
+        if not budget:
             raise ValueError("Budget already exists for this trip")
-        
-        budget = await self.repository.create(
-            trip_id=budget_data.trip_id,
-            total_budget=budget_data.total_budget,
-            accommodation=budget_data.accommodation,
-            transportation=budget_data.transportation,
-            food=budget_data.food,
-            activities=budget_data.activities,
-            shopping=budget_data.shopping,
-            other=budget_data.other
-        )
         await self._compute_spent_amounts(budget)
         return budget
     
@@ -50,8 +50,6 @@ class BudgetService:
         return budget
     
     async def _compute_spent_amounts(self, budget: Budget) -> None:
-        days = await self.itinerary_repository.get_days_by_trip(budget.trip_id)
-        
         spent_by_category = {
             'accommodation': 0.0,
             'transportation': 0.0,
@@ -61,18 +59,11 @@ class BudgetService:
             'other': 0.0
         }
         
-        for day in days:
-            items = await self.itinerary_repository.get_items_by_day(day.id)
-            for item in items:
-                if item.activity_id:
-                    result = await self.db.execute(
-                        select(Activity).where(Activity.id == item.activity_id)
-                    )
-                    activity = result.scalar_one_or_none()
-                    if activity and activity.estimated_cost:
-                        category_key = activity.category.lower()
-                        if category_key in spent_by_category:
-                            spent_by_category[category_key] += activity.estimated_cost
+        costs = await self.itinerary_repository.activity_costs_by_category(budget.trip_id)
+        for category, cost in costs.items():
+            category_key = category.lower()
+            if category_key in spent_by_category:
+                spent_by_category[category_key] += cost
         
         budget.spent_accommodation = spent_by_category['accommodation']
         budget.spent_transportation = spent_by_category['transportation']
@@ -106,7 +97,8 @@ class BudgetService:
         if budget_data.other is not None:
             budget.other = budget_data.other
         
-        updated_budget = await self.repository.update(budget)
+        async with self.uow.transaction():
+            updated_budget = await self.repository.update(budget)
         await self._compute_spent_amounts(updated_budget)
         return updated_budget
     
@@ -119,5 +111,6 @@ class BudgetService:
         if not trip or trip.user_id != user_id:
             return False
         
-        await self.repository.delete(budget)
+        async with self.uow.transaction():
+            await self.repository.delete(budget)
         return True
@@ -1,5 +1,6 @@
 from typing import Optional, List
 from sqlalchemy.ext.asyncio import AsyncSession
+from app.database import get_uow
 from app.repositories.itinerary_repository import ItineraryRepository
 from app.repositories.trip_repository import TripRepository
 from app.repositories.city_repository import CityRepository
@@ -15,6 +16,7 @@ class ItineraryService:
         self.trip_repository = TripRepository(db)
         self.city_repository = CityRepository(db)
         self.activity_repository = ActivityRepository(db)
+        self.uow = get_uow(db)
     
     async def create_day(self, user_id: str, day_data: ItineraryDayCreate) -> ItineraryDay:
         trip = await self.trip_repository.get_by_id(day_data.trip_id)
@@ -25,13 +27,14 @@ class ItineraryService:
         if not city:
             raise ValueError("City not found")
         
-        return await self.repository.create_day(
-            trip_id=day_data.trip_id,
-            city_id=day_data.city_id,
-            day_number=day_data.day_number,
-            date=day_data.date,
-            notes=day_data.notes
-        )
+        async with self.uow.transaction():
+            return await self.repository.create_day(
+                trip_id=day_data.trip_id,
+                city_id=day_data.city_id,
+                day_number=day_data.day_number,
+                date=day_data.date,
+                notes=day_data.notes
+            )
     
     async def get_day_by_id(self, day_id: str, user_id: str) -> Optional[ItineraryDay]:
         day = await self.repository.get_day_by_id(day_id)
@@ -44,12 +47,13 @@ class ItineraryService:
         
         return day
     
-    async def get_days_by_trip(self, trip_id: str, user_id: str) -> List[ItineraryDay]:
+    async def get_days_by_trip(self, trip_id: str, user_id: str,
+                               fields: Optional[List[str]] = None) -> List[ItineraryDay]:
         trip = await self.trip_repository.get_by_id(trip_id)
         if not trip or trip.user_id != user_id:
             raise ValueError("Trip not found or access denied")
         
-        return await self.repository.get_days_by_trip(trip_id)
+        return await self.repository.get_days_by_trip(trip_id, fields)
     
     async def update_day(self, day_id: str, user_id: str, day_data: ItineraryDayUpdate) -> Optional[ItineraryDay]:
         day = await self.repository.get_day_by_id(day_id)
@@ -71,7 +75,8 @@ class ItineraryService:
         if day_data.notes is not None:
             day.notes = day_data.notes
         
-        return await self.repository.update_day(day)
+        async with self.uow.transaction():
+            return await self.repository.update_day(day)
     
     async def delete_day(self, day_id: str, user_id: str) -> bool:
         day = await self.repository.get_day_by_id(day_id)
@@ -82,7 +87,8 @@ class ItineraryService:
         if not trip or trip.user_id != user_id:
             return False
         
-        await self.repository.delete_day(day)
+        async with self.uow.transaction():
+            await self.repository.delete_day(day)
         return True
     
     async def create_item(self, user_id: str, item_data: ItineraryItemCreate) -> ItineraryItem:
@@ -99,15 +105,16 @@ class ItineraryService:
             if not activity:
                 raise ValueError("Activity not found")
         
-        return await self.repository.create_item(
-            itinerary_day_id=item_data.itinerary_day_id,
-            activity_id=item_data.activity_id,
-            order_index=item_data.order_index,
-            start_time=item_data.start_time,
-            end_time=item_data.end_time,
-            custom_title=item_data.custom_title,
-            custom_notes=item_data.custom_notes
-        )
+        async with self.uow.transaction():
+            return await self.repository.create_item(
+                itinerary_day_id=item_data.itinerary_day_id,
+                activity_id=item_data.activity_id,
+                order_index=item_data.order_index,
+                start_time=item_data.start_time,
+                end_time=item_data.end_time,
+                custom_title=item_data.custom_title,
+                custom_notes=item_data.custom_notes
+            )
     
     async def get_item_by_id(self, item_id: str, user_id: str) -> Optional[ItineraryItem]:
         item = await self.repository.get_item_by_id(item_id)
@@ -124,7 +131,8 @@ class ItineraryService:
         
         return item
     
-    async def get_items_by_day(self, day_id: str, user_id: str) -> List[ItineraryItem]:
+    async def get_items_by_day(self, day_id: str, user_id: str,
+                               fields: Optional[List[str]] = None) -> List[ItineraryItem]:
         day = await self.repository.get_day_by_id(day_id)
         if not day:
             raise ValueError("Itinerary day not found")
@@ -133,7 +141,7 @@ class ItineraryService:
         if not trip or trip.user_id != user_id:
             raise ValueError("Access denied")
         
-        return await self.repository.get_items_by_day(day_id)
+        return await self.repository.get_items_by_day(day_id, fields)
     
     async def update_item(self, item_id: str, user_id: str, item_data: ItineraryItemUpdate) -> Optional[ItineraryItem]:
         item = await self.repository.get_item_by_id(item_id)
@@ -166,7 +174,8 @@ class ItineraryService:
         if item_data.custom_notes is not None:
             item.custom_notes = item_data.custom_notes
         
-        return await self.repository.update_item(item)
+        async with self.uow.transaction():
+            return await self.repository.update_item(item)
     
     async def delete_item(self, item_id: str, user_id: str) -> bool:
         item = await self.repository.get_item_by_id(item_id)
@@ -181,5 +190,6 @@ class ItineraryService:
         if not trip or trip.user_id != user_id:
             return False
         
-        await self.repository.delete_item(item)
+        async with self.uow.transaction():
+            await self.repository.delete_item(item)
         return True
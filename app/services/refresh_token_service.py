@@ -0,0 +1,84 @@
+import asyncio
+import uuid
+from datetime import datetime, timedelta, timezone
+from typing import Optional
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.config import settings
+from app.database import AsyncSessionLocal, get_uow
+from app.repositories.refresh_token_repository import RefreshTokenRepository
+from app.utils import create_access_token, create_refresh_token, verify_refresh_token, hash_token
+from app.utils.logger import logger
+
+
+class RefreshTokenService:
+    def __init__(self, db: AsyncSession):
+        self.repository = RefreshTokenRepository(db)
+        self.uow = get_uow(db)
+    
+    async def issue_tokens(self, payload: dict, family_id: Optional[str] = None) -> dict:
+        access_token = create_access_token(payload)
+        expires_delta = timedelta(days=settings.REFRESH_TOKEN_EXPIRE_DAYS)
+        refresh_token = create_refresh_token({**payload, "jti": uuid.uuid4().hex}, expires_delta)
+        
+        async with self.uow.transaction():
+            await self.repository.create(
+                token_hash=hash_token(refresh_token),
+                user_id=payload["user_id"],
+                family_id=family_id or uuid.uuid4().hex,
+                expires_at=datetime.now(timezone.utc) + expires_delta
+            )
+        
+        return {
+            "access_token": access_token,
+            "refresh_token": refresh_token
+        }
+    
+    async def rotate(self, refresh_token: str) -> Optional[dict]:
+        claims = verify_refresh_token(refresh_token)
+        if not claims.get("user_id"):
+            return None
+        
+        token_hash = hash_token(refresh_token)
+        async with self.uow.transaction():
+            family_id = await self.repository.claim(token_hash)
+            if family_id is None:
+                existing = await self.repository.get_by_hash(token_hash)
+                if existing and existing.used_at is not None:
+                    logger.warning(f"Refresh token reuse detected, revoking family {existing.family_id}")
+                    await self.repository.revoke_family(existing.family_id)
+                    await self.uow.commit()
+                return None
+            
+            payload = {
+                "user_id": claims["user_id"],
+                "email": claims.get("email"),
+                "role": claims.get("role")
+            }
+            return await self.issue_tokens(payload, family_id)
+    
+    async def revoke_user_tokens(self, user_id: str) -> None:
+        async with self.uow.transaction():
+            await self.repository.revoke_user(user_id)
+    
+    async def purge_expired(self, batch_size: int) -> int:
+        purged = 0
+        while True:
+            async with self.uow.transaction():
+                deleted = await self.repository.purge_expired(batch_size)
+            await self.uow.commit()
+            purged += deleted
+            if deleted < batch_size:
+                return purged
+            await asyncio.sleep(0)
+
+
+async def run_refresh_token_purger(interval_seconds: int, batch_size: int) -> None:
+    while True:
+        try:
+            async with AsyncSessionLocal() as session:
+                purged = await RefreshTokenService(session).purge_expired(batch_size)
+            if purged:
+                logger.info(f"Purged {purged} expired refresh tokens")
+        except Exception as e:
+            logger.error(f"Refresh token purge error: {str(e)}")
+        await asyncio.sleep(interval_seconds)
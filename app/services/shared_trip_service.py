@@ -1,5 +1,6 @@
 from typing import Optional
 from sqlalchemy.ext.asyncio import AsyncSession
+from app.database import get_uow
 from datetime import datetime
 import secrets
 from app.repositories.shared_trip_repository import SharedTripRepository
@@ -17,6 +18,7 @@ class SharedTripService:
         self.trip_repository = TripRepository(db)
         self.budget_repository = BudgetRepository(db)
         self.itinerary_repository = ItineraryRepository(db)
+        self.uow = get_uow(db)
         self.db = db
     
     def generate_share_token(self) -> str:
@@ -29,12 +31,13 @@ class SharedTripService:
         
         share_token = self.generate_share_token()
         
-        return await self.repository.create(
-            trip_id=shared_trip_data.trip_id,
-            user_id=user_id,
-            share_token=share_token,
-            expires_at=shared_trip_data.expires_at
-        )
+        async with self.uow.transaction():
+            return await self.repository.create(
+                trip_id=shared_trip_data.trip_id,
+                user_id=user_id,
+                share_token=share_token,
+                expires_at=shared_trip_data.expires_at
+            )
     
     async def get_shared_trip_by_token(self, share_token: str) -> Optional[tuple[SharedTrip, Trip]]:
         shared_trip = await self.repository.get_by_token(share_token)
@@ -63,5 +66,6 @@ class SharedTripService:
         if not trip or trip.user_id != user_id:
             return False
         
-        await self.repository.delete(shared_trip)
+        async with self.uow.transaction():
+            await self.repository.delete(shared_trip)
         return True
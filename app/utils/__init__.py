@@ -1,15 +1,23 @@
-from app.utils.password import hash_password, verify_password
-from app.utils.auth import create_access_token, create_refresh_token, verify_access_token, verify_refresh_token
+from app.utils.password import hash_password, verify_password, password_hasher, PasswordHasherBusyError
+from app.utils.auth import (
+    create_access_token, create_refresh_token, verify_access_token, verify_refresh_token,
+    verify_access_token_cached, access_token_cache, hash_token
+)
 from app.utils.logger import logger
 from app.utils.response import ApiResponse
 
 __all__ = [
     "hash_password",
     "verify_password",
+    "password_hasher",
+    "PasswordHasherBusyError",
     "create_access_token",
     "create_refresh_token",
     "verify_access_token",
     "verify_refresh_token",
+    "verify_access_token_cached",
+    "access_token_cache",
+    "hash_token",
     "logger",
     "ApiResponse",
 ]
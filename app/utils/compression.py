@@ -0,0 +1,193 @@
+import asyncio
+import gzip
+import hashlib
+import threading
+import zlib
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Callable, Dict, Optional
+from app.config import settings
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
+_current: ContextVar[Optional["ResponseCompression"]] = ContextVar("response_compression", default=None)
+
+
+class GzipStream:
+    def __init__(self, level: int):
+        self._compressor = zlib.compressobj(level, zlib.DEFLATED, 31)
+
+    def compress(self, data: bytes) -> bytes:
+        return self._compressor.compress(data) + self._compressor.flush(zlib.Z_SYNC_FLUSH)
+
+    def finish(self) -> bytes:
+        return self._compressor.flush(zlib.Z_FINISH)
+
+
+class BrotliStream:
+    def __init__(self, quality: int):
+        self._compressor = brotli.Compressor(quality=quality)
+
+    def compress(self, data: bytes) -> bytes:
+        return self._compressor.process(data) + self._compressor.flush()
+
+    def finish(self) -> bytes:
+        return self._compressor.finish()
+
+
+class ZstdStream:
+    def __init__(self, level: int):
+        self._compressor = zstandard.ZstdCompressor(level=level).compressobj()
+
+    def compress(self, data: bytes) -> bytes:
+        return self._compressor.compress(data) + self._compressor.flush(zstandard.COMPRESSOBJ_FLUSH_BLOCK)
+
+    def finish(self) -> bytes:
+        return self._compressor.flush(zstandard.COMPRESSOBJ_FLUSH_FINISH)
+
+
+def _codecs() -> Dict[str, tuple]:
+    codecs = {}
+    if zstandard is not None:
+        level = settings.COMPRESSION_ZSTD_LEVEL
+        compressor = zstandard.ZstdCompressor(level=level)
+        codecs["zstd"] = (lambda data: compressor.compress(data), lambda: ZstdStream(level))
+    if brotli is not None:
+        quality = settings.COMPRESSION_BROTLI_QUALITY
+        codecs["br"] = (lambda data: brotli.compress(data, quality=quality), lambda: BrotliStream(quality))
+    level = settings.COMPRESSION_GZIP_LEVEL
+    codecs["gzip"] = (lambda data: gzip.compress(data, compresslevel=level, mtime=0), lambda: GzipStream(level))
+    return codecs
+
+
+CODECS = _codecs()
+
+
+def negotiate(accept_encoding: str) -> Optional[str]:
+    weights = {}
+    for part in accept_encoding.split(","):
+        name, _, params = part.strip().partition(";")
+        name = name.strip().lower()
+        if not name:
+            continue
+        quality = 1.0
+        for param in params.split(";"):
+            key, _, value = param.strip().partition("=")
+            if key == "q":
+                try:
+                    quality = float(value)
+                except ValueError:
+                    quality = 0.0
+        weights[name] = quality
+
+    best, best_quality = None, 0.0
+    for name in CODECS:
+        quality = weights.get(name, weights.get("*", 0.0))
+        if quality > best_quality:
+            best, best_quality = name, quality
+    return best
+
+
+class CompressedBodyCache:
+    def __init__(self, max_bytes: int):
+        self.max_bytes = max_bytes
+        self.entries: OrderedDict = OrderedDict()
+        self.size = 0
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+
+    def key(self, encoding: str, body: bytes) -> tuple:
+        return encoding, hashlib.blake2b(body, digest_size=16).digest()
+
+    def get(self, key: tuple) -> Optional[bytes]:
+        with self._lock:
+            compressed = self.entries.get(key)
+            if compressed is None:
+                self.misses += 1
+                return None
+            self.entries.move_to_end(key)
+            self.hits += 1
+            return compressed
+
+    def put(self, key: tuple, compressed: bytes) -> None:
+        if len(compressed) > self.max_bytes:
+            return
+        with self._lock:
+            previous = self.entries.pop(key, None)
+            if previous is not None:
+                self.size -= len(previous)
+            self.entries[key] = compressed
+            self.size += len(compressed)
+            while self.size > self.max_bytes:
+                _, evicted = self.entries.popitem(last=False)
+                self.size -= len(evicted)
+
+    def stats(self) -> dict:
+        return {
+            "entries": len(self.entries),
+            "bytes": self.size,
+            "max_bytes": self.max_bytes,
+            "hits": self.hits,
+            "misses": self.misses,
+        }
+
+
+class ResponseCompression:
+    def __init__(self):
+        self.cacheable = False
+
+
+class ResponseCompressor:
+    def __init__(self, workers: int, offload_threshold: int, cache: CompressedBodyCache):
+        self.offload_threshold = offload_threshold
+        self.cache = cache
+        self._executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="response-compressor")
+
+    async def run(self, func: Callable, data: bytes) -> bytes:
+        if len(data) < self.offload_threshold:
+            return func(data)
+        return await asyncio.get_running_loop().run_in_executor(self._executor, func, data)
+
+    async def compress(self, encoding: str, body: bytes, cacheable: bool = False) -> bytes:
+        if not cacheable or self.cache.max_bytes <= 0:
+            return await self.run(CODECS[encoding][0], body)
+        key = self.cache.key(encoding, body)
+        compressed = self.cache.get(key)
+        if compressed is None:
+            compressed = await self.run(CODECS[encoding][0], body)
+            self.cache.put(key, compressed)
+        return compressed
+
+    def stream(self, encoding: str):
+        return CODECS[encoding][1]()
+
+
+response_compressor = ResponseCompressor(
+    workers=settings.COMPRESSION_WORKERS,
+    offload_threshold=settings.COMPRESSION_OFFLOAD_BYTES,
+    cache=CompressedBodyCache(settings.COMPRESSION_CACHE_BYTES)
+)
+
+
+def current_compression() -> Optional[ResponseCompression]:
+    return _current.get()
+
+
+@contextmanager
+def track_compression(state: ResponseCompression):
+    token = _current.set(state)
+    try:
+        yield state
+    finally:
+        _current.reset(token)
@@ -0,0 +1,108 @@
+import hashlib
+import hmac
+import time
+from collections import OrderedDict
+from typing import List, Optional
+
+
+class ReplicaRouter:
+    def __init__(self, primary, replicas: List, policy: str = "round_robin", retry_seconds: float = 30.0):
+        if policy not in ("round_robin", "least_loaded"):
+            raise ValueError(f"Unknown replica policy: {policy}")
+        self.primary = primary
+        self.replicas = list(replicas)
+        self.policy = policy
+        self.retry_seconds = retry_seconds
+        self._next = 0
+        self._down_until = {}
+        self.routed = {"replica": 0, "primary": 0, "fallback": 0}
+
+    def _healthy(self) -> List:
+        now = time.monotonic()
+        return [replica for replica in self.replicas if self._down_until.get(id(replica), 0.0) <= now]
+
+    def _load(self, replica) -> int:
+        checkedout = getattr(replica.pool, "checkedout", None)
+        return checkedout() if checkedout else 0
+
+    def pick(self):
+        healthy = self._healthy()
+        if not healthy:
+            return self.primary
+        if self.policy == "least_loaded":
+            return min(healthy, key=self._load)
+        replica = healthy[self._next % len(healthy)]
+        self._next += 1
+        return replica
+
+    def candidates(self, pin_primary: bool = False) -> List:
+        if pin_primary or not self.replicas:
+            self.routed["primary"] += 1
+            return [self.primary]
+        replica = self.pick()
+        if replica is self.primary:
+            self.routed["fallback"] += 1
+            return [self.primary]
+        self.routed["replica"] += 1
+        return [replica, self.primary]
+
+    def mark_down(self, replica) -> None:
+        self._down_until[id(replica)] = time.monotonic() + self.retry_seconds
+        self.routed["fallback"] += 1
+
+    def stats(self) -> dict:
+        return {
+            "policy": self.policy,
+            "replicas": len(self.replicas),
+            "healthy": len(self._healthy()),
+            **self.routed,
+        }
+
+
+class RecentWriters:
+    def __init__(self, window_seconds: float, max_keys: int):
+        self.window_seconds = window_seconds
+        self.max_keys = max_keys
+        self._until: OrderedDict = OrderedDict()
+
+    def mark(self, key: Optional[str]) -> None:
+        if not key or self.window_seconds <= 0:
+            return
+        self._until[key] = time.monotonic() + self.window_seconds
+        self._until.move_to_end(key)
+        while len(self._until) > self.max_keys:
+            self._until.popitem(last=False)
+
+    def is_recent(self, key: Optional[str]) -> bool:
+        if not key:
+            return False
+        until = self._until.get(key)
+        if until is None:
+            return False
+        if until <= time.monotonic():
+            del self._until[key]
+            return False
+        return True
+
+
+class WriteMarker:
+    def __init__(self, secret: str, window_seconds: float):
+        self.secret = secret.encode()
+        self.window_seconds = window_seconds
+
+    def _sign(self, key: str, until: int) -> str:
+        return hmac.new(self.secret, f"{key}:{until}".encode(), hashlib.sha256).hexdigest()[:32]
+
+    def issue(self, key: Optional[str]) -> Optional[str]:
+        if not key or self.window_seconds <= 0:
+            return None
+        until = int(time.time() + self.window_seconds) + 1
+        return f"{until}.{self._sign(key, until)}"
+
+    def is_recent(self, marker: Optional[str], key: Optional[str]) -> bool:
+        if not marker or not key:
+            return False
+        until, _, signature = marker.partition(".")
+        if not until.isdigit() or int(until) <= time.time():
+            return False
+        return hmac.compare_digest(signature, self._sign(key, int(until)))
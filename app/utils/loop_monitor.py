@@ -0,0 +1,88 @@
+import asyncio
+import sys
+import threading
+import time
+import traceback
+from typing import Optional
+from app.utils.logger import logger
+from app.utils.metrics import event_loop_lag, event_loop_lag_max, event_loop_stalls
+
+_IGNORED_FRAMES = ("/app/utils/loop_monitor.py",)
+
+
+def _app_frame(filename: str) -> bool:
+    return "/app/" in filename and not any(ignored in filename for ignored in _IGNORED_FRAMES)
+
+
+def blocking_site(frame, depth: int = 3) -> str:
+    stack = traceback.extract_stack(frame)
+    sites = []
+    app_sites = 0
+    for index, entry in enumerate(reversed(stack)):
+        filename = entry.filename.replace("\\", "/")
+        if _app_frame(filename):
+            sites.append(f"{filename[filename.rindex('/app/') + 1:]}:{entry.lineno} in {entry.name}")
+            app_sites += 1
+        elif index == 0:
+            sites.append(f"{filename}:{entry.lineno} in {entry.name}")
+        if app_sites == depth:
+            break
+    return " <- ".join(sites) or "unknown"
+
+
+class LoopLagMonitor:
+    def __init__(self, interval: float, threshold: float, window: float, capture_stacks: bool = False):
+        self.interval = interval
+        self.threshold = threshold
+        self.window = window
+        self.capture_stacks = capture_stacks
+        self.stalls = 0
+        self.worst = 0.0
+        self.last_tick = time.monotonic()
+        self._window_started = self.last_tick
+        self._reported_tick: Optional[float] = None
+        self._loop_thread: Optional[int] = None
+        self._stopped = threading.Event()
+
+    async def run(self) -> None:
+        self._loop_thread = threading.get_ident()
+        self._stopped.clear()
+        if self.capture_stacks:
+            threading.Thread(target=self._watch, name="loop-watchdog", daemon=True).start()
+        try:
+            while True:
+                started = time.monotonic()
+                self.last_tick = started
+                await asyncio.sleep(self.interval)
+                self.record(max(time.monotonic() - started - self.interval, 0.0))
+        finally:
+            self._stopped.set()
+
+    def record(self, lag: float) -> None:
+        now = time.monotonic()
+        if now - self._window_started >= self.window:
+            self._window_started = now
+            self.worst = 0.0
+        self.worst = max(self.worst, lag)
+        event_loop_lag.observe(lag)
+        event_loop_lag_max.set(self.worst)
+        if lag >= self.threshold:
+            self.stalls += 1
+            event_loop_stalls.inc()
+            logger.warning(f"Event loop lagged {lag * 1000:.0f}ms")
+
+    def stats(self) -> dict:
+        return {"stalls": self.stalls, "worst_ms": round(self.worst * 1000, 3)}
+
+    def _watch(self) -> None:
+        while not self._stopped.wait(self.threshold / 2):
+            tick = self.last_tick
+            stalled = time.monotonic() - tick - self.interval
+            if stalled < self.threshold or tick == self._reported_tick:
+                continue
+            frame = sys._current_frames().get(self._loop_thread)
+            if frame is None:
+                continue
+            self._reported_tick = tick
+            stack = "".join(traceback.format_stack(frame))
+            logger.warning(f"Event loop blocked for over {stalled * 1000:.0f}ms in {blocking_site(frame)}\n{stack}")
@@ -0,0 +1,150 @@
+import asyncio
+import os
+from typing import Dict, Optional
+from app.config import settings
+from app.utils.logger import logger, queue_handler
+
+if settings.PROMETHEUS_MULTIPROC_DIR:
+    os.environ.setdefault("PROMETHEUS_MULTIPROC_DIR", settings.PROMETHEUS_MULTIPROC_DIR)
+
+from prometheus_client import CONTENT_TYPE_LATEST, REGISTRY, CollectorRegistry, Counter, Gauge, Histogram, generate_latest
+from prometheus_client import multiprocess
+
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+STATEMENT_BUCKETS = (0, 1, 2, 3, 5, 8, 13, 21, 34, 55, 89)
+LAG_BUCKETS = (0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0)
+
+http_requests = Counter("http_requests_total", "HTTP responses by route and status", ["method", "route", "status"])
+http_request_duration = Histogram(
+    "http_request_duration_seconds", "Time to the last response byte", ["method", "route"], buckets=LATENCY_BUCKETS
+)
+http_requests_in_flight = Gauge(
+    "http_requests_in_flight", "Requests being served", ["method"], multiprocess_mode="livesum"
+)
+
+db_statements = Counter("db_statements_total", "SQL statements executed", ["method", "route"])
+db_time = Counter("db_time_seconds_total", "Time spent executing SQL statements", ["method", "route"])
+db_statements_per_request = Histogram(
+    "db_statements_per_request", "SQL statements per request", ["method", "route"], buckets=STATEMENT_BUCKETS
+)
+
+db_pool_connections = Gauge(
+    "db_pool_connections", "Pool connections by state", ["pool", "state"], multiprocess_mode="livesum"
+)
+db_pool_checkouts = Counter("db_pool_checkouts_total", "Connections handed out by the pool", ["pool"])
+db_pool_timeouts = Counter("db_pool_timeouts_total", "Checkouts that gave up waiting for a connection", ["pool"])
+
+cache_lookups = Counter("cache_lookups_total", "Cache lookups by result", ["cache", "result"])
+
+password_hash_pending = Gauge(
+    "password_hash_pending", "Password hashing jobs queued or running", multiprocess_mode="livesum"
+)
+password_hash_queued = Gauge(
+    "password_hash_queued", "Password hashing jobs waiting for a worker", multiprocess_mode="livesum"
+)
+password_hash_rejected = Counter("password_hash_rejected_total", "Password hashing jobs rejected as busy")
+
+event_loop_lag = Histogram("event_loop_lag_seconds", "Event-loop scheduling delay", buckets=LAG_BUCKETS)
+event_loop_lag_max = Gauge(
+    "event_loop_lag_max_seconds", "Worst event-loop delay in the current window", multiprocess_mode="livemax"
+)
+event_loop_stalls = Counter("event_loop_stalls_total", "Event-loop delays over LOOP_LAG_THRESHOLD_MS")
+
+log_records_dropped = Counter("log_records_dropped_total", "Log records dropped because the log queue was full")
+
+_children: Dict[tuple, object] = {}
+
+
+def _child(metric, *labels):
+    key = (metric, labels)
+    child = _children.get(key)
+    if child is None:
+        child = _children[key] = metric.labels(*labels)
+    return child
+
+
+def requests_in_flight(method: str):
+    return _child(http_requests_in_flight, method)
+
+
+def record_request(method: str, route: str, status: int, seconds: float) -> None:
+    _child(http_requests, method, route, str(status)).inc()
+    _child(http_request_duration, method, route).observe(seconds)
+
+
+def record_db_usage(method: str, route: str, statements: int, seconds: float) -> None:
+    _child(db_statements_per_request, method, route).observe(statements)
+    if statements:
+        _child(db_statements, method, route).inc(statements)
+        _child(db_time, method, route).inc(seconds)
+
+
+class CounterSampler:
+    def __init__(self):
+        self._last: Dict[tuple, float] = {}
+
+    def advance(self, counter, total: float, *labels) -> None:
+        key = (counter, labels)
+        delta = total - self._last.get(key, 0)
+        self._last[key] = total
+        if delta > 0:
+            (_child(counter, *labels) if labels else counter).inc(delta)
+
+
+def _sample(sampler: CounterSampler) -> None:
+    from app.database import engine, replica_engines
+    from app.utils.auth import access_token_cache
+    from app.utils.compression import response_compressor
+    from app.utils.db_pool import MonitoredQueuePool
+    from app.utils.password import password_hasher
+
+    pools = [("primary", engine), *((f"replica{index}", replica) for index, replica in enumerate(replica_engines))]
+    for name, target in pools:
+        pool = target.pool
+        if not isinstance(pool, MonitoredQueuePool):
+            continue
+        stats = pool.stats()
+        for state in ("checked_out", "checked_in", "overflow", "waiting"):
+            _child(db_pool_connections, name, state).set(stats[state])
+        _child(db_pool_connections, name, "size").set(stats["size"])
+        sampler.advance(db_pool_checkouts, stats["checkouts"], name)
+        sampler.advance(db_pool_timeouts, stats["timeouts"], name)
+
+    for name, cache in [("access_token", access_token_cache), ("compressed_body", response_compressor.cache)]:
+        stats = cache.stats()
+        sampler.advance(cache_lookups, stats["hits"], name, "hit")
+        sampler.advance(cache_lookups, stats["misses"], name, "miss")
+
+    hasher = password_hasher.stats()
+    password_hash_pending.set(hasher["pending"])
+    password_hash_queued.set(hasher["queued"])
+    sampler.advance(password_hash_rejected, hasher["rejected"])
+
+    sampler.advance(log_records_dropped, queue_handler.dropped)
+
+
+async def run_metrics_sampler(interval: float) -> None:
+    sampler = CounterSampler()
+    while True:
+        await asyncio.sleep(interval)
+        try:
+            _sample(sampler)
+        except Exception as e:
+            logger.warning(f"Metrics sampling failed: {str(e)}")
+
+
+def render_metrics() -> bytes:
+    if "PROMETHEUS_MULTIPROC_DIR" not in os.environ:
+        return generate_latest(REGISTRY)
+    registry = CollectorRegistry()
+    multiprocess.MultiProcessCollector(registry)
+    return generate_latest(registry)
+
+
+def mark_worker_dead(pid: Optional[int] = None) -> None:
+    if "PROMETHEUS_MULTIPROC_DIR" in os.environ:
+        multiprocess.mark_process_dead(pid or os.getpid())
+
+
+def route_label(scope) -> str:
+    return getattr(scope.get("route"), "path", "unmatched")
@@ -1,4 +1,10 @@
+import asyncio
+import threading
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from passlib.context import CryptContext
+from app.config import settings
 
 pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
 
@@ -9,3 +15,67 @@ def hash_password(password: str) -> str:
 
 def verify_password(plain_password: str, hashed_password: str) -> bool:
     return pwd_context.verify(plain_password, hashed_password)
+
+
+class PasswordHasherBusyError(Exception):
+    pass
+
+
+class PasswordHasher:
+    def __init__(self, max_workers: int, max_queue: int, latency_window: int = 1024):
+        self.max_workers = max_workers
+        self.max_pending = max_workers + max_queue
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="password-hasher")
+        self._lock = threading.Lock()
+        self._pending = 0
+        self._calls = 0
+        self._rejected = 0
+        self._total_seconds = 0.0
+        self._latencies = deque(maxlen=latency_window)
+
+    async def hash(self, password: str) -> str:
+        return await self._submit(hash_password, password)
+
+    async def verify(self, plain_password: str, hashed_password: str) -> bool:
+        return await self._submit(verify_password, plain_password, hashed_password)
+
+    async def _submit(self, func, *args):
+        with self._lock:
+            if self._pending >= self.max_pending:
+                self._rejected += 1
+                raise PasswordHasherBusyError("Password hashing queue is full")
+            self._pending += 1
+
+        started = time.perf_counter()
+        try:
+            return await asyncio.get_running_loop().run_in_executor(self._executor, func, *args)
+        finally:
+            elapsed = time.perf_counter() - started
+            with self._lock:
+                self._pending -= 1
+                self._calls += 1
+                self._total_seconds += elapsed
+                self._latencies.append(elapsed)
+
+    def stats(self) -> dict:
+        with self._lock:
+            latencies = sorted(self._latencies)
+            calls = self._calls
+            stats = {
+                "workers": self.max_workers,
+                "pending": self._pending,
+                "queued": max(self._pending - self.max_workers, 0),
+                "max_pending": self.max_pending,
+                "calls": calls,
+                "rejected": self._rejected,
+                "avg_ms": (self._total_seconds / calls * 1000) if calls else 0.0,
+            }
+        for name, quantile in (("p50_ms", 0.50), ("p99_ms", 0.99)):
+            stats[name] = latencies[min(int(len(latencies) * quantile), len(latencies) - 1)] * 1000 if latencies else 0.0
+        return stats
+
+
+password_hasher = PasswordHasher(
+    max_workers=settings.PASSWORD_HASH_WORKERS,
+    max_queue=settings.PASSWORD_HASH_QUEUE_SIZE
+)
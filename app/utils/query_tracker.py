@@ -0,0 +1,129 @@
+import re
+import time
+import traceback
+from collections import Counter
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import List, Optional, Tuple
+import greenlet
+from sqlalchemy import event
+
+_PLACEHOLDER_LIST = re.compile(r"\(\s*(?:\?|\$\d+|%\(\w+\)s|:\w+)(?:\s*,\s*(?:\?|\$\d+|%\(\w+\)s|:\w+))*\s*\)")
+_WHITESPACE = re.compile(r"\s+")
+_SELECT_LIST = re.compile(r"^SELECT .+? FROM ", re.IGNORECASE)
+_IGNORED_FRAMES = ("/app/utils/", "/app/database.py")
+
+_current: ContextVar[Optional["QueryStats"]] = ContextVar("query_stats", default=None)
+
+
+class QueryBudgetExceeded(Exception):
+    pass
+
+
+def statement_shape(statement: str) -> str:
+    return _PLACEHOLDER_LIST.sub("(?)", _WHITESPACE.sub(" ", statement).strip())
+
+
+def abbreviate(shape: str, length: int = 200) -> str:
+    return _SELECT_LIST.sub("SELECT ... FROM ", shape)[:length]
+
+
+def call_site(depth: int = 3) -> str:
+    frames = traceback.extract_stack()
+    parent = greenlet.getcurrent().parent
+    if parent is not None and parent.gr_frame is not None:
+        frames = traceback.extract_stack(parent.gr_frame) + frames
+
+    sites = []
+    for frame in reversed(frames):
+        filename = frame.filename.replace("\\", "/")
+        if "/app/" not in filename or any(ignored in filename for ignored in _IGNORED_FRAMES):
+            continue
+        sites.append(f"{filename[filename.rindex('/app/') + 1:]}:{frame.lineno} in {frame.name}")
+        if len(sites) == depth:
+            break
+    return " <- ".join(sites) or "unknown"
+
+
+class QueryStats:
+    def __init__(self, route: str, budget: int, strict: bool = False, n_plus_one_threshold: int = 5):
+        self.route = route
+        self.budget = budget
+        self.strict = strict
+        self.n_plus_one_threshold = n_plus_one_threshold
+        self.count = 0
+        self.db_time = 0.0
+        self.shapes: Counter = Counter()
+        self.call_sites = {}
+        self.over_budget_at: Optional[str] = None
+
+    def record(self, statement: str) -> None:
+        self.count += 1
+        shape = statement_shape(statement)
+        self.shapes[shape] += 1
+        if self.shapes[shape] == self.n_plus_one_threshold:
+            self.call_sites[shape] = call_site()
+
+        if self.budget and self.count == self.budget + 1:
+            self.over_budget_at = call_site()
+            if self.strict:
+                raise QueryBudgetExceeded(
+                    f"{self.route} exceeded its budget of {self.budget} statements at {self.over_budget_at}"
+                )
+
+    @property
+    def over_budget(self) -> bool:
+        return bool(self.budget) and self.count > self.budget
+
+    def repeated(self) -> List[Tuple[str, int, str]]:
+        return [
+            (shape, count, self.call_sites[shape])
+            for shape, count in self.shapes.most_common()
+            if count >= self.n_plus_one_threshold
+        ]
+
+
+def current_query_stats() -> Optional[QueryStats]:
+    return _current.get()
+
+
+@contextmanager
+def track_queries(stats: QueryStats):
+    token = _current.set(stats)
+    try:
+        yield stats
+    finally:
+        _current.reset(token)
+
+
+def _tracked(context) -> bool:
+    return context is None or context.execution_options.get("track_queries", True)
+
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    stats = _current.get()
+    if stats is None or not _tracked(context):
+        return
+    stats.record(statement)
+    conn.info.setdefault("query_started", []).append(time.perf_counter())
+
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    stats = _current.get()
+    started = conn.info.get("query_started")
+    if stats is None or not started or not _tracked(context):
+        return
+    stats.db_time += time.perf_counter() - started.pop()
+
+
+def _handle_error(context):
+    started = context.connection.info.get("query_started") if context.connection is not None else None
+    if started:
+        started.pop()
+
+
+def install_query_tracking(engine) -> None:
+    target = engine.sync_engine
+    event.listen(target, "before_cursor_execute", _before_cursor_execute)
+    event.listen(target, "after_cursor_execute", _after_cursor_execute)
+    event.listen(target, "handle_error", _handle_error)
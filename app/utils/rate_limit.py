@@ -0,0 +1,90 @@
+import math
+import time
+from collections import OrderedDict
+from typing import Optional
+from app.config import settings
+
+
+class InMemoryRateLimitBackend:
+    def __init__(self, max_keys: int):
+        self.max_keys = max_keys
+        self._buckets: OrderedDict = OrderedDict()
+
+    async def hit(self, key: str, limit: int, window_seconds: int) -> Optional[float]:
+        now = time.monotonic()
+        rate = limit / window_seconds
+        tokens, updated_at = self._buckets.get(key, (float(limit), now))
+        tokens = min(float(limit), tokens + (now - updated_at) * rate)
+
+        if tokens < 1.0:
+            self._buckets[key] = (tokens, now)
+            self._buckets.move_to_end(key)
+            return (1.0 - tokens) / rate
+
+        self._buckets[key] = (tokens - 1.0, now)
+        self._buckets.move_to_end(key)
+        while len(self._buckets) > self.max_keys:
+            self._buckets.popitem(last=False)
+        return None
+
+
+class RedisRateLimitBackend:
+    def __init__(self, url: str, prefix: str = "ratelimit"):
+        try:
+            from redis import asyncio as redis
+        except ImportError as e:
+            raise RuntimeError("RATE_LIMIT_REDIS_URL is set but the redis package is not installed") from e
+        self.client = redis.from_url(url)
+        self.prefix = prefix
+
+    async def hit(self, key: str, limit: int, window_seconds: int) -> Optional[float]:
+        now = time.time()
+        window = int(now // window_seconds)
+        redis_key = f"{self.prefix}:{key}:{window}"
+
+        async with self.client.pipeline(transaction=True) as pipe:
+            pipe.incr(redis_key)
+            pipe.expire(redis_key, window_seconds + 1)
+            count, _ = await pipe.execute()
+
+        if count > limit:
+            return (window + 1) * window_seconds - now
+        return None
+
+
+class LoginRateLimiter:
+    def __init__(self, backend, per_ip: int, per_email: int, window_seconds: int):
+        self.backend = backend
+        self.per_ip = per_ip
+        self.per_email = per_email
+        self.window_seconds = window_seconds
+        self.allowed = 0
+        self.rejected = 0
+
+    async def check(self, ip: str, email: str) -> Optional[int]:
+        retry_after = await self.backend.hit(f"login:ip:{ip}", self.per_ip, self.window_seconds)
+        if retry_after is None:
+            retry_after = await self.backend.hit(f"login:email:{email.lower()}", self.per_email, self.window_seconds)
+
+        if retry_after is None:
+            self.allowed += 1
+            return None
+        self.rejected += 1
+        return max(1, math.ceil(retry_after))
+
+    def stats(self) -> dict:
+        return {"allowed": self.allowed, "rejected": self.rejected}
+
+
+def _build_backend():
+    if settings.RATE_LIMIT_REDIS_URL:
+        return RedisRateLimitBackend(settings.RATE_LIMIT_REDIS_URL)
+    return InMemoryRateLimitBackend(settings.RATE_LIMIT_MAX_KEYS)
+
+
+login_rate_limiter = LoginRateLimiter(
+    _build_backend(),
+    per_ip=settings.LOGIN_RATE_LIMIT_PER_IP,
+    per_email=settings.LOGIN_RATE_LIMIT_PER_EMAIL,
+    window_seconds=settings.LOGIN_RATE_LIMIT_WINDOW_SECONDS
+)
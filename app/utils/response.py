@@ -1,9 +1,49 @@
-from typing import Optional, Any
+from typing import Optional, Any, AsyncIterator
+from fastapi import status
+from fastapi.responses import Response, StreamingResponse
+from pydantic_core import to_json
+from app.config import settings
+from app.utils.logger import logger
+from app.utils.tracing import span
+
+
+class EnvelopeResponse(Response):
+    media_type = "application/json"
+    
+    def render(self, content: Any) -> bytes:
+        with span("render", "serialize"):
+            return to_json(content)
+
+
+async def _stream_envelope(items: AsyncIterator[Any], message: Optional[str]) -> AsyncIterator[bytes]:
+    chunk = bytearray(b'{"success":true,"data":[')
+    separator = b""
+    async for item in items:
+        chunk += separator
+        chunk += to_json(item)
+        separator = b","
+        if len(chunk) >= settings.STREAM_CHUNK_BYTES:
+            yield bytes(chunk)
+            chunk.clear()
+    chunk += b'],"error":null'
+    if message:
+        chunk += b',"message":' + to_json(message)
+    yield bytes(chunk + b"}")
+
+
+async def _resume_stream(first: bytes, body: AsyncIterator[bytes]) -> AsyncIterator[bytes]:
+    yield first
+    try:
+        async for chunk in body:
+            yield chunk
+    except Exception as e:
+        logger.error(f"Streaming response aborted: {str(e)}")
+        raise
 
 
 class ApiResponse:
     @staticmethod
-    def success(data: Any, message: Optional[str] = None) -> dict:
+    def success(data: Any, message: Optional[str] = None, status_code: int = status.HTTP_200_OK) -> EnvelopeResponse:
         response = {
             "success": True,
             "data": data,
@@ -11,7 +51,13 @@ class ApiResponse:
         }
         if message:
             response["message"] = message
-        return response
+        return EnvelopeResponse(response, status_code=status_code)
+    
+    @staticmethod
+    async def stream(items: AsyncIterator[Any], message: Optional[str] = None) -> StreamingResponse:
+        body = _stream_envelope(items, message)
+        first = await body.__anext__()
+        return StreamingResponse(_resume_stream(first, body), media_type="application/json")
     
     @staticmethod
     def error(error: str, data: Any = None) -> dict:
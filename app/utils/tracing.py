@@ -0,0 +1,322 @@
+import functools
+import inspect
+import json
+import os
+import queue
+import random
+import re
+import threading
+import time
+import urllib.request
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Dict, List, Optional
+from sqlalchemy import event
+from app.config import settings
+from app.utils.logger import logger
+from app.utils.query_tracker import abbreviate, statement_shape
+
+SPAN_KIND_INTERNAL = 1
+SPAN_KIND_SERVER = 2
+SPAN_KIND_CLIENT = 3
+
+SERVER_TIMING_CATEGORIES = ("db", "auth", "serialize")
+
+_TRACEPARENT = re.compile(r"00-([0-9a-f]{32})-([0-9a-f]{16})-([0-9a-f]{2})")
+
+_current_trace: ContextVar[Optional["Trace"]] = ContextVar("trace", default=None)
+_current_span: ContextVar[Optional["Span"]] = ContextVar("span", default=None)
+
+
+def _new_id(bits: int) -> str:
+    return f"{random.getrandbits(bits):0{bits // 4}x}"
+
+
+class Span:
+    __slots__ = (
+        "trace", "parent", "name", "category", "kind", "attributes", "span_id", "parent_id",
+        "start_ns", "started", "duration", "children_time", "error"
+    )
+
+    def __init__(self, trace: "Trace", name: str, category: str, kind: int, parent: Optional["Span"], attributes: dict):
+        self.trace = trace
+        self.parent = parent
+        self.name = name
+        self.category = category
+        self.kind = kind
+        self.attributes = attributes
+        self.span_id = _new_id(64)
+        self.parent_id = parent.span_id if parent is not None else trace.parent_id
+        self.start_ns = time.time_ns()
+        self.started = time.perf_counter()
+        self.duration: Optional[float] = None
+        self.children_time = 0.0
+        self.error: Optional[str] = None
+
+    def finish(self) -> None:
+        self.duration = time.perf_counter() - self.started
+        self.trace.finish(self)
+
+
+class Trace:
+    def __init__(self, trace_id: str, parent_id: Optional[str], sampled: bool):
+        self.trace_id = trace_id
+        self.parent_id = parent_id
+        self.sampled = sampled
+        self.totals: Dict[str, float] = {}
+        self.statements = 0
+        self.spans: List[Span] = []
+
+    def start(self, name: str, category: str = "app", kind: int = SPAN_KIND_INTERNAL,
+              parent: Optional[Span] = None, attributes: Optional[dict] = None) -> Span:
+        return Span(self, name, category, kind, parent, attributes or {})
+
+    def finish(self, span: Span) -> None:
+        parent = span.parent
+        if parent is not None and parent.duration is None:
+            parent.children_time += span.duration
+        self.totals[span.category] = self.totals.get(span.category, 0.0) + max(span.duration - span.children_time, 0.0)
+        if span.category == "db":
+            self.statements += 1
+        if self.sampled:
+            self.spans.append(span)
+
+    def server_timing(self, root: Span) -> str:
+        elapsed = time.perf_counter() - root.started
+        entries = []
+        accounted = 0.0
+        for category in SERVER_TIMING_CATEGORIES:
+            spent = self.totals.get(category)
+            if spent is None:
+                continue
+            accounted += spent
+            description = f';desc="{self.statements} statements"' if category == "db" else ""
+            entries.append(f"{category};dur={spent * 1000:.2f}{description}")
+        entries.append(f"app;dur={max(elapsed - accounted, 0.0) * 1000:.2f}")
+        entries.append(f"total;dur={elapsed * 1000:.2f}")
+        return ", ".join(entries)
+
+
+def start_trace(traceparent: Optional[str] = None) -> Trace:
+    exporting = bool(settings.TRACE_EXPORT)
+    match = _TRACEPARENT.fullmatch(traceparent.strip().lower()) if traceparent else None
+    if match:
+        sampled = exporting and (int(match.group(3), 16) & 1 == 1 or random.random() < settings.TRACE_SAMPLE_RATE)
+        return Trace(match.group(1), match.group(2), sampled)
+    return Trace(_new_id(128), None, exporting and random.random() < settings.TRACE_SAMPLE_RATE)
+
+
+def current_trace() -> Optional[Trace]:
+    return _current_trace.get()
+
+
+def current_span() -> Optional[Span]:
+    return _current_span.get()
+
+
+@contextmanager
+def track_trace(trace: Trace, root: Span):
+    trace_token = _current_trace.set(trace)
+    span_token = _current_span.set(root)
+    try:
+        yield trace
+    finally:
+        _current_span.reset(span_token)
+        _current_trace.reset(trace_token)
+
+
+@contextmanager
+def span(name: str, category: str = "app", **attributes):
+    trace = _current_trace.get()
+    if trace is None:
+        yield None
+        return
+    current = trace.start(name, category, parent=_current_span.get(), attributes=attributes)
+    token = _current_span.set(current)
+    try:
+        yield current
+    except BaseException as e:
+        current.error = type(e).__name__
+        raise
+    finally:
+        _current_span.reset(token)
+        current.finish()
+
+
+def traced(name: str, category: str = "app"):
+    def decorate(func):
+        @functools.wraps(func)
+        async def wrapper(*args, **kwargs):
+            if _current_trace.get() is None:
+                return await func(*args, **kwargs)
+            with span(name, category):
+                return await func(*args, **kwargs)
+
+        wrapper.__traced__ = True
+        return wrapper
+
+    return decorate
+
+
+def trace_methods(cls):
+    for attr, value in list(vars(cls).items()):
+        if attr.startswith("_") or getattr(value, "__traced__", False) or not inspect.iscoroutinefunction(value):
+            continue
+        setattr(cls, attr, traced(f"{cls.__name__}.{attr}")(value))
+    return cls
+
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    trace = _current_trace.get()
+    if trace is None or context is None:
+        return
+    attributes = {"db.system": conn.dialect.name}
+    if trace.sampled:
+        attributes["db.statement"] = abbreviate(statement_shape(statement), 500)
+    # Kept on the execution context rather than the pooled connection so a
+    # statement cancelled mid-flight cannot leave its span behind.
+    context._trace_span = trace.start("sql", "db", SPAN_KIND_CLIENT, _current_span.get(), attributes)
+
+
+def _finish_span(context, error: Optional[str] = None) -> None:
+    sql_span = getattr(context, "_trace_span", None)
+    if sql_span is None:
+        return
+    context._trace_span = None
+    sql_span.error = error
+    sql_span.finish()
+
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    _finish_span(context)
+
+
+def _handle_error(context):
+    if context.execution_context is not None:
+        _finish_span(context.execution_context, type(context.original_exception).__name__)
+
+
+def install_tracing(engine) -> None:
+    target = engine.sync_engine
+    event.listen(target, "before_cursor_execute", _before_cursor_execute)
+    event.listen(target, "after_cursor_execute", _after_cursor_execute)
+    event.listen(target, "handle_error", _handle_error)
+
+
+def _attribute(key: str, value) -> dict:
+    if isinstance(value, bool):
+        return {"key": key, "value": {"boolValue": value}}
+    if isinstance(value, int):
+        return {"key": key, "value": {"intValue": str(value)}}
+    if isinstance(value, float):
+        return {"key": key, "value": {"doubleValue": value}}
+    return {"key": key, "value": {"stringValue": str(value)}}
+
+
+def _otlp_span(span: Span) -> dict:
+    encoded = {
+        "traceId": span.trace.trace_id,
+        "spanId": span.span_id,
+        "name": span.name,
+        "kind": span.kind,
+        "startTimeUnixNano": str(span.start_ns),
+        "endTimeUnixNano": str(span.start_ns + int(span.duration * 1_000_000_000)),
+        "attributes": [_attribute(key, value) for key, value in span.attributes.items() if value is not None],
+        "status": {"code": 2, "message": span.error} if span.error else {"code": 0},
+    }
+    if span.parent_id:
+        encoded["parentSpanId"] = span.parent_id
+    return encoded
+
+
+def otlp_payload(spans: List[Span]) -> dict:
+    return {
+        "resourceSpans": [{
+            "resource": {"attributes": [
+                _attribute("service.name", settings.APP_NAME),
+                _attribute("service.version", settings.API_VERSION),
+                _attribute("process.pid", os.getpid()),
+            ]},
+            "scopeSpans": [{"scope": {"name": "app.tracing"}, "spans": [_otlp_span(span) for span in spans]}],
+        }]
+    }
+
+
+class SpanExporter:
+    def __init__(self, batch_size: int, interval: float, max_queue: int):
+        self.batch_size = batch_size
+        self.interval = interval
+        self.dropped = 0
+        self.exported = 0
+        self._queue: queue.Queue = queue.Queue(maxsize=max_queue)
+        self._thread: Optional[threading.Thread] = None
+        self._lock = threading.Lock()
+
+    def submit(self, spans: List[Span]) -> None:
+        if self._thread is None:
+            self._start()
+        try:
+            self._queue.put_nowait(spans)
+        except queue.Full:
+            self.dropped += len(spans)
+
+    def shutdown(self, timeout: float = 5.0) -> None:
+        if self._thread is None:
+            return
+        self._queue.put(None)
+        self._thread.join(timeout)
+        self._thread = None
+
+    def stats(self) -> dict:
+        return {"queued": self._queue.qsize(), "exported": self.exported, "dropped": self.dropped}
+
+    def _start(self) -> None:
+        with self._lock:
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, name="span-exporter", daemon=True)
+                self._thread.start()
+
+    def _run(self) -> None:
+        batch: List[Span] = []
+        deadline = time.monotonic() + self.interval
+        running = True
+        while running:
+            try:
+                spans = self._queue.get(timeout=max(deadline - time.monotonic(), 0.0))
+                if spans is None:
+                    running = False
+                else:
+                    batch.extend(spans)
+            except queue.Empty:
+                pass
+            if batch and (not running or len(batch) >= self.batch_size or time.monotonic() >= deadline):
+                self._export(batch)
+                batch = []
+            if time.monotonic() >= deadline:
+                deadline = time.monotonic() + self.interval
+
+    def _export(self, batch: List[Span]) -> None:
+        body = json.dumps(otlp_payload(batch), separators=(",", ":"))
+        try:
+            if settings.TRACE_EXPORT == "otlp":
+                request = urllib.request.Request(
+                    settings.TRACE_OTLP_ENDPOINT, data=body.encode(), headers={"Content-Type": "application/json"}
+                )
+                urllib.request.urlopen(request, timeout=5).close()
+            else:
+                directory = os.path.dirname(settings.TRACE_EXPORT_PATH)
+                if directory:
+                    os.makedirs(directory, exist_ok=True)
+                with open(settings.TRACE_EXPORT_PATH, "a", encoding="utf-8") as output:
+                    output.write(body + "\n")
+            self.exported += len(batch)
+        except Exception as e:
+            self.dropped += len(batch)
+            logger.warning(f"Span export failed: {str(e)}")
+
+
+span_exporter = SpanExporter(
+    batch_size=settings.TRACE_EXPORT_BATCH_SIZE,
+    interval=settings.TRACE_EXPORT_INTERVAL_SECONDS,
+    max_queue=settings.TRACE_EXPORT_MAX_QUEUE
+)
@@ -0,0 +1,75 @@
+"""Native UUID primary and foreign keys
+
+Revision ID: c7d2e4f19a3b
+Revises: b41c9e2d7a10
+Create Date: 2026-10-19 11:48:03.517920
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c7d2e4f19a3b'
+down_revision: Union[str, None] = 'b41c9e2d7a10'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+PRIMARY_KEYS = [
+    'users', 'trips', 'cities', 'activities', 'itinerary_days',
+    'itinerary_items', 'budgets', 'shared_trips', 'refresh_tokens',
+]
+
+FOREIGN_KEYS = [
+    ('trips', 'user_id', 'users', 'CASCADE'),
+    ('activities', 'city_id', 'cities', 'CASCADE'),
+    ('itinerary_days', 'trip_id', 'trips', 'CASCADE'),
+    ('itinerary_days', 'city_id', 'cities', 'CASCADE'),
+    ('itinerary_items', 'itinerary_day_id', 'itinerary_days', 'CASCADE'),
+    ('itinerary_items', 'activity_id', 'activities', 'SET NULL'),
+    ('budgets', 'trip_id', 'trips', 'CASCADE'),
+    ('shared_trips', 'trip_id', 'trips', 'CASCADE'),
+    ('shared_trips', 'user_id', 'users', 'CASCADE'),
+    ('refresh_tokens', 'user_id', 'users', 'CASCADE'),
+]
+
+
+def _columns():
+    return [(table, 'id') for table in PRIMARY_KEYS] + [(table, column) for table, column, _, _ in FOREIGN_KEYS]
+
+
+def _convert(type_, using) -> None:
+    for table, column, _, _ in FOREIGN_KEYS:
+        op.drop_constraint(f'{table}_{column}_fkey', table, type_='foreignkey')
+
+    for table, column in _columns():
+        op.alter_column(table, column, type_=type_, postgresql_using=using.format(column=column))
+
+    for table, column, referent, ondelete in FOREIGN_KEYS:
+        op.create_foreign_key(f'{table}_{column}_fkey', table, referent, [column], ['id'], ondelete=ondelete)
+
+
+def upgrade() -> None:
+    if op.get_bind().dialect.name == 'postgresql':
+        _convert(sa.Uuid(), '{column}::uuid')
+        return
+
+    # Without a native UUID type, sa.Uuid stores 32 hex characters.
+    for table, column in _columns():
+        op.execute(f"UPDATE {table} SET {column} = lower(replace({column}, '-', '')) WHERE {column} IS NOT NULL")
+
+
+def downgrade() -> None:
+    if op.get_bind().dialect.name == 'postgresql':
+        _convert(sa.String(), '{column}::text')
+        return
+
+    for table, column in _columns():
+        op.execute(
+            f"UPDATE {table} SET {column} = substr({column}, 1, 8) || '-' || substr({column}, 9, 4) || '-' || "
+            f"substr({column}, 13, 4) || '-' || substr({column}, 17, 4) || '-' || substr({column}, 21) "
+            f"WHERE {column} IS NOT NULL"
+        )
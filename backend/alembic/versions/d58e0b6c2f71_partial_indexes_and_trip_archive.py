@@ -0,0 +1,99 @@
+"""Partial indexes on live rows and archive tables for deleted trips
+
+Revision ID: d58e0b6c2f71
+Revises: c7d2e4f19a3b
+Create Date: 2026-10-19 12:02:37.114806
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'd58e0b6c2f71'
+down_revision: Union[str, None] = 'c7d2e4f19a3b'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+LIVE = {'postgresql_where': sa.text('is_deleted = false'), 'sqlite_where': sa.text('is_deleted = 0')}
+DELETED = {'postgresql_where': sa.text('is_deleted = true'), 'sqlite_where': sa.text('is_deleted = 1')}
+
+
+def _archived_at():
+    return sa.Column('archived_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False)
+
+
+def upgrade() -> None:
+    op.create_index('ix_trips_user_id_created_at_live', 'trips', ['user_id', 'created_at'], unique=False, **LIVE)
+    op.create_index('ix_trips_created_at_live', 'trips', ['created_at'], unique=False, **LIVE)
+    op.create_index('ix_trips_updated_at_deleted', 'trips', ['updated_at'], unique=False, **DELETED)
+    op.create_index('ix_users_created_at_live', 'users', ['created_at'], unique=False, **LIVE)
+
+    op.create_table('trips_archive',
+    sa.Column('id', sa.Uuid(as_uuid=False), nullable=False),
+    sa.Column('user_id', sa.Uuid(as_uuid=False), nullable=False),
+    sa.Column('title', sa.String(), nullable=False),
+    sa.Column('description', sa.Text(), nullable=True),
+    sa.Column('start_date', sa.DateTime(timezone=True), nullable=False),
+    sa.Column('end_date', sa.DateTime(timezone=True), nullable=False),
+    sa.Column('is_deleted', sa.Boolean(), nullable=False),
+    sa.Column('created_at', sa.DateTime(timezone=True), nullable=False),
+    sa.Column('updated_at', sa.DateTime(timezone=True), nullable=False),
+    _archived_at(),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_table('itinerary_days_archive',
+    sa.Column('id', sa.Uuid(as_uuid=False), nullable=False),
+    sa.Column('trip_id', sa.Uuid(as_uuid=False), nullable=False),
+    sa.Column('city_id', sa.Uuid(as_uuid=False), nullable=False),
+    sa.Column('day_number', sa.Integer(), nullable=False),
+    sa.Column('date', sa.DateTime(timezone=True), nullable=False),
+    sa.Column('notes', sa.Text(), nullable=True),
+    sa.Column('created_at', sa.DateTime(timezone=True), nullable=False),
+    sa.Column('updated_at', sa.DateTime(timezone=True), nullable=False),
+    _archived_at(),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_table('itinerary_items_archive',
+    sa.Column('id', sa.Uuid(as_uuid=False), nullable=False),
+    sa.Column('itinerary_day_id', sa.Uuid(as_uuid=False), nullable=False),
+    sa.Column('activity_id', sa.Uuid(as_uuid=False), nullable=True),
+    sa.Column('order_index', sa.Integer(), nullable=False),
+    sa.Column('start_time', sa.String(), nullable=True),
+    sa.Column('end_time', sa.String(), nullable=True),
+    sa.Column('custom_title', sa.String(), nullable=True),
+    sa.Column('custom_notes', sa.Text(), nullable=True),
+    sa.Column('created_at', sa.DateTime(timezone=True), nullable=False),
+    sa.Column('updated_at', sa.DateTime(timezone=True), nullable=False),
+    _archived_at(),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_table('budgets_archive',
+    sa.Column('id', sa.Uuid(as_uuid=False), nullable=False),
+    sa.Column('trip_id', sa.Uuid(as_uuid=False), nullable=False),
+    sa.Column('total_budget', sa.Float(), nullable=False),
+    sa.Column('accommodation', sa.Float(), nullable=False),
+    sa.Column('transportation', sa.Float(), nullable=False),
+    sa.Column('food', sa.Float(), nullable=False),
+    sa.Column('activities', sa.Float(), nullable=False),
+    sa.Column('shopping', sa.Float(), nullable=False),
+    sa.Column('other', sa.Float(), nullable=False),
+    sa.Column('created_at', sa.DateTime(timezone=True), nullable=False),
+    sa.Column('updated_at', sa.DateTime(timezone=True), nullable=False),
+    _archived_at(),
+    sa.PrimaryKeyConstraint('id')
+    )
+
+
+def downgrade() -> None:
+    op.drop_table('budgets_archive')
+    op.drop_table('itinerary_items_archive')
+    op.drop_table('itinerary_days_archive')
+    op.drop_table('trips_archive')
+    op.drop_index('ix_users_created_at_live', table_name='users')
+    op.drop_index('ix_trips_updated_at_deleted', table_name='trips')
+    op.drop_index('ix_trips_created_at_live', table_name='trips')
+    op.drop_index('ix_trips_user_id_created_at_live', table_name='trips')
@@ -1,14 +1,54 @@
+from contextlib import asynccontextmanager
+import anyio
+from typing import Optional
+from fastapi import Request
+from sqlalchemy import event, exc
 from sqlalchemy.ext.asyncio import create_async_engine, AsyncSession, async_sessionmaker
-from sqlalchemy.orm import DeclarativeBase
+from sqlalchemy.orm import DeclarativeBase, Session
 from app.config import settings
+from app.utils.auth import verify_access_token_cached
+from app.utils.db_pool import MonitoredQueuePool
+from app.utils.db_routing import ReplicaRouter, RecentWriters, WriteMarker
+from app.utils.logger import logger
+from app.utils.query_tracker import install_query_tracking
+from app.utils.slow_query_log import install_slow_query_log
+from app.utils.tracing import install_tracing
 
 
-engine = create_async_engine(
-    settings.DATABASE_URL,
-    echo=settings.DEBUG,
-    future=True
+def _engine_options(url: str) -> dict:
+    options = {"echo": settings.DB_ECHO, "future": True}
+    if url.startswith("sqlite") and ":memory:" in url:
+        return options
+    options.update(
+        poolclass=MonitoredQueuePool,
+        pool_size=settings.DB_POOL_SIZE,
+        max_overflow=settings.DB_MAX_OVERFLOW,
+        pool_timeout=settings.DB_POOL_TIMEOUT,
+        pool_recycle=settings.DB_POOL_RECYCLE,
+        pool_pre_ping=settings.DB_POOL_PRE_PING
+    )
+    return options
+
+
+engine = create_async_engine(settings.DATABASE_URL, **_engine_options(settings.DATABASE_URL))
+
+replica_engines = [create_async_engine(url, **_engine_options(url)) for url in settings.database_replica_urls_list]
+
+replica_router = ReplicaRouter(
+    engine,
+    replica_engines,
+    policy=settings.DB_REPLICA_POLICY,
+    retry_seconds=settings.DB_REPLICA_RETRY_SECONDS
 )
 
+for target in [engine, *replica_engines]:
+    install_query_tracking(target)
+    install_slow_query_log(target)
+    install_tracing(target)
+
+recent_writers = RecentWriters(settings.READ_YOUR_WRITES_SECONDS, settings.READ_YOUR_WRITES_MAX_KEYS)
+write_marker = WriteMarker(settings.JWT_SECRET_KEY, settings.READ_YOUR_WRITES_SECONDS)
+
 AsyncSessionLocal = async_sessionmaker(
     engine,
     class_=AsyncSession,
@@ -17,12 +57,158 @@ AsyncSessionLocal = async_sessionmaker(
 
 
 class Base(DeclarativeBase):
-    pass
+    __mapper_args__ = {"eager_defaults": True}
+
+
+class UnitOfWork:
+    def __init__(self, session: AsyncSession):
+        self.session = session
+        self.depth = 0
+        self.wrote = False
+    
+    @asynccontextmanager
+    async def transaction(self, savepoint: bool = False):
+        if self.depth and savepoint:
+            async with self.session.begin_nested():
+                self.depth += 1
+                try:
+                    yield self.session
+                finally:
+                    self.depth -= 1
+            return
+        
+        self.depth += 1
+        try:
+            yield self.session
+            if self.depth == 1:
+                await self.session.flush()
+                self.wrote = True
+        except BaseException:
+            if self.depth == 1:
+                await self.session.rollback()
+            raise
+        finally:
+            self.depth -= 1
+    
+    async def commit(self) -> None:
+        if self.session.in_transaction():
+            await self.session.commit()
+    
+    async def rollback(self) -> None:
+        if self.session.in_transaction():
+            await self.session.rollback()
+
+
+@event.listens_for(Session, "before_flush")
+def _reject_read_only_writes(session, flush_context, instances):
+    if session.info.get("read_only") and (session.new or session.dirty or session.deleted):
+        raise RuntimeError("Attempted to write through a read-only session")
+
+
+def pool_stats(target=None) -> dict:
+    pool = (target or engine).pool
+    if isinstance(pool, MonitoredQueuePool):
+        return pool.stats()
+    return {"status": pool.status()}
+
+
+def replica_stats() -> dict:
+    return {**replica_router.stats(), "pools": [pool_stats(replica) for replica in replica_engines]}
+
+
+async def warm_up_pool(connections: int) -> None:
+    opened = []
+    try:
+        for target in [engine, *replica_engines]:
+            for _ in range(min(connections, settings.DB_POOL_SIZE)):
+                opened.append(await target.connect())
+    finally:
+        for connection in opened:
+            await connection.close()
 
 
-async def get_db():
+async def dispose_engines() -> None:
+    for target in [engine, *replica_engines]:
+        await target.dispose()
+
+
+def _request_user_id(request: Request) -> Optional[str]:
+    scheme, _, token = request.headers.get("authorization", "").partition(" ")
+    if scheme.lower() != "bearer" or not token:
+        return None
+    try:
+        return verify_access_token_cached(token).get("user_id")
+    except Exception:
+        return None
+
+
+async def _cancel_loader(session: AsyncSession) -> None:
+    loader = session.info.get("loader")
+    if loader is not None:
+        await loader.cancel()
+
+
+def get_uow(session: AsyncSession) -> UnitOfWork:
+    uow = session.info.get("uow")
+    if uow is None:
+        uow = session.info["uow"] = UnitOfWork(session)
+    return uow
+
+
+async def get_db(request: Request):
     async with AsyncSessionLocal() as session:
+        uow = get_uow(session)
         try:
             yield session
+            await uow.commit()
+            if uow.wrote:
+                user_id = _request_user_id(request)
+                recent_writers.mark(user_id)
+                if replica_engines:
+                    request.state.write_marker = write_marker.issue(user_id)
+        except BaseException:
+            with anyio.CancelScope(shield=True):
+                await _cancel_loader(session)
+                await uow.rollback()
+            raise
         finally:
+            with anyio.CancelScope(shield=True):
+                await session.close()
+
+
+async def _open_read_session(pin_primary: bool) -> AsyncSession:
+    for target in replica_router.candidates(pin_primary):
+        session = AsyncSessionLocal(bind=target)
+        session.info["read_only"] = True
+        try:
+            await session.connection()
+            return session
+        except (exc.SQLAlchemyError, OSError) as e:
+            await session.close()
+            if target is engine:
+                raise
+            replica_router.mark_down(target)
+            logger.warning(f"Read replica unavailable, falling back to primary: {str(e)}")
+
+
+@asynccontextmanager
+async def read_session(pin_primary: bool = False):
+    session = await _open_read_session(pin_primary)
+    try:
+        yield session
+    finally:
+        with anyio.CancelScope(shield=True):
+            await _cancel_loader(session)
             await session.close()
+
+
+def _recently_wrote(request: Request) -> bool:
+    user_id = _request_user_id(request)
+    if recent_writers.is_recent(user_id):
+        return True
+    return write_marker.is_recent(request.cookies.get(settings.READ_YOUR_WRITES_COOKIE), user_id)
+
+
+async def get_read_db(request: Request):
+    async with read_session(_recently_wrote(request)) as session:
+        yield session
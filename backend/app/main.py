@@ -1,9 +1,24 @@
-from fastapi import FastAPI
+import asyncio
+from fastapi import FastAPI, Request, status
+from fastapi.responses import JSONResponse, Response
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.exception_handlers import http_exception_handler
+from starlette.exceptions import HTTPException as StarletteHTTPException
 from app.config import settings
-from app.routers import auth, users, trips, cities, activities, itinerary, budgets, shared
-from app.middleware import error_handler_middleware
+from app.database import dispose_engines, pool_stats, replica_stats, warm_up_pool
+from app.routers import auth, users, trips, cities, activities, itinerary, budgets, shared, admin
+from app.middleware import (
+    ErrorHandlerMiddleware, QueryBudgetMiddleware, DeadlineMiddleware, ReadYourWritesMiddleware, CompressionMiddleware,
+    TracingMiddleware, TimingMiddleware, MetricsMiddleware, RequestIdMiddleware
+)
+from app.utils import ApiResponse
+from app.utils.db_pool import PoolExhaustedError
 from app.utils.logger import logger
+from app.utils.tracing import span_exporter
+from app.utils.loop_monitor import LoopLagMonitor
+from app.utils.metrics import CONTENT_TYPE_LATEST, mark_worker_dead, render_metrics, run_metrics_sampler
+from app.services.refresh_token_service import run_refresh_token_purger
+from app.services.archive_service import run_trip_archiver
 
 
 app = FastAPI(
@@ -12,7 +27,8 @@ app = FastAPI(
     debug=settings.DEBUG
 )
 
-app.middleware("http")(error_handler_middleware)
+app.add_middleware(ErrorHandlerMiddleware)
+app.add_middleware(DeadlineMiddleware)
 
 app.add_middleware(
     CORSMiddleware,
@@ -22,6 +38,34 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+app.add_middleware(QueryBudgetMiddleware)
+app.add_middleware(ReadYourWritesMiddleware)
+app.add_middleware(CompressionMiddleware)
+app.add_middleware(TracingMiddleware)
+app.add_middleware(TimingMiddleware)
+app.add_middleware(MetricsMiddleware)
+app.add_middleware(RequestIdMiddleware)
+
+@app.exception_handler(PoolExhaustedError)
+async def pool_exhausted_handler(request: Request, exc: PoolExhaustedError):
+    logger.warning(f"Database pool exhausted: {request.method} {request.url.path} {pool_stats()}")
+    return JSONResponse(
+        status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+        content=ApiResponse.error("Database is busy, please retry"),
+        headers={"Retry-After": "1"}
+    )
+
+
+@app.exception_handler(StarletteHTTPException)
+async def http_error_handler(request: Request, exc: StarletteHTTPException):
+    cause = exc.__context__
+    while cause is not None:
+        if isinstance(cause, PoolExhaustedError):
+            return await pool_exhausted_handler(request, cause)
+        cause = cause.__context__
+    return await http_exception_handler(request, exc)
+
+
 app.include_router(auth.router, prefix=f"/api/{settings.API_VERSION}")
 app.include_router(users.router, prefix=f"/api/{settings.API_VERSION}")
 app.include_router(trips.router, prefix=f"/api/{settings.API_VERSION}")
@@ -30,6 +74,7 @@ app.include_router(activities.router, prefix=f"/api/{settings.API_VERSION}")
 app.include_router(itinerary.router, prefix=f"/api/{settings.API_VERSION}")
 app.include_router(budgets.router, prefix=f"/api/{settings.API_VERSION}")
 app.include_router(shared.router, prefix=f"/api/{settings.API_VERSION}")
+app.include_router(admin.router, prefix=f"/api/{settings.API_VERSION}")
 
 
 @app.get("/")
@@ -46,11 +91,57 @@ async def health_check():
     return {"status": "healthy"}
 
 
+@app.get("/health/db")
+async def database_health_check():
+    return {"status": "healthy", "pool": pool_stats(), "replicas": replica_stats()}
+
+
+@app.get("/metrics", include_in_schema=False)
+def metrics():
+    if not settings.METRICS_ENABLED:
+        return JSONResponse(status_code=status.HTTP_404_NOT_FOUND, content=ApiResponse.error("Not found"))
+    return Response(render_metrics(), headers={"Content-Type": CONTENT_TYPE_LATEST})
+
+
 @app.on_event("startup")
 async def startup_event():
+    try:
+        await warm_up_pool(settings.DB_POOL_WARMUP)
+    except Exception as e:
+        logger.warning(f"Database pool warm-up failed: {str(e)}")
+    app.state.refresh_token_purger = asyncio.create_task(run_refresh_token_purger(
+        settings.REFRESH_TOKEN_PURGE_INTERVAL_SECONDS,
+        settings.REFRESH_TOKEN_PURGE_BATCH_SIZE
+    ))
+    app.state.trip_archiver = asyncio.create_task(run_trip_archiver(
+        settings.TRIP_ARCHIVE_INTERVAL_SECONDS,
+        settings.TRIP_ARCHIVE_BATCH_SIZE,
+        settings.TRIP_ARCHIVE_GRACE_HOURS * 3600
+    ))
+    app.state.loop_monitor = None
+    if settings.LOOP_MONITOR_ENABLED:
+        monitor = LoopLagMonitor(
+            interval=settings.LOOP_LAG_PROBE_SECONDS,
+            threshold=settings.LOOP_LAG_THRESHOLD_MS / 1000,
+            window=settings.LOOP_LAG_WINDOW_SECONDS,
+            capture_stacks=settings.loop_block_stacks_enabled
+        )
+        app.state.loop_monitor = asyncio.create_task(monitor.run())
+    app.state.metrics_sampler = None
+    if settings.METRICS_ENABLED:
+        app.state.metrics_sampler = asyncio.create_task(run_metrics_sampler(settings.METRICS_SAMPLE_INTERVAL_SECONDS))
     logger.info(f"{settings.APP_NAME} started successfully")
 
 
 @app.on_event("shutdown")
 async def shutdown_event():
     logger.info(f"{settings.APP_NAME} shutting down")
+    app.state.refresh_token_purger.cancel()
+    app.state.trip_archiver.cancel()
+    if app.state.metrics_sampler is not None:
+        app.state.metrics_sampler.cancel()
+    if app.state.loop_monitor is not None:
+        app.state.loop_monitor.cancel()
+    mark_worker_dead()
+    span_exporter.shutdown()
+    await dispose_engines()
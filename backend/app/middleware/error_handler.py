@@ -1,15 +1,33 @@
-from fastapi import Request, status
+from fastapi import status
 from fastapi.responses import JSONResponse
 from app.utils import ApiResponse
 from app.utils.logger import logger
 
 
-async def error_handler_middleware(request: Request, call_next):
-    try:
-        return await call_next(request)
-    except Exception as e:
-        logger.error(f"Unhandled error: {str(e)}", exc_info=True)
-        return JSONResponse(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            content=ApiResponse.error("Internal server error")
-        )
+class ErrorHandlerMiddleware:
+    def __init__(self, app):
+        self.app = app
+    
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        
+        started = False
+        
+        async def guarded_send(message):
+            nonlocal started
+            if message["type"] == "http.response.start":
+                started = True
+            await send(message)
+        
+        try:
+            await self.app(scope, receive, guarded_send)
+        except Exception as e:
+            logger.error(f"Unhandled error: {str(e)}", exc_info=True)
+            if started:
+                raise
+            await JSONResponse(
+                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+                content=ApiResponse.error("Internal server error")
+            )(scope, receive, send)
@@ -0,0 +1,29 @@
+import time
+from app.config import settings
+from app.utils.metrics import record_request, requests_in_flight, route_label
+
+
+class MetricsMiddleware:
+    def __init__(self, app):
+        self.app = app
+    
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or not settings.METRICS_ENABLED:
+            await self.app(scope, receive, send)
+            return
+        
+        started = time.perf_counter()
+        response = {"status": 500}
+        in_flight = requests_in_flight(scope["method"])
+        
+        async def measured_send(message):
+            if message["type"] == "http.response.start":
+                response["status"] = message["status"]
+            await send(message)
+        
+        in_flight.inc()
+        try:
+            await self.app(scope, receive, measured_send)
+        finally:
+            in_flight.dec()
+            record_request(scope["method"], route_label(scope), response["status"], time.perf_counter() - started)
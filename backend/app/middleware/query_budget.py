@@ -0,0 +1,63 @@
+from typing import Optional
+from fastapi import Depends, Request
+from app.config import settings
+from app.utils.logger import logger
+from app.utils.metrics import record_db_usage, route_label
+from app.utils.query_tracker import QueryStats, abbreviate, current_query_stats, track_queries
+
+
+def statement_budget(limit: int):
+    async def declare_statement_budget(request: Request) -> None:
+        stats = current_query_stats()
+        if stats is not None:
+            route = request.scope.get("route")
+            stats.route = f"{request.method} {getattr(route, 'path', request.url.path)}"
+            stats.budget = limit
+    
+    declare_statement_budget.budget = limit
+    return Depends(declare_statement_budget)
+
+
+def route_statement_budget(route) -> Optional[int]:
+    for dependency in getattr(route, "dependencies", []):
+        budget = getattr(dependency.dependency, "budget", None)
+        if budget is not None:
+            return budget
+    return None
+
+
+class QueryBudgetMiddleware:
+    def __init__(self, app):
+        self.app = app
+    
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        
+        stats = QueryStats(
+            f"{scope['method']} {scope['path']}",
+            settings.DB_STATEMENT_BUDGET,
+            strict=settings.DB_STATEMENT_BUDGET_STRICT,
+            n_plus_one_threshold=settings.DB_N_PLUS_ONE_THRESHOLD
+        )
+        with track_queries(stats):
+            try:
+                await self.app(scope, receive, send)
+            finally:
+                self._report(scope, stats)
+    
+    def _report(self, scope, stats: QueryStats) -> None:
+        route = scope.get("route")
+        name = f"{scope['method']} {getattr(route, 'path', scope['path'])}"
+        if settings.METRICS_ENABLED:
+            record_db_usage(scope["method"], route_label(scope), stats.count, stats.db_time)
+        logger.debug(f"{name}: {stats.count} statements, {stats.db_time * 1000:.1f}ms in the database")
+        
+        if stats.over_budget:
+            logger.warning(
+                f"{name} ran {stats.count} statements, over its budget of {stats.budget}; "
+                f"first statement over budget at {stats.over_budget_at}"
+            )
+        for shape, count, site in stats.repeated():
+            logger.warning(f"Possible N+1 in {name}: {count}x {abbreviate(shape)} at {site}")
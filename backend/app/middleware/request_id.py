@@ -0,0 +1,26 @@
+from starlette.datastructures import Headers, MutableHeaders
+from app.config import settings
+from app.utils.request_id import accept_request_id, track_request_id
+
+
+class RequestIdMiddleware:
+    def __init__(self, app):
+        self.app = app
+        self.header = settings.REQUEST_ID_HEADER.lower()
+    
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        
+        request_id = accept_request_id(Headers(scope=scope).get(self.header))
+        scope.setdefault("state", {})["request_id"] = request_id
+        
+        async def send_with_request_id(message):
+            if message["type"] == "http.response.start":
+                headers = MutableHeaders(scope=message)
+                headers[self.header] = request_id
+            await send(message)
+        
+        with track_request_id(request_id):
+            await self.app(scope, receive, send_with_request_id)
@@ -0,0 +1,37 @@
+import time
+from starlette.datastructures import MutableHeaders
+from app.config import settings
+from app.utils.logger import logger
+from app.utils.request_id import current_request_id
+
+
+class TimingMiddleware:
+    def __init__(self, app):
+        self.app = app
+    
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        
+        started = time.perf_counter()
+        response = {"status": None}
+        
+        async def timed_send(message):
+            if message["type"] == "http.response.start":
+                response["status"] = message["status"]
+                headers = MutableHeaders(scope=message)
+                headers["X-Process-Time"] = f"{(time.perf_counter() - started) * 1000:.2f}"
+            await send(message)
+        
+        try:
+            await self.app(scope, receive, timed_send)
+        finally:
+            elapsed_ms = (time.perf_counter() - started) * 1000
+            route = scope.get("route")
+            name = f"{scope['method']} {getattr(route, 'path', scope['path'])}"
+            message = f"{name} {response['status']} {elapsed_ms:.1f}ms request_id={current_request_id()}"
+            if settings.SLOW_REQUEST_MS and elapsed_ms >= settings.SLOW_REQUEST_MS:
+                logger.warning(f"Slow request {message}")
+            else:
+                logger.debug(message)
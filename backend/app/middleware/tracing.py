@@ -0,0 +1,41 @@
+from starlette.datastructures import Headers, MutableHeaders
+from app.config import settings
+from app.utils.metrics import route_label
+from app.utils.request_id import current_request_id
+from app.utils.tracing import SPAN_KIND_SERVER, span_exporter, start_trace, track_trace
+
+
+class TracingMiddleware:
+    def __init__(self, app):
+        self.app = app
+    
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or not settings.TRACING_ENABLED:
+            await self.app(scope, receive, send)
+            return
+        
+        trace = start_trace(Headers(scope=scope).get("traceparent"))
+        root = trace.start(f"{scope['method']} {scope['path']}", kind=SPAN_KIND_SERVER, attributes={
+            "http.method": scope["method"],
+            "http.target": scope["path"],
+            "request_id": current_request_id(),
+        })
+        
+        async def traced_send(message):
+            if message["type"] == "http.response.start":
+                root.attributes["http.status_code"] = message["status"]
+                if settings.SERVER_TIMING_ENABLED:
+                    MutableHeaders(scope=message).append("Server-Timing", trace.server_timing(root))
+            await send(message)
+        
+        with track_trace(trace, root):
+            try:
+                await self.app(scope, receive, traced_send)
+            except BaseException as e:
+                root.error = type(e).__name__
+                raise
+            finally:
+                root.name = f"{scope['method']} {route_label(scope)}"
+                root.finish()
+                if trace.sampled:
+                    span_exporter.submit(trace.spans)
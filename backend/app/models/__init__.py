@@ -6,6 +6,8 @@ from app.models.itinerary_day import ItineraryDay
 from app.models.itinerary_item import ItineraryItem
 from app.models.budget import Budget
 from app.models.shared_trip import SharedTrip
+from app.models.refresh_token import RefreshToken
+from app.models.archive import trips_archive, itinerary_days_archive, itinerary_items_archive, budgets_archive
 
 __all__ = [
     "User",
@@ -17,4 +19,9 @@ __all__ = [
     "ItineraryItem",
     "Budget",
     "SharedTrip",
+    "RefreshToken",
+    "trips_archive",
+    "itinerary_days_archive",
+    "itinerary_items_archive",
+    "budgets_archive",
 ]
@@ -1,16 +1,16 @@
-from sqlalchemy import Column, String, Float, DateTime, ForeignKey
+from sqlalchemy import Column, Float, DateTime, ForeignKey, Uuid
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
-import uuid
 
 from app.database import Base
+from app.utils.ids import new_id
 
 
 class Budget(Base):
     __tablename__ = "budgets"
     
-    id = Column(String, primary_key=True, default=lambda: str(uuid.uuid4()))
-    trip_id = Column(String, ForeignKey("trips.id", ondelete="CASCADE"), unique=True, nullable=False)
+    id = Column(Uuid(as_uuid=False), primary_key=True, default=new_id)
+    trip_id = Column(Uuid(as_uuid=False), ForeignKey("trips.id", ondelete="CASCADE"), unique=True, nullable=False)
     total_budget = Column(Float, nullable=False)
     accommodation = Column(Float, default=0.0, nullable=False)
     transportation = Column(Float, default=0.0, nullable=False)
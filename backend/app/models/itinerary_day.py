@@ -1,17 +1,17 @@
-from sqlalchemy import Column, String, Integer, Text, DateTime, ForeignKey
+from sqlalchemy import Column, Integer, Text, DateTime, ForeignKey, Uuid
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
-import uuid
 
 from app.database import Base
+from app.utils.ids import new_id
 
 
 class ItineraryDay(Base):
     __tablename__ = "itinerary_days"
     
-    id = Column(String, primary_key=True, default=lambda: str(uuid.uuid4()))
-    trip_id = Column(String, ForeignKey("trips.id", ondelete="CASCADE"), nullable=False, index=True)
-    city_id = Column(String, ForeignKey("cities.id", ondelete="CASCADE"), nullable=False)
+    id = Column(Uuid(as_uuid=False), primary_key=True, default=new_id)
+    trip_id = Column(Uuid(as_uuid=False), ForeignKey("trips.id", ondelete="CASCADE"), nullable=False, index=True)
+    city_id = Column(Uuid(as_uuid=False), ForeignKey("cities.id", ondelete="CASCADE"), nullable=False)
     day_number = Column(Integer, nullable=False)
     date = Column(DateTime(timezone=True), nullable=False)
     notes = Column(Text, nullable=True)
@@ -1,17 +1,17 @@
-from sqlalchemy import Column, String, Integer, Text, DateTime, ForeignKey
+from sqlalchemy import Column, String, Integer, Text, DateTime, ForeignKey, Uuid
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
-import uuid
 
 from app.database import Base
+from app.utils.ids import new_id
 
 
 class ItineraryItem(Base):
     __tablename__ = "itinerary_items"
     
-    id = Column(String, primary_key=True, default=lambda: str(uuid.uuid4()))
-    itinerary_day_id = Column(String, ForeignKey("itinerary_days.id", ondelete="CASCADE"), nullable=False, index=True)
-    activity_id = Column(String, ForeignKey("activities.id", ondelete="SET NULL"), nullable=True)
+    id = Column(Uuid(as_uuid=False), primary_key=True, default=new_id)
+    itinerary_day_id = Column(Uuid(as_uuid=False), ForeignKey("itinerary_days.id", ondelete="CASCADE"), nullable=False, index=True)
+    activity_id = Column(Uuid(as_uuid=False), ForeignKey("activities.id", ondelete="SET NULL"), nullable=True)
     order_index = Column(Integer, nullable=False)
     start_time = Column(String, nullable=True)
     end_time = Column(String, nullable=True)
@@ -1,11 +1,11 @@
-from sqlalchemy import Column, String, Boolean, DateTime, Enum as SQLEnum
+from sqlalchemy import Column, String, Boolean, DateTime, Enum as SQLEnum, Uuid, Index
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
 from datetime import datetime
 import enum
-import uuid
 
 from app.database import Base
+from app.utils.ids import new_id
 
 
 class Role(enum.Enum):
@@ -16,15 +16,20 @@ class Role(enum.Enum):
 class User(Base):
     __tablename__ = "users"
     
-    id = Column(String, primary_key=True, default=lambda: str(uuid.uuid4()))
+    id = Column(Uuid(as_uuid=False), primary_key=True, default=new_id)
     email = Column(String, unique=True, nullable=False, index=True)
     password = Column(String, nullable=False)
     name = Column(String, nullable=False)
     role = Column(SQLEnum(Role), default=Role.USER, nullable=False)
-    refresh_token = Column(String, nullable=True)
     is_deleted = Column(Boolean, default=False, nullable=False)
     created_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
     updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now(), nullable=False)
     
+    __table_args__ = (
+        Index("ix_users_created_at_live", created_at,
+              postgresql_where=is_deleted == False, sqlite_where=is_deleted == False),
+    )
+    
     trips = relationship("Trip", back_populates="user", cascade="all, delete-orphan")
     shared_trips = relationship("SharedTrip", back_populates="user", cascade="all, delete-orphan")
+    refresh_tokens = relationship("RefreshToken", back_populates="user", cascade="all, delete-orphan", passive_deletes=True)
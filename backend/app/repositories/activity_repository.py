@@ -2,11 +2,15 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select
 from typing import Optional, List
 from app.models.activity import Activity
+from app.repositories.loader import get_loader
+from app.repositories.fieldsets import load_only_fields
+from app.utils.ids import parse_id
 
 
 class ActivityRepository:
     def __init__(self, db: AsyncSession):
         self.db = db
+        self.loader = get_loader(db)
     
     async def create(self, city_id: str, name: str, description: Optional[str],
                      category: str, estimated_cost: Optional[float] = None,
@@ -22,38 +26,43 @@ class ActivityRepository:
             image_url=image_url
         )
         self.db.add(activity)
-        await self.db.commit()
-        await self.db.refresh(activity)
+        await self.db.flush()
+        self.loader.prime(Activity, activity)
         return activity
     
     async def get_by_id(self, activity_id: str) -> Optional[Activity]:
-        result = await self.db.execute(select(Activity).where(Activity.id == activity_id))
-        return result.scalar_one_or_none()
+        return await self.loader.load(Activity, activity_id)
     
-    async def get_by_city(self, city_id: str, skip: int = 0, limit: int = 100) -> List[Activity]:
-        result = await self.db.execute(
-            select(Activity).where(Activity.city_id == city_id).offset(skip).limit(limit)
-        )
+    async def get_by_ids(self, activity_ids: List[str]) -> List[Optional[Activity]]:
+        return await self.loader.load_many(Activity, activity_ids)
+    
+    async def get_by_city(self, city_id: str, skip: int = 0, limit: int = 100,
+                          fields: Optional[List[str]] = None) -> List[Activity]:
+        city_id = parse_id(city_id)
+        if city_id is None:
+            return []
+        statement = select(Activity).where(Activity.city_id == city_id).offset(skip).limit(limit)
+        result = await self.db.execute(load_only_fields(statement, Activity, fields))
         return list(result.scalars().all())
     
-    async def get_by_category(self, category: str, skip: int = 0, limit: int = 100) -> List[Activity]:
-        result = await self.db.execute(
-            select(Activity).where(Activity.category == category).offset(skip).limit(limit)
-        )
+    async def get_by_category(self, category: str, skip: int = 0, limit: int = 100,
+                              fields: Optional[List[str]] = None) -> List[Activity]:
+        statement = select(Activity).where(Activity.category == category).offset(skip).limit(limit)
+        result = await self.db.execute(load_only_fields(statement, Activity, fields))
         return list(result.scalars().all())
     
-    async def search_by_name(self, query: str, skip: int = 0, limit: int = 50) -> List[Activity]:
+    async def search_by_name(self, query: str, skip: int = 0, limit: int = 50,
+                             fields: Optional[List[str]] = None) -> List[Activity]:
         search_pattern = f"%{query}%"
-        result = await self.db.execute(
-            select(Activity).where(Activity.name.ilike(search_pattern)).offset(skip).limit(limit)
-        )
+        statement = select(Activity).where(Activity.name.ilike(search_pattern)).offset(skip).limit(limit)
+        result = await self.db.execute(load_only_fields(statement, Activity, fields))
         return list(result.scalars().all())
     
     async def update(self, activity: Activity) -> Activity:
-        await self.db.commit()
-        await self.db.refresh(activity)
+        await self.db.flush()
         return activity
     
     async def delete(self, activity: Activity) -> None:
         await self.db.delete(activity)
-        await self.db.commit()
+        await self.db.flush()
+        self.loader.clear(Activity, activity.id)
@@ -0,0 +1,48 @@
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import select, insert, delete
+from typing import List
+from datetime import datetime
+from app.models.trip import Trip
+from app.models.itinerary_day import ItineraryDay
+from app.models.itinerary_item import ItineraryItem
+from app.models.budget import Budget
+from app.models.shared_trip import SharedTrip
+from app.models.archive import trips_archive, itinerary_days_archive, itinerary_items_archive, budgets_archive
+
+
+class TripArchiveRepository:
+    def __init__(self, db: AsyncSession):
+        self.db = db
+    
+    async def get_deleted_trip_ids(self, deleted_before: datetime, limit: int) -> List[str]:
+        result = await self.db.execute(
+            select(Trip.id)
+            .where(Trip.is_deleted == True, Trip.updated_at <= deleted_before)
+            .order_by(Trip.updated_at)
+            .limit(limit)
+            .with_for_update(skip_locked=True)
+        )
+        return list(result.scalars().all())
+    
+    async def _move(self, source, archive, condition) -> None:
+        columns = [column.name for column in source.columns]
+        await self.db.execute(
+            insert(archive).from_select(columns, select(*source.columns).where(condition))
+        )
+        await self.db.execute(
+            delete(source).where(condition),
+            execution_options={"synchronize_session": False}
+        )
+    
+    async def archive_trips(self, trip_ids: List[str]) -> None:
+        day_ids = select(ItineraryDay.id).where(ItineraryDay.trip_id.in_(trip_ids))
+        
+        await self._move(ItineraryItem.__table__, itinerary_items_archive,
+                         ItineraryItem.itinerary_day_id.in_(day_ids))
+        await self._move(ItineraryDay.__table__, itinerary_days_archive, ItineraryDay.trip_id.in_(trip_ids))
+        await self._move(Budget.__table__, budgets_archive, Budget.trip_id.in_(trip_ids))
+        await self.db.execute(
+            delete(SharedTrip).where(SharedTrip.trip_id.in_(trip_ids)),
+            execution_options={"synchronize_session": False}
+        )
+        await self._move(Trip.__table__, trips_archive, Trip.id.in_(trip_ids))
@@ -0,0 +1,11 @@
+from typing import Iterable, Optional
+from sqlalchemy import inspect
+from sqlalchemy.orm import load_only
+
+
+def load_only_fields(statement, model, fields: Optional[Iterable[str]]):
+    if fields is None:
+        return statement
+    columns = inspect(model).column_attrs
+    selected = [getattr(model, name) for name in fields if name in columns]
+    return statement.options(load_only(*(selected or [model.id])))
@@ -1,13 +1,17 @@
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select
-from typing import Optional, List
+from sqlalchemy import select, func
+from typing import Optional, List, Dict
+from app.models.activity import Activity
 from app.models.itinerary_day import ItineraryDay
 from app.models.itinerary_item import ItineraryItem
+from app.repositories.loader import get_loader
+from app.repositories.fieldsets import load_only_fields
 
 
 class ItineraryRepository:
     def __init__(self, db: AsyncSession):
         self.db = db
+        self.loader = get_loader(db)
     
     async def create_day(self, trip_id: str, city_id: str, day_number: int,
                          date, notes: Optional[str] = None) -> ItineraryDay:
@@ -19,28 +23,29 @@ class ItineraryRepository:
             notes=notes
         )
         self.db.add(day)
-        await self.db.commit()
-        await self.db.refresh(day)
+        await self.db.flush()
+        self.loader.prime(ItineraryDay, day)
         return day
     
     async def get_day_by_id(self, day_id: str) -> Optional[ItineraryDay]:
-        result = await self.db.execute(select(ItineraryDay).where(ItineraryDay.id == day_id))
-        return result.scalar_one_or_none()
+        return await self.loader.load(ItineraryDay, day_id)
     
-    async def get_days_by_trip(self, trip_id: str) -> List[ItineraryDay]:
-        result = await self.db.execute(
-            select(ItineraryDay).where(ItineraryDay.trip_id == trip_id).order_by(ItineraryDay.day_number)
-        )
-        return list(result.scalars().all())
+    async def get_days_by_trip(self, trip_id: str, fields: Optional[List[str]] = None) -> List[ItineraryDay]:
+        statement = select(ItineraryDay).where(ItineraryDay.trip_id == trip_id).order_by(ItineraryDay.day_number)
+        result = await self.db.execute(load_only_fields(statement, ItineraryDay, fields))
+        days = list(result.scalars().all())
+        if fields is None:
+            self.loader.prime_many(ItineraryDay, days)
+        return days
     
     async def update_day(self, day: ItineraryDay) -> ItineraryDay:
-        await self.db.commit()
-        await self.db.refresh(day)
+        await self.db.flush()
         return day
     
     async def delete_day(self, day: ItineraryDay) -> None:
         await self.db.delete(day)
-        await self.db.commit()
+        await self.db.flush()
+        self.loader.clear(ItineraryDay, day.id)
     
     async def create_item(self, itinerary_day_id: str, activity_id: Optional[str],
                           order_index: int, start_time: Optional[str] = None,
@@ -56,27 +61,41 @@ class ItineraryRepository:
             custom_notes=custom_notes
         )
         self.db.add(item)
-        await self.db.commit()
-        await self.db.refresh(item)
+        await self.db.flush()
+        self.loader.prime(ItineraryItem, item)
         return item
     
     async def get_item_by_id(self, item_id: str) -> Optional[ItineraryItem]:
-        result = await self.db.execute(select(ItineraryItem).where(ItineraryItem.id == item_id))
-        return result.scalar_one_or_none()
+        return await self.loader.load(ItineraryItem, item_id)
     
-    async def get_items_by_day(self, day_id: str) -> List[ItineraryItem]:
+    async def activity_costs_by_category(self, trip_id: str) -> Dict[str, float]:
         result = await self.db.execute(
+            select(Activity.category, func.sum(Activity.estimated_cost))
+            .select_from(ItineraryItem)
+            .join(ItineraryDay, ItineraryItem.itinerary_day_id == ItineraryDay.id)
+            .join(Activity, ItineraryItem.activity_id == Activity.id)
+            .where(ItineraryDay.trip_id == trip_id)
+            .group_by(Activity.category)
+        )
+        return {category: cost or 0.0 for category, cost in result.all()}
+    
+    async def get_items_by_day(self, day_id: str, fields: Optional[List[str]] = None) -> List[ItineraryItem]:
+        statement = (
             select(ItineraryItem)
             .where(ItineraryItem.itinerary_day_id == day_id)
             .order_by(ItineraryItem.order_index)
         )
-        return list(result.scalars().all())
+        result = await self.db.execute(load_only_fields(statement, ItineraryItem, fields))
+        items = list(result.scalars().all())
+        if fields is None:
+            self.loader.prime_many(ItineraryItem, items)
+        return items
     
     async def update_item(self, item: ItineraryItem) -> ItineraryItem:
-        await self.db.commit()
-        await self.db.refresh(item)
+        await self.db.flush()
         return item
     
     async def delete_item(self, item: ItineraryItem) -> None:
         await self.db.delete(item)
-        await self.db.commit()
+        await self.db.flush()
+        self.loader.clear(ItineraryItem, item.id)
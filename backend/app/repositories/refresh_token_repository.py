@@ -0,0 +1,70 @@
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import select, update, delete, func
+from typing import Optional
+from datetime import datetime
+from app.models.refresh_token import RefreshToken
+
+
+class RefreshTokenRepository:
+    def __init__(self, db: AsyncSession):
+        self.db = db
+    
+    async def create(self, token_hash: str, user_id: str, family_id: str,
+                     expires_at: datetime) -> RefreshToken:
+        refresh_token = RefreshToken(
+            token_hash=token_hash,
+            user_id=user_id,
+            family_id=family_id,
+            expires_at=expires_at
+        )
+        self.db.add(refresh_token)
+        await self.db.flush()
+        return refresh_token
+    
+    async def get_by_hash(self, token_hash: str) -> Optional[RefreshToken]:
+        result = await self.db.execute(select(RefreshToken).where(RefreshToken.token_hash == token_hash))
+        return result.scalar_one_or_none()
+    
+    async def claim(self, token_hash: str) -> Optional[str]:
+        result = await self.db.execute(
+            update(RefreshToken)
+            .where(
+                RefreshToken.token_hash == token_hash,
+                RefreshToken.used_at.is_(None),
+                RefreshToken.revoked_at.is_(None),
+                RefreshToken.expires_at > func.now()
+            )
+            .values(used_at=func.now())
+            .returning(RefreshToken.family_id),
+            execution_options={"synchronize_session": False}
+        )
+        return result.scalar_one_or_none()
+    
+    async def revoke_family(self, family_id: str) -> None:
+        await self.db.execute(
+            update(RefreshToken)
+            .where(RefreshToken.family_id == family_id, RefreshToken.revoked_at.is_(None))
+            .values(revoked_at=func.now()),
+            execution_options={"synchronize_session": False}
+        )
+    
+    async def revoke_user(self, user_id: str) -> None:
+        await self.db.execute(
+            update(RefreshToken)
+            .where(RefreshToken.user_id == user_id, RefreshToken.revoked_at.is_(None))
+            .values(revoked_at=func.now()),
+            execution_options={"synchronize_session": False}
+        )
+    
+    async def purge_expired(self, batch_size: int) -> int:
+        expired = (
+            select(RefreshToken.id)
+            .where(RefreshToken.expires_at <= func.now())
+            .limit(batch_size)
+            .scalar_subquery()
+        )
+        result = await self.db.execute(
+            delete(RefreshToken).where(RefreshToken.id.in_(expired)),
+            execution_options={"synchronize_session": False}
+        )
+        return result.rowcount
@@ -3,11 +3,13 @@ from sqlalchemy import select
 from typing import Optional, List
 from datetime import datetime
 from app.models.shared_trip import SharedTrip
+from app.repositories.loader import get_loader
 
 
 class SharedTripRepository:
     def __init__(self, db: AsyncSession):
         self.db = db
+        self.loader = get_loader(db)
     
     async def create(self, trip_id: str, user_id: str, share_token: str,
                      expires_at: Optional[datetime] = None) -> SharedTrip:
@@ -18,13 +20,12 @@ class SharedTripRepository:
             expires_at=expires_at
         )
         self.db.add(shared_trip)
-        await self.db.commit()
-        await self.db.refresh(shared_trip)
+        await self.db.flush()
+        self.loader.prime(SharedTrip, shared_trip)
         return shared_trip
     
     async def get_by_id(self, shared_trip_id: str) -> Optional[SharedTrip]:
-        result = await self.db.execute(select(SharedTrip).where(SharedTrip.id == shared_trip_id))
-        return result.scalar_one_or_none()
+        return await self.loader.load(SharedTrip, shared_trip_id)
     
     async def get_by_token(self, share_token: str) -> Optional[SharedTrip]:
         result = await self.db.execute(select(SharedTrip).where(SharedTrip.share_token == share_token))
@@ -36,4 +37,5 @@ class SharedTripRepository:
     
     async def delete(self, shared_trip: SharedTrip) -> None:
         await self.db.delete(shared_trip)
-        await self.db.commit()
+        await self.db.flush()
+        self.loader.clear(SharedTrip, shared_trip.id)
@@ -1,12 +1,16 @@
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select
+from sqlalchemy import Row, select
 from typing import Optional, List
+from app.config import settings
 from app.models.trip import Trip
+from app.repositories.loader import get_loader
+from app.repositories.fieldsets import load_only_fields
 
 
 class TripRepository:
     def __init__(self, db: AsyncSession):
         self.db = db
+        self.loader = get_loader(db)
     
     async def create(self, user_id: str, title: str, description: Optional[str], 
                      start_date, end_date) -> Trip:
@@ -18,36 +22,49 @@ class TripRepository:
             end_date=end_date
         )
         self.db.add(trip)
-        await self.db.commit()
-        await self.db.refresh(trip)
+        await self.db.flush()
+        self.loader.prime(Trip, trip)
         return trip
     
     async def get_by_id(self, trip_id: str) -> Optional[Trip]:
-        result = await self.db.execute(
-            select(Trip).where(Trip.id == trip_id, Trip.is_deleted == False)
-        )
-        return result.scalar_one_or_none()
+        trip = await self.loader.load(Trip, trip_id)
+        if not trip or trip.is_deleted:
+            return None
+        return trip
     
-    async def get_by_user(self, user_id: str, skip: int = 0, limit: int = 100) -> List[Trip]:
-        result = await self.db.execute(
-            select(Trip)
+    async def get_by_user(self, user_id: str, skip: int = 0, limit: int = 100,
+                          fields: Optional[List[str]] = None, *columns) -> List[Row]:
+        statement = (
+            select(Trip, *columns)
             .where(Trip.user_id == user_id, Trip.is_deleted == False)
+            .order_by(Trip.created_at)
             .offset(skip)
             .limit(limit)
         )
-        return list(result.scalars().all())
+        result = await self.db.execute(load_only_fields(statement, Trip, fields))
+        rows = list(result.all())
+        if fields is None:
+            self.loader.prime_many(Trip, [row[0] for row in rows])
+        return rows
     
     async def update(self, trip: Trip) -> Trip:
-        await self.db.commit()
-        await self.db.refresh(trip)
+        await self.db.flush()
         return trip
     
     async def soft_delete(self, trip: Trip) -> None:
         trip.is_deleted = True
-        await self.db.commit()
+        await self.db.flush()
     
-    async def get_all(self, skip: int = 0, limit: int = 100) -> List[Trip]:
+    async def get_all(self, skip: int = 0, limit: int = 100, *columns) -> List[Row]:
         result = await self.db.execute(
-            select(Trip).where(Trip.is_deleted == False).offset(skip).limit(limit)
+            select(Trip, *columns).where(Trip.is_deleted == False).order_by(Trip.created_at).offset(skip).limit(limit)
+        )
+        rows = list(result.all())
+        self.loader.prime_many(Trip, [row[0] for row in rows])
+        return rows
+    
+    async def stream_all(self, *columns, skip: int = 0, limit: int = 100):
+        return await self.db.stream(
+            select(Trip, *columns).where(Trip.is_deleted == False).order_by(Trip.created_at).offset(skip).limit(limit)
+            .execution_options(yield_per=settings.DB_STREAM_YIELD_PER)
         )
-        return list(result.scalars().all())
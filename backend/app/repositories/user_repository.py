@@ -1,47 +1,58 @@
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select
 from typing import Optional, List
+from app.config import settings
 from app.models.user import User
+from app.repositories.loader import get_loader
+from app.repositories.upsert import insert_or_ignore
 
 
 class UserRepository:
     def __init__(self, db: AsyncSession):
         self.db = db
+        self.loader = get_loader(db)
     
-    async def create(self, email: str, hashed_password: str, name: str) -> User:
-        user = User(email=email, password=hashed_password, name=name)
-        self.db.add(user)
-        await self.db.commit()
-        await self.db.refresh(user)
+    async def create(self, email: str, hashed_password: str, name: str) -> Optional[User]:
+        user = await insert_or_ignore(
+            self.db, User,
+            {"email": email, "password": hashed_password, "name": name},
+            conflict_columns=[User.email]
+        )
+        if user:
+            self.loader.prime(User, user)
         return user
     
     async def get_by_id(self, user_id: str) -> Optional[User]:
-        result = await self.db.execute(
-            select(User).where(User.id == user_id, User.is_deleted == False)
-        )
-        return result.scalar_one_or_none()
+        user = await self.loader.load(User, user_id)
+        if not user or user.is_deleted:
+            return None
+        return user
     
     async def get_by_email(self, email: str) -> Optional[User]:
         result = await self.db.execute(
             select(User).where(User.email == email, User.is_deleted == False)
         )
-        return result.scalar_one_or_none()
+        user = result.scalar_one_or_none()
+        if user:
+            self.loader.prime(User, user)
+        return user
     
     async def update(self, user: User) -> User:
-        await self.db.commit()
-        await self.db.refresh(user)
+        await self.db.flush()
         return user
     
     async def soft_delete(self, user: User) -> None:
         user.is_deleted = True
-        await self.db.commit()
-    
-    async def update_refresh_token(self, user: User, refresh_token: Optional[str]) -> None:
-        user.refresh_token = refresh_token
-        await self.db.commit()
+        await self.db.flush()
     
     async def get_all(self, skip: int = 0, limit: int = 100) -> List[User]:
         result = await self.db.execute(
-            select(User).where(User.is_deleted == False).offset(skip).limit(limit)
+            select(User).where(User.is_deleted == False).order_by(User.created_at).offset(skip).limit(limit)
         )
         return list(result.scalars().all())
+    
+    async def stream_all(self, skip: int = 0, limit: int = 100):
+        return await self.db.stream_scalars(
+            select(User).where(User.is_deleted == False).order_by(User.created_at).offset(skip).limit(limit)
+            .execution_options(yield_per=settings.DB_STREAM_YIELD_PER)
+        )
@@ -1,4 +1,4 @@
-from app.routers import auth, users, trips, cities, activities, itinerary, budgets, shared
+from app.routers import auth, users, trips, cities, activities, itinerary, budgets, shared, admin
 
 __all__ = [
     "auth",
@@ -9,4 +9,5 @@ __all__ = [
     "itinerary",
     "budgets",
     "shared",
+    "admin",
 ]
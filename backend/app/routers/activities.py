@@ -1,16 +1,18 @@
 from fastapi import APIRouter, Depends, HTTPException, status, Query
 from sqlalchemy.ext.asyncio import AsyncSession
-from typing import Optional
-from app.database import get_db
+from typing import List, Optional
+from app.database import get_db, get_read_db
 from app.services.activity_service import ActivityService
 from app.schemas.activity import ActivityCreate, ActivityUpdate, ActivityResponse
+from app.schemas.fieldsets import sparse_model
 from app.utils import ApiResponse
 from app.utils.logger import logger
+from app.middleware import statement_budget, request_deadline, sparse_fieldset, cache_compressed_response
 
 router = APIRouter(prefix="/activities", tags=["Activities"])
 
 
-@router.post("", response_model=dict, status_code=status.HTTP_201_CREATED)
+@router.post("", response_model=dict, status_code=status.HTTP_201_CREATED, dependencies=[statement_budget(2)])
 async def create_activity(
     activity_data: ActivityCreate,
     db: AsyncSession = Depends(get_db)
@@ -19,7 +21,7 @@ async def create_activity(
         service = ActivityService(db)
         activity = await service.create_activity(activity_data)
         
-        return ApiResponse.success(ActivityResponse.from_orm(activity))
+        return ApiResponse.success(ActivityResponse.model_validate(activity), status_code=status.HTTP_201_CREATED)
     except ValueError as e:
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
     except Exception as e:
@@ -27,31 +29,33 @@ async def create_activity(
         raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail="Internal server error")
 
 
-@router.get("", response_model=dict)
+@router.get("", response_model=dict, dependencies=[statement_budget(2), request_deadline(3), cache_compressed_response()])
 async def search_activities(
     query: Optional[str] = Query(None),
     city_id: Optional[str] = Query(None),
     category: Optional[str] = Query(None),
     skip: int = 0,
     limit: int = 50,
-    db: AsyncSession = Depends(get_db)
+    fields: Optional[List[str]] = sparse_fieldset(ActivityResponse),
+    db: AsyncSession = Depends(get_read_db)
 ):
     try:
         service = ActivityService(db)
         
         if query:
-            activities = await service.search_activities(query, skip, limit)
+            activities = await service.search_activities(query, skip, limit, fields)
         elif city_id:
-            activities = await service.get_activities_by_city(city_id, skip, limit)
+            activities = await service.get_activities_by_city(city_id, skip, limit, fields)
         elif category:
-            activities = await service.get_activities_by_category(category, skip, limit)
+            activities = await service.get_activities_by_category(category, skip, limit, fields)
         else:
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
                 detail="Provide query, city_id, or category parameter"
             )
         
-        return ApiResponse.success([ActivityResponse.from_orm(activity) for activity in activities])
+        response_model = sparse_model(ActivityResponse, fields)
+        return ApiResponse.success([response_model.model_validate(activity) for activity in activities])
     except ValueError as e:
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
     except HTTPException:
@@ -61,10 +65,10 @@ async def search_activities(
         raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail="Internal server error")
 
 
-@router.get("/{activity_id}", response_model=dict)
+@router.get("/{activity_id}", response_model=dict, dependencies=[statement_budget(1), cache_compressed_response()])
 async def get_activity(
     activity_id: str,
-    db: AsyncSession = Depends(get_db)
+    db: AsyncSession = Depends(get_read_db)
 ):
     try:
         service = ActivityService(db)
@@ -73,7 +77,7 @@ async def get_activity(
         if not activity:
             raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Activity not found")
         
-        return ApiResponse.success(ActivityResponse.from_orm(activity))
+        return ApiResponse.success(ActivityResponse.model_validate(activity))
     except HTTPException:
         raise
     except Exception as e:
@@ -81,7 +85,7 @@ async def get_activity(
         raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail="Internal server error")
 
 
-@router.put("/{activity_id}", response_model=dict)
+@router.put("/{activity_id}", response_model=dict, dependencies=[statement_budget(2)])
 async def update_activity(
     activity_id: str,
     activity_data: ActivityUpdate,
@@ -94,7 +98,7 @@ async def update_activity(
         if not activity:
             raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Activity not found")
         
-        return ApiResponse.success(ActivityResponse.from_orm(activity))
+        return ApiResponse.success(ActivityResponse.model_validate(activity))
     except HTTPException:
         raise
     except Exception as e:
@@ -102,7 +106,7 @@ async def update_activity(
         raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail="Internal server error")
 
 
-@router.delete("/{activity_id}", response_model=dict)
+@router.delete("/{activity_id}", response_model=dict, dependencies=[statement_budget(3)])
 async def delete_activity(
     activity_id: str,
     db: AsyncSession = Depends(get_db)
@@ -1,16 +1,16 @@
 from fastapi import APIRouter, Depends, HTTPException, status
 from sqlalchemy.ext.asyncio import AsyncSession
-from app.database import get_db
+from app.database import get_db, get_read_db
 from app.services.budget_service import BudgetService
 from app.schemas.budget import BudgetCreate, BudgetUpdate, BudgetResponse
 from app.utils import ApiResponse
 from app.utils.logger import logger
-from app.middleware import get_current_user_id
+from app.middleware import get_current_user_id, statement_budget, request_deadline
 
 router = APIRouter(prefix="/budgets", tags=["Budgets"])
 
 
-@router.post("", response_model=dict, status_code=status.HTTP_201_CREATED)
+@router.post("", response_model=dict, status_code=status.HTTP_201_CREATED, dependencies=[statement_budget(3)])
 async def create_budget(
     budget_data: BudgetCreate,
     current_user_id: str = Depends(get_current_user_id),
@@ -20,7 +20,7 @@ async def create_budget(
         service = BudgetService(db)
         budget = await service.create_budget(current_user_id, budget_data)
         
-        return ApiResponse.success(BudgetResponse.from_orm(budget))
+        return ApiResponse.success(BudgetResponse.model_validate(budget), status_code=status.HTTP_201_CREATED)
     except ValueError as e:
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
     except Exception as e:
@@ -28,11 +28,11 @@ async def create_budget(
         raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail="Internal server error")
 
 
-@router.get("/trips/{trip_id}", response_model=dict)
+@router.get("/trips/{trip_id}", response_model=dict, dependencies=[statement_budget(3), request_deadline(5)])
 async def get_trip_budget(
     trip_id: str,
     current_user_id: str = Depends(get_current_user_id),
-    db: AsyncSession = Depends(get_db)
+    db: AsyncSession = Depends(get_read_db)
 ):
     try:
         service = BudgetService(db)
@@ -41,7 +41,7 @@ async def get_trip_budget(
         if not budget:
             raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Budget not found")
         
-        return ApiResponse.success(BudgetResponse.from_orm(budget))
+        return ApiResponse.success(BudgetResponse.model_validate(budget))
     except HTTPException:
         raise
     except Exception as e:
@@ -49,7 +49,7 @@ async def get_trip_budget(
         raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail="Internal server error")
 
 
-@router.put("/{budget_id}", response_model=dict)
+@router.put("/{budget_id}", response_model=dict, dependencies=[statement_budget(4)])
 async def update_budget(
     budget_id: str,
     budget_data: BudgetUpdate,
@@ -63,7 +63,7 @@ async def update_budget(
         if not budget:
             raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Budget not found")
         
-        return ApiResponse.success(BudgetResponse.from_orm(budget))
+        return ApiResponse.success(BudgetResponse.model_validate(budget))
     except HTTPException:
         raise
     except Exception as e:
@@ -71,7 +71,7 @@ async def update_budget(
         raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail="Internal server error")
 
 
-@router.delete("/{budget_id}", response_model=dict)
+@router.delete("/{budget_id}", response_model=dict, dependencies=[statement_budget(3)])
 async def delete_budget(
     budget_id: str,
     current_user_id: str = Depends(get_current_user_id),
@@ -1,17 +1,18 @@
 from fastapi import APIRouter, Depends, HTTPException, status
 from sqlalchemy.ext.asyncio import AsyncSession
-from typing import List
-from app.database import get_db
+from typing import List, Optional
+from app.database import get_db, get_read_db
 from app.services.trip_service import TripService
 from app.schemas.trip import TripCreate, TripUpdate, TripResponse
+from app.schemas.fieldsets import sparse_model
 from app.utils import ApiResponse
 from app.utils.logger import logger
-from app.middleware import get_current_user_id
+from app.middleware import get_current_user_id, statement_budget, request_deadline, sparse_fieldset
 
 router = APIRouter(prefix="/trips", tags=["Trips"])
 
 
-@router.post("", response_model=dict, status_code=status.HTTP_201_CREATED)
+@router.post("", response_model=dict, status_code=status.HTTP_201_CREATED, dependencies=[statement_budget(1)])
 async def create_trip(
     trip_data: TripCreate,
     current_user_id: str = Depends(get_current_user_id),
@@ -21,7 +22,7 @@ async def create_trip(
         service = TripService(db)
         trip = await service.create_trip(current_user_id, trip_data)
         
-        return ApiResponse.success(TripResponse.from_orm(trip))
+        return ApiResponse.success(TripResponse.model_validate(trip), status_code=status.HTTP_201_CREATED)
     except ValueError as e:
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
     except Exception as e:
@@ -29,28 +30,30 @@ async def create_trip(
         raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail="Internal server error")
 
 
-@router.get("", response_model=dict)
+@router.get("", response_model=dict, dependencies=[statement_budget(1), request_deadline(5)])
 async def get_user_trips(
     skip: int = 0,
     limit: int = 100,
+    fields: Optional[List[str]] = sparse_fieldset(TripResponse),
     current_user_id: str = Depends(get_current_user_id),
-    db: AsyncSession = Depends(get_db)
+    db: AsyncSession = Depends(get_read_db)
 ):
     try:
         service = TripService(db)
-        trips = await service.get_user_trips(current_user_id, skip, limit)
+        trips = await service.get_user_trips(current_user_id, skip, limit, fields)
         
-        return ApiResponse.success([TripResponse.from_orm(trip) for trip in trips])
+        response_model = sparse_model(TripResponse, fields)
+        return ApiResponse.success([response_model.model_validate(trip) for trip in trips])
     except Exception as e:
         logger.error(f"Get user trips error: {str(e)}")
         raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail="Internal server error")
 
 
-@router.get("/{trip_id}", response_model=dict)
+@router.get("/{trip_id}", response_model=dict, dependencies=[statement_budget(2), request_deadline(5)])
 async def get_trip(
     trip_id: str,
     current_user_id: str = Depends(get_current_user_id),
-    db: AsyncSession = Depends(get_db)
+    db: AsyncSession = Depends(get_read_db)
 ):
     try:
         service = TripService(db)
@@ -59,7 +62,7 @@ async def get_trip(
         if not trip or trip.user_id != current_user_id:
             raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Trip not found")
         
-        return ApiResponse.success(TripResponse.from_orm(trip))
+        return ApiResponse.success(TripResponse.model_validate(trip))
     except HTTPException:
         raise
     except Exception as e:
@@ -67,7 +70,7 @@ async def get_trip(
         raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail="Internal server error")
 
 
-@router.put("/{trip_id}", response_model=dict)
+@router.put("/{trip_id}", response_model=dict, dependencies=[statement_budget(2)])
 async def update_trip(
     trip_id: str,
     trip_data: TripUpdate,
@@ -81,7 +84,7 @@ async def update_trip(
         if not trip:
             raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Trip not found")
         
-        return ApiResponse.success(TripResponse.from_orm(trip))
+        return ApiResponse.success(TripResponse.model_validate(trip))
     except ValueError as e:
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
     except HTTPException:
@@ -91,7 +94,7 @@ async def update_trip(
         raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail="Internal server error")
 
 
-@router.delete("/{trip_id}", response_model=dict)
+@router.delete("/{trip_id}", response_model=dict, dependencies=[statement_budget(2)])
 async def delete_trip(
     trip_id: str,
     current_user_id: str = Depends(get_current_user_id),
@@ -1,17 +1,17 @@
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, status, Query
 from sqlalchemy.ext.asyncio import AsyncSession
 from typing import List
-from app.database import get_db
+from app.database import get_db, read_session
 from app.services.user_service import UserService
 from app.schemas.user import UserUpdate, UserResponse
 from app.utils import ApiResponse
 from app.utils.logger import logger
-from app.middleware import get_current_user_id
+from app.middleware import get_current_user_id, require_admin, statement_budget, request_deadline
 
 router = APIRouter(prefix="/users", tags=["Users"])
 
 
-@router.get("/me", response_model=dict)
+@router.get("/me", response_model=dict, dependencies=[statement_budget(1)])
 async def get_current_user(
     current_user_id: str = Depends(get_current_user_id),
     db: AsyncSession = Depends(get_db)
@@ -23,7 +23,7 @@ async def get_current_user(
         if not user:
             raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="User not found")
         
-        return ApiResponse.success(UserResponse.from_orm(user))
+        return ApiResponse.success(UserResponse.model_validate(user))
     except HTTPException:
         raise
     except Exception as e:
@@ -31,7 +31,7 @@ async def get_current_user(
         raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail="Internal server error")
 
 
-@router.put("/me", response_model=dict)
+@router.put("/me", response_model=dict, dependencies=[statement_budget(2)])
 async def update_current_user(
     user_data: UserUpdate,
     current_user_id: str = Depends(get_current_user_id),
@@ -44,7 +44,7 @@ async def update_current_user(
         if not user:
             raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="User not found")
         
-        return ApiResponse.success(UserResponse.from_orm(user))
+        return ApiResponse.success(UserResponse.model_validate(user))
     except ValueError as e:
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
     except HTTPException:
@@ -54,7 +54,7 @@ async def update_current_user(
         raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail="Internal server error")
 
 
-@router.delete("/me", response_model=dict)
+@router.delete("/me", response_model=dict, dependencies=[statement_budget(3)])
 async def delete_current_user(
     current_user_id: str = Depends(get_current_user_id),
     db: AsyncSession = Depends(get_db)
@@ -74,17 +74,19 @@ async def delete_current_user(
         raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail="Internal server error")
 
 
-@router.get("", response_model=dict)
+@router.get("", response_model=dict, dependencies=[statement_budget(1), request_deadline(0, cancel_on_disconnect=False)])
 async def get_all_users(
-    skip: int = 0,
-    limit: int = 100,
-    db: AsyncSession = Depends(get_db)
+    skip: int = Query(0, ge=0),
+    limit: int = Query(100, ge=1, le=10000),
+    admin: dict = Depends(require_admin)
 ):
+    async def users():
+        async with read_session() as db:
+            async for user in UserService(db).stream_all_users(skip, limit):
+                yield UserResponse.model_validate(user)
+    
     try:
-        service = UserService(db)
-        users = await service.get_all_users(skip, limit)
-        
-        return ApiResponse.success([UserResponse.from_orm(user) for user in users])
+        return await ApiResponse.stream(users())
     except Exception as e:
         logger.error(f"Get all users error: {str(e)}")
         raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail="Internal server error")
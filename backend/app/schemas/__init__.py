@@ -8,6 +8,7 @@ from app.schemas.itinerary import (
 )
 from app.schemas.budget import BudgetCreate, BudgetUpdate, BudgetResponse
 from app.schemas.shared_trip import SharedTripCreate, SharedTripResponse
+from app.schemas.fieldsets import parse_fields, sparse_model
 
 __all__ = [
     "UserCreate",
@@ -36,4 +37,6 @@ __all__ = [
     "BudgetResponse",
     "SharedTripCreate",
     "SharedTripResponse",
+    "parse_fields",
+    "sparse_model",
 ]
@@ -1,4 +1,4 @@
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, model_validator
 from typing import Optional
 from datetime import datetime
 
@@ -48,27 +48,7 @@ class BudgetResponse(BaseModel):
     class Config:
         from_attributes = True
     
-    @classmethod
-    def from_orm(cls, obj):
-        data = {
-            'id': obj.id,
-            'trip_id': obj.trip_id,
-            'total_budget': obj.total_budget,
-            'accommodation': obj.accommodation,
-            'transportation': obj.transportation,
-            'food': obj.food,
-            'activities': obj.activities,
-            'shopping': obj.shopping,
-            'other': obj.other,
-            'spent_accommodation': getattr(obj, 'spent_accommodation', 0.0),
-            'spent_transportation': getattr(obj, 'spent_transportation', 0.0),
-            'spent_food': getattr(obj, 'spent_food', 0.0),
-            'spent_activities': getattr(obj, 'spent_activities', 0.0),
-            'spent_shopping': getattr(obj, 'spent_shopping', 0.0),
-            'spent_other': getattr(obj, 'spent_other', 0.0),
-            'total_spent': getattr(obj, 'total_spent', 0.0),
-            'remaining_budget': obj.total_budget - getattr(obj, 'total_spent', 0.0),
-            'created_at': obj.created_at,
-            'updated_at': obj.updated_at
-        }
-        return cls(**data)
+    @model_validator(mode="after")
+    def compute_remaining_budget(self):
+        self.remaining_budget = self.total_budget - self.total_spent
+        return self
@@ -0,0 +1,32 @@
+from functools import lru_cache
+from typing import List, Optional, Tuple, Type
+from pydantic import BaseModel, create_model
+
+
+def parse_fields(schema, raw: Optional[str]) -> Optional[List[str]]:
+    if raw is None:
+        return None
+    requested = {name.strip() for name in raw.split(",") if name.strip()}
+    if not requested:
+        return None
+    unknown = requested - set(schema.model_fields)
+    if unknown:
+        raise ValueError(f"Unknown fields: {', '.join(sorted(unknown))}")
+    return [name for name in schema.model_fields if name in requested]
+
+
+@lru_cache(maxsize=256)
+def _partial_model(schema, fields: Tuple[str, ...]):
+    # Subclass the full schema so its config and validators carry over, then
+    # drop the fields that were not requested.
+    model = create_model(f"{schema.__name__}Fields", __base__=schema)
+    for name in set(model.model_fields) - set(fields):
+        del model.model_fields[name]
+    model.model_rebuild(force=True)
+    return model
+
+
+def sparse_model(schema, fields: Optional[List[str]]) -> Type[BaseModel]:
+    if fields is None:
+        return schema
+    return _partial_model(schema, tuple(fields))
@@ -0,0 +1,65 @@
+import gc
+import os
+import shutil
+from gunicorn.app.base import BaseApplication
+from uvicorn.workers import UvicornWorker
+from app.config import settings
+from app.utils.logger import share_log_file
+
+
+class UvloopWorker(UvicornWorker):
+    CONFIG_KWARGS = {"loop": "uvloop", "http": "httptools", "lifespan": "on"}
+
+
+def worker_count() -> int:
+    return settings.WEB_WORKERS or os.cpu_count() or 1
+
+
+def reset_multiprocess_dir() -> None:
+    directory = settings.PROMETHEUS_MULTIPROC_DIR
+    if not directory:
+        return
+    shutil.rmtree(directory, ignore_errors=True)
+    os.makedirs(directory, exist_ok=True)
+
+
+def _when_ready(server) -> None:
+    gc.freeze()
+    server.log.info(f"Preloaded {settings.APP_NAME}, starting {server.num_workers} workers")
+
+
+def _child_exit(server, worker) -> None:
+    from app.utils.metrics import mark_worker_dead
+    mark_worker_dead(worker.pid)
+
+
+class ProductionServer(BaseApplication):
+    def __init__(self, options: dict):
+        self.options = options
+        super().__init__()
+    
+    def load_config(self) -> None:
+        for key, value in self.options.items():
+            self.cfg.set(key, value)
+    
+    def load(self):
+        from app.main import app
+        return app
+
+
+def serve() -> None:
+    reset_multiprocess_dir()
+    share_log_file()
+    ProductionServer({
+        "bind": f"{settings.HOST}:{settings.PORT}",
+        "workers": worker_count(),
+        "worker_class": "app.server.UvloopWorker",
+        "preload_app": settings.WEB_PRELOAD,
+        "max_requests": settings.WEB_MAX_REQUESTS,
+        "max_requests_jitter": settings.WEB_MAX_REQUESTS_JITTER,
+        "graceful_timeout": settings.WEB_GRACEFUL_TIMEOUT_SECONDS,
+        "timeout": settings.WEB_WORKER_TIMEOUT_SECONDS,
+        "keepalive": settings.WEB_KEEPALIVE_SECONDS,
+        "when_ready": _when_ready,
+        "child_exit": _child_exit,
+    }).run()
@@ -5,6 +5,9 @@ from app.services.activity_service import ActivityService
 from app.services.itinerary_service import ItineraryService
 from app.services.budget_service import BudgetService
 from app.services.shared_trip_service import SharedTripService
+from app.services.refresh_token_service import RefreshTokenService
+from app.services.archive_service import TripArchiveService
+from app.utils.tracing import trace_methods
 
 __all__ = [
     "UserService",
@@ -14,4 +17,10 @@ __all__ = [
     "ItineraryService",
     "BudgetService",
     "SharedTripService",
+    "RefreshTokenService",
+    "TripArchiveService",
 ]
+
+for _name in __all__:
+    if _name.endswith("Service"):
+        trace_methods(globals()[_name])
@@ -0,0 +1,38 @@
+import asyncio
+from datetime import datetime, timedelta, timezone
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.database import AsyncSessionLocal, get_uow
+from app.repositories.archive_repository import TripArchiveRepository
+from app.utils.logger import logger
+
+
+class TripArchiveService:
+    def __init__(self, db: AsyncSession):
+        self.repository = TripArchiveRepository(db)
+        self.uow = get_uow(db)
+    
+    async def archive_deleted_trips(self, batch_size: int, grace_seconds: int) -> int:
+        deleted_before = datetime.now(timezone.utc) - timedelta(seconds=grace_seconds)
+        archived = 0
+        while True:
+            async with self.uow.transaction():
+                trip_ids = await self.repository.get_deleted_trip_ids(deleted_before, batch_size)
+                if trip_ids:
+                    await self.repository.archive_trips(trip_ids)
+            await self.uow.commit()
+            archived += len(trip_ids)
+            if len(trip_ids) < batch_size:
+                return archived
+            await asyncio.sleep(0)
+
+
+async def run_trip_archiver(interval_seconds: int, batch_size: int, grace_seconds: int) -> None:
+    while True:
+        try:
+            async with AsyncSessionLocal() as session:
+                archived = await TripArchiveService(session).archive_deleted_trips(batch_size, grace_seconds)
+            if archived:
+                logger.info(f"Archived {archived} deleted trips")
+        except Exception as e:
+            logger.error(f"Trip archive error: {str(e)}")
+        await asyncio.sleep(interval_seconds)
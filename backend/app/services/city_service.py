@@ -1,5 +1,6 @@
 from typing import Optional, List
 from sqlalchemy.ext.asyncio import AsyncSession
+from app.database import get_uow
 from app.repositories.city_repository import CityRepository
 from app.schemas.city import CityCreate, CityUpdate
 from app.models.city import City
@@ -8,31 +9,31 @@ from app.models.city import City
 class CityService:
     def __init__(self, db: AsyncSession):
         self.repository = CityRepository(db)
+        self.uow = get_uow(db)
     
     async def create_city(self, city_data: CityCreate) -> City:
-        existing_city = await self.repository.get_by_name_and_country(
-            city_data.name, city_data.country
-        )
-        if existing_city:
+        async with self.uow.transaction():
+            city = await self.repository.create(
+                name=city_data.name,
+                country=city_data.country,
+                description=city_data.description,
+                image_url=city_data.image_url
+            )
+        if not city:
             raise ValueError("City already exists")
-        
-        return await self.repository.create(
-            name=city_data.name,
-            country=city_data.country,
-            description=city_data.description,
-            image_url=city_data.image_url
-        )
+        return city
     
     async def get_city_by_id(self, city_id: str) -> Optional[City]:
         return await self.repository.get_by_id(city_id)
     
-    async def search_cities(self, query: str, skip: int = 0, limit: int = 50) -> List[City]:
+    async def search_cities(self, query: str, skip: int = 0, limit: int = 50,
+                            fields: Optional[List[str]] = None) -> List[City]:
         if not query or len(query) < 2:
-            return await self.repository.get_all(skip, limit)
-        return await self.repository.search(query, skip, limit)
+            return await self.repository.get_all(skip, limit, fields)
+        return await self.repository.search(query, skip, limit, fields)
     
-    async def get_all_cities(self, skip: int = 0, limit: int = 100) -> List[City]:
-        return await self.repository.get_all(skip, limit)
+    async def get_all_cities(self, skip: int = 0, limit: int = 100, fields: Optional[List[str]] = None) -> List[City]:
+        return await self.repository.get_all(skip, limit, fields)
     
     async def update_city(self, city_id: str, city_data: CityUpdate) -> Optional[City]:
         city = await self.repository.get_by_id(city_id)
@@ -48,11 +49,13 @@ class CityService:
         if city_data.image_url is not None:
             city.image_url = city_data.image_url
         
-        return await self.repository.update(city)
+        async with self.uow.transaction():
+            return await self.repository.update(city)
     
     async def delete_city(self, city_id: str) -> bool:
         city = await self.repository.get_by_id(city_id)
         if not city:
             return False
-        await self.repository.delete(city)
+        async with self.uow.transaction():
+            await self.repository.delete(city)
         return True
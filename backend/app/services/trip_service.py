@@ -1,16 +1,22 @@
-from typing import Optional, List
+from typing import Optional, List, AsyncIterator
 from sqlalchemy.ext.asyncio import AsyncSession
+from app.database import get_uow
 from sqlalchemy import select, func
 from datetime import datetime
 from app.repositories.trip_repository import TripRepository
 from app.repositories.budget_repository import BudgetRepository
 from app.repositories.itinerary_repository import ItineraryRepository
+from app.repositories.activity_repository import ActivityRepository
 from app.schemas.trip import TripCreate, TripUpdate
 from app.models.trip import Trip
 from app.models.itinerary_day import ItineraryDay
 from app.models.itinerary_item import ItineraryItem
-from app.models.activity import Activity
 from app.models.city import City
+from app.models.activity import Activity
+from app.models.budget import Budget
+
+_BUDGET_FIELDS = {"total_budget", "total_spent", "remaining_budget"}
+_COMPUTED_FIELDS = {"duration_days", "itinerary_days_count", "cities_count", "activities_count"} | _BUDGET_FIELDS
 
 
 class TripService:
@@ -18,19 +24,22 @@ class TripService:
         self.repository = TripRepository(db)
         self.budget_repository = BudgetRepository(db)
         self.itinerary_repository = ItineraryRepository(db)
+        self.activity_repository = ActivityRepository(db)
+        self.uow = get_uow(db)
         self.db = db
     
     async def create_trip(self, user_id: str, trip_data: TripCreate) -> Trip:
         if trip_data.end_date <= trip_data.start_date:
             raise ValueError("End date must be after start date")
         
-        return await self.repository.create(
-            user_id=user_id,
-            title=trip_data.title,
-            description=trip_data.description,
-            start_date=trip_data.start_date,
-            end_date=trip_data.end_date
-        )
+        async with self.uow.transaction():
+            return await self.repository.create(
+                user_id=user_id,
+                title=trip_data.title,
+                description=trip_data.description,
+                start_date=trip_data.start_date,
+                end_date=trip_data.end_date
+            )
     
     async def get_trip_by_id(self, trip_id: str) -> Optional[Trip]:
         trip = await self.repository.get_by_id(trip_id)
@@ -38,10 +47,17 @@ class TripService:
             await self._enrich_trip_with_computed_data(trip)
         return trip
     
-    async def get_user_trips(self, user_id: str, skip: int = 0, limit: int = 100) -> List[Trip]:
-        trips = await self.repository.get_by_user(user_id, skip, limit)
-        for trip in trips:
-            await self._enrich_trip_with_computed_data(trip)
+    async def get_user_trips(self, user_id: str, skip: int = 0, limit: int = 100,
+                             fields: Optional[List[str]] = None) -> List[Trip]:
+        columns = fields
+        if fields is not None and "duration_days" in fields:
+            columns = [*fields, "start_date", "end_date"]
+        computed = self._computed_columns(fields)
+        rows = await self.repository.get_by_user(user_id, skip, limit, columns, *computed.values())
+        trips = []
+        for trip, *values in rows:
+            self._apply_computed(trip, dict(zip(computed, values)), fields)
+            trips.append(trip)
         return trips
     
     async def update_trip(self, trip_id: str, user_id: str, trip_data: TripUpdate) -> Optional[Trip]:
@@ -61,13 +77,15 @@ class TripService:
         if trip.end_date <= trip.start_date:
             raise ValueError("End date must be after start date")
         
-        return await self.repository.update(trip)
+        async with self.uow.transaction():
+            return await self.repository.update(trip)
     
     async def delete_trip(self, trip_id: str, user_id: str) -> bool:
         trip = await self.repository.get_by_id(trip_id)
         if not trip or trip.user_id != user_id:
             return False
-        await self.repository.soft_delete(trip)
+        async with self.uow.transaction():
+            await self.repository.soft_delete(trip)
         return True
     
     async def verify_trip_ownership(self, trip_id: str, user_id: str) -> bool:
@@ -75,58 +93,71 @@ class TripService:
         return trip is not None and trip.user_id == user_id
     
     async def get_all_trips(self, skip: int = 0, limit: int = 100) -> List[Trip]:
-        trips = await self.repository.get_all(skip, limit)
-        for trip in trips:
-            await self._enrich_trip_with_computed_data(trip)
+        computed = self._computed_columns()
+        rows = await self.repository.get_all(skip, limit, *computed.values())
+        trips = []
+        for trip, *values in rows:
+            self._apply_computed(trip, dict(zip(computed, values)))
+            trips.append(trip)
         return trips
     
-    async def _enrich_trip_with_computed_data(self, trip: Trip) -> None:
-        duration_days = (trip.end_date - trip.start_date).days + 1
-        trip.duration_days = duration_days
-        
-        budget = await self.budget_repository.get_by_trip(trip.id)
-        if budget:
-            spent_total = await self._compute_trip_spent(trip.id)
-            trip.total_budget = budget.total_budget
-            trip.total_spent = spent_total
-            trip.remaining_budget = budget.total_budget - spent_total
-        else:
-            trip.total_budget = 0.0
-            trip.total_spent = 0.0
-            trip.remaining_budget = 0.0
-        
-        days = await self.itinerary_repository.get_days_by_trip(trip.id)
-        trip.itinerary_days_count = len(days)
-        
-        cities_result = await self.db.execute(
-            select(func.count(func.distinct(ItineraryDay.city_id)))
-            .where(ItineraryDay.trip_id == trip.id)
-        )
-        trip.cities_count = cities_result.scalar() or 0
-        
-        activities_result = await self.db.execute(
-            select(func.count(ItineraryItem.id))
-            .join(ItineraryDay, ItineraryItem.itinerary_day_id == ItineraryDay.id)
-            .where(
-                ItineraryDay.trip_id == trip.id,
-                ItineraryItem.activity_id.isnot(None)
+    async def stream_all_trips(self, skip: int = 0, limit: int = 100) -> AsyncIterator[Trip]:
+        computed = self._computed_columns()
+        result = await self.repository.stream_all(*computed.values(), skip=skip, limit=limit)
+        async for trip, *values in result:
+            self._apply_computed(trip, dict(zip(computed, values)))
+            yield trip
+    
+    def _computed_columns(self, fields: Optional[List[str]] = None) -> dict:
+        wanted = _COMPUTED_FIELDS if fields is None else _COMPUTED_FIELDS.intersection(fields)
+        trip_days = ItineraryDay.trip_id == Trip.id
+        columns = {}
+        if "itinerary_days_count" in wanted:
+            columns["itinerary_days_count"] = select(func.count(ItineraryDay.id)).where(trip_days).scalar_subquery()
+        if "cities_count" in wanted:
+            columns["cities_count"] = (
+                select(func.count(func.distinct(ItineraryDay.city_id))).where(trip_days).scalar_subquery()
+            )
+        if "activities_count" in wanted:
+            columns["activities_count"] = (
+                select(func.count(ItineraryItem.id))
+                .join(ItineraryDay, ItineraryItem.itinerary_day_id == ItineraryDay.id)
+                .where(trip_days, ItineraryItem.activity_id.isnot(None))
+                .scalar_subquery()
             )
-        )
-        trip.activities_count = activities_result.scalar() or 0
+        if wanted & _BUDGET_FIELDS:
+            columns["total_budget"] = select(Budget.total_budget).where(Budget.trip_id == Trip.id).scalar_subquery()
+            columns["total_spent"] = (
+                select(func.coalesce(func.sum(Activity.estimated_cost), 0.0))
+                .select_from(ItineraryItem)
+                .join(ItineraryDay, ItineraryItem.itinerary_day_id == ItineraryDay.id)
+                .join(Activity, ItineraryItem.activity_id == Activity.id)
+                .where(trip_days)
+                .scalar_subquery()
+            )
+        return columns
     
-    async def _compute_trip_spent(self, trip_id: str) -> float:
-        days = await self.itinerary_repository.get_days_by_trip(trip_id)
-        total_spent = 0.0
-        
-        for day in days:
-            items = await self.itinerary_repository.get_items_by_day(day.id)
-            for item in items:
-                if item.activity_id:
-                    result = await self.db.execute(
-                        select(Activity).where(Activity.id == item.activity_id)
-                    )
-                    activity = result.scalar_one_or_none()
-                    if activity and activity.estimated_cost:
-                        total_spent += activity.estimated_cost
-        
-        return total_spent
+    def _apply_computed(self, trip: Trip, values: dict, fields: Optional[List[str]] = None) -> None:
+        if fields is None or "duration_days" in fields:
+            trip.duration_days = (trip.end_date - trip.start_date).days + 1
+        for name in ("itinerary_days_count", "cities_count", "activities_count"):
+            if name in values:
+                setattr(trip, name, values[name] or 0)
+        if "total_budget" in values:
+            total_budget = values["total_budget"]
+            if total_budget is not None:
+                trip.total_budget = total_budget
+                trip.total_spent = values["total_spent"]
+                trip.remaining_budget = total_budget - values["total_spent"]
+            else:
+                trip.total_budget = 0.0
+                trip.total_spent = 0.0
+                trip.remaining_budget = 0.0
+    
+    async def _enrich_trip_with_computed_data(self, trip: Trip, fields: Optional[List[str]] = None) -> None:
+        computed = self._computed_columns(fields)
+        values = {}
+        if computed:
+            result = await self.db.execute(select(*computed.values()).select_from(Trip).where(Trip.id == trip.id))
+            values = dict(zip(computed, result.one()))
+        self._apply_computed(trip, values, fields)
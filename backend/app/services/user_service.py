@@ -1,32 +1,36 @@
-from typing import Optional, List
+from typing import Optional, List, AsyncIterator
 from sqlalchemy.ext.asyncio import AsyncSession
+from app.database import get_uow
 from app.repositories.user_repository import UserRepository
+from app.services.refresh_token_service import RefreshTokenService
 from app.schemas.user import UserCreate, UserUpdate
 from app.models.user import User
-from app.utils import hash_password, verify_password, create_access_token, create_refresh_token
+from app.utils import password_hasher
 
 
 class UserService:
     def __init__(self, db: AsyncSession):
         self.repository = UserRepository(db)
+        self.refresh_token_service = RefreshTokenService(db)
+        self.uow = get_uow(db)
     
     async def create_user(self, user_data: UserCreate) -> User:
-        existing_user = await self.repository.get_by_email(user_data.email)
-        if existing_user:
+        hashed_password = await password_hasher.hash(user_data.password)
+        async with self.uow.transaction():
+            user = await self.repository.create(
+                email=user_data.email,
+                hashed_password=hashed_password,
+                name=user_data.name
+            )
+        if not user:
             raise ValueError("Email already registered")
-        
-        hashed_password = hash_password(user_data.password)
-        return await self.repository.create(
-            email=user_data.email,
-            hashed_password=hashed_password,
-            name=user_data.name
-        )
+        return user
     
     async def authenticate_user(self, email: str, password: str) -> Optional[User]:
         user = await self.repository.get_by_email(email)
         if not user:
             return None
-        if not verify_password(password, user.password):
+        if not await password_hasher.verify(password, user.password):
             return None
         return user
     
@@ -36,15 +40,10 @@ class UserService:
             "email": user.email,
             "role": user.role.value
         }
-        access_token = create_access_token(payload)
-        refresh_token = create_refresh_token(payload)
-        
-        await self.repository.update_refresh_token(user, refresh_token)
-        
-        return {
-            "access_token": access_token,
-            "refresh_token": refresh_token
-        }
+        return await self.refresh_token_service.issue_tokens(payload)
+    
+    async def refresh_tokens(self, refresh_token: str) -> Optional[dict]:
+        return await self.refresh_token_service.rotate(refresh_token)
     
     async def get_user_by_id(self, user_id: str) -> Optional[User]:
         return await self.repository.get_by_id(user_id)
@@ -63,21 +62,28 @@ class UserService:
         if user_data.name:
             user.name = user_data.name
         
-        return await self.repository.update(user)
+        async with self.uow.transaction():
+            return await self.repository.update(user)
     
     async def delete_user(self, user_id: str) -> bool:
         user = await self.repository.get_by_id(user_id)
         if not user:
             return False
-        await self.repository.soft_delete(user)
+        async with self.uow.transaction():
+            await self.repository.soft_delete(user)
+            await self.refresh_token_service.revoke_user_tokens(user_id)
         return True
     
     async def logout_user(self, user_id: str) -> bool:
         user = await self.repository.get_by_id(user_id)
         if not user:
             return False
-        await self.repository.update_refresh_token(user, None)
+        await self.refresh_token_service.revoke_user_tokens(user_id)
         return True
     
     async def get_all_users(self, skip: int = 0, limit: int = 100) -> List[User]:
         return await self.repository.get_all(skip, limit)
+    
+    async def stream_all_users(self, skip: int = 0, limit: int = 100) -> AsyncIterator[User]:
+        async for user in await self.repository.stream_all(skip, limit):
+            yield user
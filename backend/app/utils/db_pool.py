@@ -0,0 +1,72 @@
+import time
+from sqlalchemy import exc
+from sqlalchemy.pool import AsyncAdaptedQueuePool
+from sqlalchemy.util.queue import AsyncAdaptedQueue, Empty
+
+
+class PoolExhaustedError(exc.TimeoutError):
+    pass
+
+
+class MonitoredQueue(AsyncAdaptedQueue):
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.waiting = 0
+        self.waits = 0
+        self.wait_seconds = 0.0
+        self.max_wait_seconds = 0.0
+
+    def get(self, block: bool = True, timeout=None):
+        try:
+            return self.get_nowait()
+        except Empty:
+            if not block:
+                raise
+
+        started = time.perf_counter()
+        self.waiting += 1
+        try:
+            return super().get(True, timeout)
+        finally:
+            self.waiting -= 1
+            waited = time.perf_counter() - started
+            self.waits += 1
+            self.wait_seconds += waited
+            self.max_wait_seconds = max(self.max_wait_seconds, waited)
+
+
+class MonitoredQueuePool(AsyncAdaptedQueuePool):
+    _queue_class = MonitoredQueue
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.checkouts = 0
+        self.timeouts = 0
+
+    def _do_get(self):
+        try:
+            connection = super()._do_get()
+        except exc.TimeoutError as e:
+            self.timeouts += 1
+            raise PoolExhaustedError(
+                f"Database connection pool exhausted: {self.checkedout()} connections in use, "
+                f"no connection freed within {self._timeout}s"
+            ) from e
+        self.checkouts += 1
+        return connection
+
+    def stats(self) -> dict:
+        queue = self._pool
+        return {
+            "size": self.size(),
+            "checked_in": self.checkedin(),
+            "checked_out": self.checkedout(),
+            "overflow": max(0, self.overflow()),
+            "max_overflow": self._max_overflow,
+            "waiting": queue.waiting,
+            "checkouts": self.checkouts,
+            "timeouts": self.timeouts,
+            "waits": queue.waits,
+            "avg_wait_ms": round(queue.wait_seconds / queue.waits * 1000, 3) if queue.waits else 0.0,
+            "max_wait_ms": round(queue.max_wait_seconds * 1000, 3),
+        }
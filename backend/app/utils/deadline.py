@@ -0,0 +1,88 @@
+import asyncio
+import math
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Optional
+import anyio
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+
+_STATEMENT_TIMEOUT_GRACE_MS = 500
+
+_current: ContextVar[Optional["Deadline"]] = ContextVar("request_deadline", default=None)
+
+
+class Deadline:
+    def __init__(self, seconds: float):
+        self.started_at = time.monotonic()
+        self.seconds = seconds
+        self.disconnected = False
+        self.scope: Optional[anyio.CancelScope] = None
+        self.watcher: Optional[asyncio.Task] = None
+
+    def bind(self, scope: anyio.CancelScope) -> None:
+        self.scope = scope
+        self.reschedule()
+
+    def reset(self, seconds: float) -> None:
+        self.seconds = seconds
+        self.reschedule()
+
+    def reschedule(self) -> None:
+        if self.scope is None:
+            return
+        remaining = self.remaining()
+        self.scope.deadline = math.inf if remaining is None else anyio.current_time() + remaining
+
+    def watch_disconnect(self, receive) -> None:
+        if self.scope is not None and self.watcher is None:
+            self.watcher = asyncio.ensure_future(self._watch(receive))
+
+    async def _watch(self, receive) -> None:
+        while (await receive())["type"] != "http.disconnect":
+            pass
+        self.disconnected = True
+        self.scope.cancel()
+
+    def close(self) -> None:
+        if self.watcher is not None:
+            self.watcher.cancel()
+
+    def remaining(self) -> Optional[float]:
+        if not self.seconds:
+            return None
+        return self.started_at + self.seconds - time.monotonic()
+
+    @property
+    def expired(self) -> bool:
+        remaining = self.remaining()
+        return remaining is not None and remaining <= 0
+
+
+def current_deadline() -> Optional[Deadline]:
+    return _current.get()
+
+
+@contextmanager
+def track_deadline(deadline: Deadline):
+    token = _current.set(deadline)
+    try:
+        yield deadline
+    finally:
+        _current.reset(token)
+
+
+@event.listens_for(Session, "after_begin")
+def _apply_statement_timeout(session, transaction, connection):
+    deadline = _current.get()
+    if deadline is None or connection.dialect.name != "postgresql":
+        return
+    remaining = deadline.remaining()
+    if remaining is None:
+        return
+    connection.exec_driver_sql(
+        f"SET LOCAL statement_timeout = {max(1, int(remaining * 1000)) + _STATEMENT_TIMEOUT_GRACE_MS}",
+        execution_options={"track_queries": False}
+    )
+
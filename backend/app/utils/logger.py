@@ -1,14 +1,176 @@
+import atexit
 import logging
+import os
+import queue
+import random
 import sys
+import time
+import zlib
+from datetime import datetime, timezone
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler, WatchedFileHandler
+import structlog
+from pydantic_core import to_json
 from app.config import settings
+from app.utils.request_id import current_request_id
 
-logging.basicConfig(
-    level=logging.DEBUG if settings.DEBUG else logging.INFO,
-    format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
-    handlers=[
-        logging.StreamHandler(sys.stdout),
-        logging.FileHandler("logs/app.log", mode="a")
-    ]
+_PUT_TIMEOUT_SECONDS = 0.1
+_DROP_REPORT_SECONDS = 10.0
+
+
+class ContextQueueHandler(QueueHandler):
+    def __init__(self, log_queue: queue.Queue):
+        super().__init__(log_queue)
+        self.dropped = 0
+        self.reported = 0
+        self.next_report = 0.0
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        if record.args:
+            record.msg = record.getMessage()
+            record.args = None
+        record.request_id = current_request_id()
+        return record
+
+    def enqueue(self, record: logging.LogRecord) -> None:
+        # Under pressure DEBUG/INFO are shed at once; warnings and errors wait
+        # briefly for the writer before they are given up on.
+        try:
+            if record.levelno >= logging.WARNING:
+                self.queue.put(record, timeout=_PUT_TIMEOUT_SECONDS)
+            else:
+                self.queue.put_nowait(record)
+        except queue.Full:
+            self.dropped += 1
+            return
+        if self.dropped > self.reported and time.monotonic() >= self.next_report:
+            self._report_dropped()
+
+    def _report_dropped(self) -> None:
+        dropped = self.dropped
+        record = logging.LogRecord(
+            settings.APP_NAME, logging.WARNING, __file__, 0,
+            f"{dropped - self.reported} log records dropped, log queue full", None, None
+        )
+        try:
+            self.queue.put_nowait(self.prepare(record))
+        except queue.Full:
+            return
+        self.reported = dropped
+        self.next_report = time.monotonic() + _DROP_REPORT_SECONDS
+
+
+class DebugSampler(logging.Filter):
+    def __init__(self, rate: float):
+        super().__init__()
+        self.threshold = int(rate * 10000)
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        if record.levelno > logging.DEBUG or self.threshold >= 10000:
+            return True
+        request_id = current_request_id()
+        if request_id is None:
+            return random.randrange(10000) < self.threshold
+        return zlib.crc32(request_id.encode()) % 10000 < self.threshold
+
+
+def _add_record_context(logger, method_name, event_dict):
+    record = event_dict.get("_record")
+    if record is not None:
+        event_dict["timestamp"] = datetime.fromtimestamp(record.created, timezone.utc).isoformat().replace("+00:00", "Z")
+        event_dict["request_id"] = getattr(record, "request_id", None)
+    return event_dict
+
+
+def _add_request_id(logger, method_name, event_dict):
+    event_dict["request_id"] = current_request_id()
+    return event_dict
+
+
+def _renderer():
+    if settings.LOG_FORMAT == "console":
+        return structlog.dev.ConsoleRenderer(colors=False)
+    return structlog.processors.JSONRenderer(serializer=lambda data, **kwargs: to_json(data, fallback=str).decode())
+
+
+def _handlers(rotate: bool = True):
+    formatter = structlog.stdlib.ProcessorFormatter(
+        foreign_pre_chain=[
+            structlog.stdlib.add_log_level,
+            structlog.stdlib.add_logger_name,
+            _add_record_context,
+        ],
+        processors=[
+            structlog.stdlib.ProcessorFormatter.remove_processors_meta,
+            structlog.processors.format_exc_info,
+            _renderer(),
+        ],
+    )
+    handlers = [logging.StreamHandler(sys.stdout)]
+    if settings.LOG_FILE:
+        directory = os.path.dirname(settings.LOG_FILE)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        if rotate:
+            handlers.append(RotatingFileHandler(
+                settings.LOG_FILE,
+                maxBytes=settings.LOG_FILE_MAX_BYTES,
+                backupCount=settings.LOG_FILE_BACKUPS,
+                encoding="utf-8"
+            ))
+        else:
+            handlers.append(WatchedFileHandler(settings.LOG_FILE, encoding="utf-8"))
+    for handler in handlers:
+        handler.setFormatter(formatter)
+    return handlers
+
+
+def _start_listener() -> None:
+    global log_listener
+    queue_handler.queue = queue.Queue(maxsize=settings.LOG_QUEUE_SIZE)
+    queue_handler.dropped = queue_handler.reported = 0
+    log_listener = QueueListener(queue_handler.queue, *file_handlers, respect_handler_level=True)
+    log_listener.start()
+
+
+def stop_logging() -> None:
+    if log_listener._thread is not None:
+        log_listener.stop()
+
+
+def share_log_file() -> None:
+    stop_logging()
+    for handler in file_handlers:
+        handler.close()
+    file_handlers[:] = _handlers(rotate=False)
+    _start_listener()
+
+
+file_handlers = _handlers()
+queue_handler = ContextQueueHandler(queue.Queue(maxsize=settings.LOG_QUEUE_SIZE))
+queue_handler.addFilter(DebugSampler(settings.LOG_DEBUG_SAMPLE_RATE))
+log_listener: QueueListener
+
+root = logging.getLogger()
+root.handlers = [queue_handler]
+root.setLevel(settings.LOG_LEVEL.upper())
+
+structlog.configure(
+    processors=[
+        structlog.stdlib.filter_by_level,
+        structlog.stdlib.add_log_level,
+        structlog.stdlib.add_logger_name,
+        structlog.processors.TimeStamper(fmt="iso", utc=True),
+        _add_request_id,
+        structlog.stdlib.PositionalArgumentsFormatter(),
+        structlog.stdlib.ProcessorFormatter.wrap_for_formatter,
+    ],
+    logger_factory=structlog.stdlib.LoggerFactory(),
+    wrapper_class=structlog.stdlib.BoundLogger,
+    cache_logger_on_first_use=True,
 )
 
+_start_listener()
+os.register_at_fork(after_in_child=_start_listener)
+atexit.register(stop_logging)
+
 logger = logging.getLogger(settings.APP_NAME)
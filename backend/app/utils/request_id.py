@@ -0,0 +1,28 @@
+import re
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Optional
+from app.utils.ids import new_id
+
+_VALID_REQUEST_ID = re.compile(r"[A-Za-z0-9._:-]{1,128}")
+
+_current: ContextVar[Optional[str]] = ContextVar("request_id", default=None)
+
+
+def accept_request_id(value: Optional[str]) -> str:
+    if value and _VALID_REQUEST_ID.fullmatch(value):
+        return value
+    return new_id()
+
+
+def current_request_id() -> Optional[str]:
+    return _current.get()
+
+
+@contextmanager
+def track_request_id(request_id: str):
+    token = _current.set(request_id)
+    try:
+        yield request_id
+    finally:
+        _current.reset(token)
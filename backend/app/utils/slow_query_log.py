@@ -0,0 +1,126 @@
+import random
+import re
+import time
+from collections import deque
+from datetime import datetime, timezone
+from typing import List, Optional
+from sqlalchemy import event
+from app.config import settings
+from app.utils.logger import logger
+from app.utils.query_tracker import abbreviate, call_site, current_query_stats, statement_shape
+
+_EXPLAIN_PREFIXES = {
+    "postgresql": "EXPLAIN (ANALYZE, BUFFERS) ",
+    "sqlite": "EXPLAIN QUERY PLAN ",
+}
+
+_LOCKING_CLAUSE = re.compile(r"\bFOR\s+(?:NO\s+KEY\s+)?UPDATE\b|\bFOR\s+(?:KEY\s+)?SHARE\b", re.IGNORECASE)
+
+
+class SlowQueryLog:
+    def __init__(self, threshold_ms: int, explain_sample_rate: float, size: int):
+        self.threshold_ms = threshold_ms
+        self.explain_sample_rate = explain_sample_rate
+        self.entries: deque = deque(maxlen=size)
+        self.total = 0
+
+    def record(self, conn, statement: str, parameters, executemany: bool, elapsed_ms: float) -> None:
+        stats = current_query_stats()
+        route = stats.route if stats is not None else "background"
+        site = call_site(depth=2)
+        shape = statement_shape(statement)
+        self.total += 1
+        logger.warning(f"Slow query {elapsed_ms:.1f}ms in {route} at {site}: {abbreviate(shape)}")
+
+        plan = None
+        if not executemany and random.random() < self.explain_sample_rate:
+            plan = self._explain(conn, statement, parameters)
+
+        self.entries.append({
+            "at": datetime.now(timezone.utc).isoformat(),
+            "duration_ms": round(elapsed_ms, 3),
+            "route": route,
+            "call_site": site,
+            "statement": shape[:2000],
+            "plan": plan,
+        })
+
+    def _explain(self, conn, statement: str, parameters) -> Optional[List[str]]:
+        dialect = conn.dialect.name
+        prefix = _EXPLAIN_PREFIXES.get(dialect)
+        if prefix is None or not statement.lstrip().upper().startswith(("SELECT", "WITH")):
+            return None
+        if _LOCKING_CLAUSE.search(statement):
+            return None
+
+        explain_cursor = conn.connection.dbapi_connection.cursor()
+        savepoint = dialect == "postgresql"
+        try:
+            if savepoint:
+                explain_cursor.execute("SAVEPOINT slow_query_explain")
+            explain_cursor.execute(prefix + statement, parameters)
+            rows = explain_cursor.fetchall()
+            if savepoint:
+                explain_cursor.execute("RELEASE SAVEPOINT slow_query_explain")
+            return [str(row[-1]) for row in rows]
+        except Exception as e:
+            logger.warning(f"Slow query EXPLAIN failed: {str(e)}")
+            if savepoint:
+                try:
+                    explain_cursor.execute("ROLLBACK TO SAVEPOINT slow_query_explain")
+                except Exception as rollback_error:
+                    logger.warning(f"Slow query EXPLAIN savepoint rollback failed: {str(rollback_error)}")
+            return None
+        finally:
+            explain_cursor.close()
+
+    def recent(self, limit: Optional[int] = None) -> List[dict]:
+        entries = list(reversed(self.entries))
+        return entries[:limit] if limit else entries
+
+    def clear(self) -> None:
+        self.entries.clear()
+
+    def stats(self) -> dict:
+        return {
+            "threshold_ms": self.threshold_ms,
+            "explain_sample_rate": self.explain_sample_rate,
+            "buffered": len(self.entries),
+            "capacity": self.entries.maxlen,
+            "total": self.total,
+        }
+
+
+slow_query_log = SlowQueryLog(
+    threshold_ms=settings.DB_SLOW_QUERY_MS,
+    explain_sample_rate=settings.DB_SLOW_QUERY_EXPLAIN_SAMPLE_RATE,
+    size=settings.DB_SLOW_QUERY_LOG_SIZE
+)
+
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    conn.info.setdefault("slow_query_started", []).append(time.perf_counter())
+
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    started = conn.info.get("slow_query_started")
+    if not started:
+        return
+    elapsed_ms = (time.perf_counter() - started.pop()) * 1000
+    if elapsed_ms >= slow_query_log.threshold_ms:
+        slow_query_log.record(conn, statement, parameters, executemany, elapsed_ms)
+
+
+def _handle_error(context):
+    started = context.connection.info.get("slow_query_started") if context.connection is not None else None
+    if started:
+        started.pop()
+
+
+def install_slow_query_log(engine) -> None:
+    if settings.DB_SLOW_QUERY_MS <= 0:
+        return
+    target = engine.sync_engine
+    event.listen(target, "before_cursor_execute", _before_cursor_execute)
+    event.listen(target, "after_cursor_execute", _after_cursor_execute)
+    event.listen(target, "handle_error", _handle_error)
@@ -0,0 +1,71 @@
+import os
+import sys
+from contextlib import asynccontextmanager
+import tempfile
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+os.environ.setdefault(
+    "DATABASE_URL",
+    f"sqlite+aiosqlite:///{os.path.join(tempfile.mkdtemp(prefix='globetrotter-bench-'), 'bench.db')}"
+)
+os.environ.setdefault("JWT_SECRET_KEY", "benchmark-access-secret-key-0123456789")
+os.environ.setdefault("JWT_REFRESH_SECRET_KEY", "benchmark-refresh-secret-key-0123456789")
+os.environ.setdefault("DEBUG", "false")
+os.environ.setdefault("LOG_FILE", "")
+
+import httpx
+
+import app.models  # noqa: F401
+from app.database import Base, dispose_engines, engine
+from app.main import app
+
+API = "/api/v1"
+
+
+async def create_schema() -> None:
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.drop_all)
+        await conn.run_sync(Base.metadata.create_all)
+
+
+@asynccontextmanager
+async def client():
+    try:
+        async with httpx.AsyncClient(app=app, base_url="http://bench") as http:
+            yield http
+    finally:
+        await dispose_engines()
+
+
+async def signup(http: httpx.AsyncClient, email: str, password: str = "benchmark-password") -> dict:
+    response = await http.post(f"{API}/auth/signup", json={"email": email, "password": password, "name": "Bench"})
+    response.raise_for_status()
+    return response.json()["data"]
+
+
+def percentile(samples, quantile: float) -> float:
+    ordered = sorted(samples)
+    if not ordered:
+        return 0.0
+    return ordered[min(int(len(ordered) * quantile), len(ordered) - 1)]
+
+
+def summarize(label: str, seconds) -> str:
+    return (
+        f"{label:<28} n={len(seconds):<6} "
+        f"p50={percentile(seconds, 0.50) * 1000:8.2f}ms "
+        f"p99={percentile(seconds, 0.99) * 1000:8.2f}ms "
+        f"max={max(seconds, default=0.0) * 1000:8.2f}ms"
+    )
+
+
+class Timer:
+    def __enter__(self):
+        self.started = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc):
+        self.elapsed = time.perf_counter() - self.started
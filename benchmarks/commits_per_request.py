@@ -0,0 +1,90 @@
+"""Commits and statements per request for the write-heavy endpoints.
+
+    python benchmarks/commits_per_request.py [--rounds 20]
+"""
+import argparse
+import asyncio
+from collections import defaultdict
+
+from sqlalchemy import event
+
+from _common import API, Timer, client, create_schema, signup, summarize
+
+from app.database import engine
+
+counters = {"commits": 0, "statements": 0}
+
+
+@event.listens_for(engine.sync_engine, "commit")
+def _count_commit(conn):
+    counters["commits"] += 1
+
+
+@event.listens_for(engine.sync_engine, "before_cursor_execute")
+def _count_statement(conn, cursor, statement, parameters, context, executemany):
+    counters["statements"] += 1
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--rounds", type=int, default=20)
+    args = parser.parse_args()
+
+    await create_schema()
+    per_endpoint = defaultdict(lambda: {"commits": 0, "statements": 0, "latencies": []})
+
+    async with client() as http:
+        session = await signup(http, "writer@example.com")
+        headers = {"Authorization": f"Bearer {session['tokens']['access_token']}"}
+
+        async def call(name, method, url, auth=None, **kwargs):
+            counters["commits"] = counters["statements"] = 0
+            with Timer() as timer:
+                response = await http.request(method, url, headers=auth or headers, **kwargs)
+            response.raise_for_status()
+            stats = per_endpoint[name]
+            stats["commits"] += counters["commits"]
+            stats["statements"] += counters["statements"]
+            stats["latencies"].append(timer.elapsed)
+            return response.json()["data"]
+
+        for i in range(args.rounds):
+            city = await call("POST /cities", "POST", f"{API}/cities", json={"name": f"City {i}", "country": "Benchland"})
+            activity = await call("POST /activities", "POST", f"{API}/activities", json={
+                "city_id": city["id"], "name": f"Tour {i}", "category": "activities", "estimated_cost": 10
+            })
+            trip = await call("POST /trips", "POST", f"{API}/trips", json={
+                "title": f"Trip {i}", "start_date": "2026-05-01T00:00:00Z", "end_date": "2026-05-04T00:00:00Z"
+            })
+            await call("POST /budgets", "POST", f"{API}/budgets", json={"trip_id": trip["id"], "total_budget": 500})
+            day = await call("POST /itinerary/days", "POST", f"{API}/itinerary/days", json={
+                "trip_id": trip["id"], "city_id": city["id"], "day_number": 1, "date": "2026-05-01T00:00:00Z"
+            })
+            item = await call("POST /itinerary/items", "POST", f"{API}/itinerary/items", json={
+                "itinerary_day_id": day["id"], "activity_id": activity["id"], "order_index": 0
+            })
+            await call("PUT /itinerary/items/{id}", "PUT", f"{API}/itinerary/items/{item['id']}", json={"custom_title": "Updated"})
+            await call("PUT /trips/{id}", "PUT", f"{API}/trips/{trip['id']}", json={"title": f"Trip {i} (edited)"})
+            await call("POST /shared", "POST", f"{API}/shared", json={"trip_id": trip["id"]})
+            await call("DELETE /trips/{id}", "DELETE", f"{API}/trips/{trip['id']}")
+
+            account = await call("POST /auth/signup", "POST", f"{API}/auth/signup", json={
+                "email": f"churn-{i}@example.com", "password": "benchmark-password", "name": "Churn"
+            })
+            tokens = await call("POST /auth/refresh", "POST", f"{API}/auth/refresh", json={
+                "refresh_token": account["tokens"]["refresh_token"]
+            })
+            await call("DELETE /users/me", "DELETE", f"{API}/users/me", auth={
+                "Authorization": f"Bearer {tokens['tokens']['access_token']}"
+            })
+
+    for name, stats in per_endpoint.items():
+        requests = len(stats["latencies"])
+        print(
+            f"{summarize(name, stats['latencies'])} "
+            f"commits/req={stats['commits'] / requests:4.1f} statements/req={stats['statements'] / requests:5.1f}"
+        )
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,108 @@
+"""Wire size and latency of list responses with and without negotiated
+compression, plus the precompressed cache on catalog responses.
+
+    python benchmarks/compression.py [--cities 300] [--trips 40] [--rounds 30]
+
+Every compressed body is decompressed and compared with the identity body.
+The loop-lag probe ticks every millisecond while a large body is compressed,
+once inline on the event loop and once on the compression worker pool.
+"""
+import argparse
+import asyncio
+import logging
+import time
+import zlib
+
+import _common
+from _common import API, client, create_schema, signup
+
+from app.utils.compression import CODECS, response_compressor
+
+
+async def loop_lag(work) -> float:
+    worst = 0.0
+    running = True
+
+    async def probe():
+        nonlocal worst
+        while running:
+            started = time.perf_counter()
+            await asyncio.sleep(0.001)
+            worst = max(worst, time.perf_counter() - started - 0.001)
+
+    task = asyncio.create_task(probe())
+    await asyncio.sleep(0.01)
+    await work()
+    running = False
+    await task
+    return worst
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--cities", type=int, default=300)
+    parser.add_argument("--trips", type=int, default=40)
+    parser.add_argument("--rounds", type=int, default=30)
+    args = parser.parse_args()
+
+    logging.getLogger("httpx").setLevel(logging.WARNING)
+    await create_schema()
+
+    async with client() as http:
+        account = await signup(http, "traveller@example.com")
+        headers = {"Authorization": f"Bearer {account['tokens']['access_token']}"}
+        for index in range(args.cities):
+            await http.post(f"{API}/cities", json={
+                "name": f"City {index}", "country": "PT", "description": f"Old town number {index} by the river."
+            })
+        for index in range(args.trips):
+            trip = (await http.post(f"{API}/trips", headers=headers, json={
+                "title": f"Trip {index}", "description": "Coast road and back. " * 60,
+                "start_date": "2026-06-01T00:00:00Z", "end_date": "2026-06-08T00:00:00Z"
+            })).json()["data"]
+        shared = (await http.post(f"{API}/shared", headers=headers, json={"trip_id": trip["id"]})).json()["data"]
+
+        cases = [
+            ("cities", f"{API}/cities?limit={args.cities}"),
+            ("trips", f"{API}/trips"),
+            ("shared trip", f"{API}/shared/{shared['share_token']}"),
+        ]
+        for label, url in cases:
+            identity = None
+            for encoding in ["identity", *CODECS]:
+                samples = []
+                for _ in range(args.rounds):
+                    with _common.Timer() as timer:
+                        response = await http.get(url, headers={**headers, "Accept-Encoding": encoding})
+                    samples.append(timer.elapsed)
+                response.raise_for_status()
+                wire = response.headers.get("content-length")
+                if identity is None:
+                    identity = response.content
+                    check = ""
+                else:
+                    sent = response.headers.get("content-encoding", "identity")
+                    check = f" sent={sent} roundtrip ok: {response.content == identity}"
+                print(f"{_common.summarize(f'{label} {encoding}', samples)} bytes={wire:<8}{check}")
+        print(f"precompressed cache: {response_compressor.cache.stats()}")
+
+        body = (await http.get(f"{API}/cities?limit={args.cities}")).content * 40
+        compress = CODECS["gzip"][0]
+
+        async def inline():
+            compress(body)
+
+        async def offloaded():
+            await response_compressor.run(compress, body)
+
+        print(f"{len(body)} byte body, worst loop stall inline:    {await loop_lag(inline) * 1000:7.2f}ms")
+        print(f"{len(body)} byte body, worst loop stall offloaded: {await loop_lag(offloaded) * 1000:7.2f}ms")
+
+        stream = response_compressor.stream("gzip")
+        chunks = [stream.compress(body[start:start + 65536]) for start in range(0, len(body), 65536)]
+        streamed = zlib.decompress(b"".join(chunks) + stream.finish(), 31)
+        print(f"streamed gzip roundtrip ok: {streamed == body}")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
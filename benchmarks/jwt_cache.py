@@ -0,0 +1,44 @@
+"""CPU spent verifying an access token, uncached vs. through the claims cache.
+
+    python benchmarks/jwt_cache.py [--iterations 50000] [--tokens 100]
+"""
+import argparse
+import time
+
+import _common  # noqa: F401
+
+from app.utils.auth import (
+    access_token_cache, create_access_token, verify_access_token, verify_access_token_cached
+)
+
+
+def measure(verify, tokens, iterations: int) -> float:
+    started = time.process_time()
+    for i in range(iterations):
+        verify(tokens[i % len(tokens)])
+    return (time.process_time() - started) / iterations
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--iterations", type=int, default=50000)
+    parser.add_argument("--tokens", type=int, default=100)
+    args = parser.parse_args()
+
+    tokens = [
+        create_access_token({"user_id": f"user-{i}", "email": f"user-{i}@example.com", "role": "USER"})
+        for i in range(args.tokens)
+    ]
+
+    uncached = measure(verify_access_token, tokens, args.iterations)
+    access_token_cache.clear()
+    cached = measure(verify_access_token_cached, tokens, args.iterations)
+
+    print(f"verify_access_token         {uncached * 1e6:8.2f} us CPU/request")
+    print(f"verify_access_token_cached  {cached * 1e6:8.2f} us CPU/request")
+    print(f"saved                       {(uncached - cached) * 1e6:8.2f} us CPU/request ({uncached / cached:.1f}x)")
+    print(f"cache                       {access_token_cache.stats()}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,86 @@
+"""Time a request spends inside logger calls with the old handlers (stdout
+and logs/app.log written synchronously by the calling thread) and with the
+queue pipeline from app/utils/logger.py (the caller only enqueues; a
+listener thread renders JSON and writes).
+
+    python benchmarks/logging_overhead.py [--lines 20000] [--size 200] [--fsync]
+
+--fsync forces each file write to disk, standing in for a slow or busy
+volume; the old handlers pay that on the event loop, the queue pipeline on
+the listener thread. Stdout is sent to /dev/null in both cases.
+"""
+import argparse
+import logging
+import os
+import sys
+import tempfile
+import importlib
+import time
+
+import _common
+
+from app.utils.request_id import track_request_id
+
+app_logging = importlib.import_module("app.utils.logger")
+
+
+class FsyncFileHandler(logging.FileHandler):
+    def emit(self, record):
+        super().emit(record)
+        os.fsync(self.stream.fileno())
+
+
+def file_handler(path: str, fsync: bool):
+    return FsyncFileHandler(path, mode="a") if fsync else logging.FileHandler(path, mode="a")
+
+
+def measure(log: logging.Logger, lines: int, message: str):
+    samples = []
+    with track_request_id("bench-request"):
+        for index in range(lines):
+            started = time.perf_counter()
+            log.info(f"{message} {index}")
+            samples.append(time.perf_counter() - started)
+    return samples
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--lines", type=int, default=20000)
+    parser.add_argument("--size", type=int, default=200)
+    parser.add_argument("--fsync", action="store_true")
+    args = parser.parse_args()
+
+    directory = tempfile.mkdtemp(prefix="globetrotter-logs-")
+    message = "x" * args.size
+    devnull = open(os.devnull, "w")
+    root = logging.getLogger()
+    log = logging.getLogger("bench")
+
+    legacy = [logging.StreamHandler(devnull), file_handler(os.path.join(directory, "legacy.log"), args.fsync)]
+    for handler in legacy:
+        handler.setFormatter(logging.Formatter("%(asctime)s - %(name)s - %(levelname)s - %(message)s"))
+    pipeline = root.handlers
+    root.handlers = legacy
+    samples = measure(log, args.lines, message)
+    print(f"{_common.summarize('sync handlers', samples)} total={sum(samples):.3f}s")
+
+    app_logging.stop_logging()
+    formatter = app_logging.file_handlers[0].formatter
+    app_logging.file_handlers[:] = [logging.StreamHandler(devnull), file_handler(os.path.join(directory, "queued.log"), args.fsync)]
+    for handler in app_logging.file_handlers:
+        handler.setFormatter(formatter)
+    app_logging._start_listener()
+    root.handlers = pipeline
+    samples = measure(log, args.lines, message)
+    print(f"{_common.summarize('queue handler', samples)} total={sum(samples):.3f}s")
+    started = time.perf_counter()
+    app_logging.stop_logging()
+    print(f"listener drained the backlog in {time.perf_counter() - started:.3f}s, dropped={app_logging.queue_handler.dropped}")
+    with open(os.path.join(directory, "queued.log")) as written:
+        print(f"last line: {written.readlines()[-1].strip()[:160]}")
+    devnull.close()
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,63 @@
+"""CPU burned by a credential-stuffing run against /auth/login, with and
+without the login rate limiter.
+
+    python benchmarks/login_rate_limit.py [--attempts 200] [--concurrency 16]
+"""
+import argparse
+import asyncio
+import time
+
+from _common import API, client, create_schema, signup
+
+from app.utils.rate_limit import InMemoryRateLimitBackend, login_rate_limiter
+
+
+async def attack(label: str, attempts: int, concurrency: int, victims) -> None:
+    statuses = {}
+    queue = asyncio.Queue()
+    for i in range(attempts):
+        queue.put_nowait(victims[i % len(victims)])
+
+    async with client() as http:
+        async def worker():
+            while not queue.empty():
+                email = queue.get_nowait()
+                response = await http.post(f"{API}/auth/login", json={"email": email, "password": "guess-123"})
+                statuses[response.status_code] = statuses.get(response.status_code, 0) + 1
+
+        cpu_started, wall_started = time.process_time(), time.perf_counter()
+        await asyncio.gather(*(worker() for _ in range(concurrency)))
+        cpu, wall = time.process_time() - cpu_started, time.perf_counter() - wall_started
+
+    print(
+        f"{label:<10} attempts={attempts} cpu={cpu:6.2f}s wall={wall:6.2f}s "
+        f"cpu/attempt={cpu / attempts * 1000:7.2f}ms statuses={statuses}"
+    )
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--attempts", type=int, default=200)
+    parser.add_argument("--concurrency", type=int, default=16)
+    parser.add_argument("--victims", type=int, default=10)
+    args = parser.parse_args()
+
+    await create_schema()
+    victims = [f"victim-{i}@example.com" for i in range(args.victims)]
+    async with client() as http:
+        for email in victims:
+            await signup(http, email)
+
+    per_ip, per_email = login_rate_limiter.per_ip, login_rate_limiter.per_email
+
+    login_rate_limiter.backend = InMemoryRateLimitBackend(1000)
+    login_rate_limiter.per_ip = login_rate_limiter.per_email = args.attempts * 10
+    await attack("unlimited", args.attempts, args.concurrency, victims)
+
+    login_rate_limiter.backend = InMemoryRateLimitBackend(1000)
+    login_rate_limiter.per_ip, login_rate_limiter.per_email = per_ip, per_email
+    await attack("limited", args.attempts, args.concurrency, victims)
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
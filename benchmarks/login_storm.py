@@ -0,0 +1,77 @@
+"""p99 of a non-auth endpoint while concurrent logins hammer bcrypt.
+
+    python benchmarks/login_storm.py [--attackers 32] [--duration 5]
+
+"inline" runs bcrypt on the event loop (the old behaviour); "pool" goes
+through app.utils.password.password_hasher.
+"""
+import argparse
+import asyncio
+import time
+
+from _common import API, Timer, client, create_schema, signup, summarize
+
+from app.utils import password as password_module
+from app.utils.password import verify_password
+
+
+async def _inline_verify(plain_password: str, hashed_password: str) -> bool:
+    return verify_password(plain_password, hashed_password)
+
+
+async def storm(mode: str, attackers: int, duration: float) -> None:
+    hasher = password_module.password_hasher
+    original_verify = hasher.verify
+    if mode == "inline":
+        hasher.verify = _inline_verify
+
+    statuses = {}
+    latencies = []
+    stop = asyncio.Event()
+
+    async with client() as http:
+        async def attacker():
+            while not stop.is_set():
+                response = await http.post(
+                    f"{API}/auth/login",
+                    json={"email": "storm@example.com", "password": "wrong-password"}
+                )
+                statuses[response.status_code] = statuses.get(response.status_code, 0) + 1
+
+        tasks = [asyncio.create_task(attacker()) for _ in range(attackers)]
+        await asyncio.sleep(0.5)
+
+        interval = 0.005
+        deadline = time.perf_counter() + duration
+        while time.perf_counter() < deadline:
+            with Timer() as timer:
+                await asyncio.sleep(interval)
+                await http.get("/health")
+            latencies.append(timer.elapsed - interval)
+
+        stop.set()
+        await asyncio.gather(*tasks)
+
+    hasher.verify = original_verify
+    print(summarize(f"/health during storm [{mode}]", latencies), "login statuses:", statuses)
+    if mode == "pool":
+        print(" " * 29, "hasher:", hasher.stats())
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--attackers", type=int, default=32)
+    parser.add_argument("--duration", type=float, default=5.0)
+    parser.add_argument("--mode", choices=["inline", "pool", "both"], default="both")
+    args = parser.parse_args()
+
+    await create_schema()
+    async with client() as http:
+        await signup(http, "storm@example.com")
+
+    for mode in (["inline", "pool"] if args.mode == "both" else [args.mode]):
+        await storm(mode, args.attackers, args.duration)
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
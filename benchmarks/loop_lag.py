@@ -0,0 +1,82 @@
+"""Event-loop lag seen by /health while another request hashes a password
+inline on the loop, and while the same work goes through the password
+hasher's worker pool; plus what the blocking-call detector logs.
+
+    python benchmarks/loop_lag.py [--rounds 5] [--probe 0.01]
+
+The inline case calls app.utils.password.hash_password from an async route
+added for this run, the mistake the detector exists to name. The watchdog
+thread logs the loop thread's stack while it is still blocked, so the
+warning points at the bcrypt call and the route that made it.
+"""
+import argparse
+import asyncio
+import logging
+
+import _common
+from _common import client, create_schema
+
+from app.main import app
+from app.utils.logger import logger
+from app.utils.loop_monitor import LoopLagMonitor
+from app.utils.password import hash_password, password_hasher
+
+
+@app.get("/bench/hash-inline")
+async def hash_inline():
+    return {"hash": hash_password("benchmark-password")}
+
+
+@app.get("/bench/hash-offloaded")
+async def hash_offloaded():
+    return {"hash": await password_hasher.hash("benchmark-password")}
+
+
+class Captured(logging.Handler):
+    def __init__(self):
+        super().__init__(logging.WARNING)
+        self.messages = []
+
+    def emit(self, record):
+        self.messages.append(record.getMessage())
+
+
+async def health_while(http, url: str, rounds: int):
+    samples = []
+    for _ in range(rounds):
+        blocking = asyncio.create_task(http.get(url))
+        while not blocking.done():
+            with _common.Timer() as timer:
+                await http.get("/health")
+            samples.append(timer.elapsed)
+        (await blocking).raise_for_status()
+    return samples
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--rounds", type=int, default=5)
+    parser.add_argument("--probe", type=float, default=0.01)
+    args = parser.parse_args()
+
+    logging.getLogger("httpx").setLevel(logging.WARNING)
+    captured = Captured()
+    logger.addHandler(captured)
+    await create_schema()
+
+    async with client() as http:
+        for label, url in [("inline bcrypt", "/bench/hash-inline"), ("offloaded bcrypt", "/bench/hash-offloaded")]:
+            monitor = LoopLagMonitor(interval=args.probe, threshold=0.05, window=60, capture_stacks=True)
+            task = asyncio.create_task(monitor.run())
+            await asyncio.sleep(args.probe * 3)
+            captured.messages.clear()
+            samples = await health_while(http, url, args.rounds)
+            task.cancel()
+            print(f"{_common.summarize(f'/health during {label}', samples)} loop {monitor.stats()}")
+            blocked = [message for message in captured.messages if message.startswith("Event loop blocked")]
+            if blocked:
+                print(f"  {blocked[0].splitlines()[0]}")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
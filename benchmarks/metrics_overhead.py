@@ -0,0 +1,109 @@
+"""Requests/sec with and without the Prometheus metrics middleware, then one
+scrape of /metrics after the run.
+
+    python benchmarks/metrics_overhead.py [--requests 2000] [--concurrency 20] [--multiproc]
+
+before: MetricsMiddleware removed from the stack (query-budget reporting
+        still records DB metrics in both runs).
+after:  the stack as registered in app/main.py.
+
+--multiproc points PROMETHEUS_MULTIPROC_DIR at a fresh temporary directory
+before the app is imported, so samples go to mmap files and the scrape goes
+through MultiProcessCollector the way it does under several uvicorn workers.
+"""
+import argparse
+import asyncio
+import logging
+import os
+import sys
+import tempfile
+
+if "--multiproc" in sys.argv:
+    os.environ["PROMETHEUS_MULTIPROC_DIR"] = tempfile.mkdtemp(prefix="globetrotter-metrics-")
+
+import httpx
+
+import _common
+from _common import API, create_schema, signup
+
+from app.database import dispose_engines
+from app.main import app
+from app.middleware import MetricsMiddleware
+from app.utils.loop_monitor import LoopLagMonitor
+from app.utils.metrics import run_metrics_sampler
+
+SHOWN = (
+    "http_requests_total{", "http_request_duration_seconds_count{", "http_requests_in_flight{",
+    "db_statements_total{", "db_time_seconds_total{", "db_pool_connections{", "cache_lookups_total{",
+    "password_hash_pending", "event_loop_lag_seconds_count", "event_loop_lag_max_seconds",
+)
+
+
+def use_stack(middleware) -> None:
+    app.user_middleware = middleware
+    app.middleware_stack = app.build_middleware_stack()
+
+
+async def run(http: httpx.AsyncClient, url: str, headers: dict, requests: int, concurrency: int):
+    samples = []
+    queue = asyncio.Queue()
+    for _ in range(requests):
+        queue.put_nowait(None)
+
+    async def worker():
+        while not queue.empty():
+            queue.get_nowait()
+            with _common.Timer() as timer:
+                response = await http.get(url, headers=headers)
+            response.raise_for_status()
+            samples.append(timer.elapsed)
+
+    with _common.Timer() as total:
+        await asyncio.gather(*(worker() for _ in range(concurrency)))
+    return samples, requests / total.elapsed
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--requests", type=int, default=2000)
+    parser.add_argument("--concurrency", type=int, default=20)
+    parser.add_argument("--multiproc", action="store_true")
+    args = parser.parse_args()
+
+    logging.getLogger("httpx").setLevel(logging.WARNING)
+    await create_schema()
+    current = list(app.user_middleware)
+    without = [entry for entry in current if entry.cls is not MetricsMiddleware]
+    sampler = asyncio.create_task(run_metrics_sampler(0.05))
+    monitor = asyncio.create_task(LoopLagMonitor(interval=0.01, threshold=0.1, window=60).run())
+
+    try:
+        async with httpx.AsyncClient(app=app, base_url="http://bench") as http:
+            account = await signup(http, "reader@example.com")
+            auth = {"Authorization": f"Bearer {account['tokens']['access_token']}"}
+            cases = [("/health", "/health", {}), ("GET /users/me", f"{API}/users/me", auth)]
+
+            for label, url, headers in cases:
+                for stack, middleware in [("before", without), ("after", current)]:
+                    use_stack(middleware)
+                    await run(http, url, headers, min(200, args.requests), args.concurrency)
+                    samples, throughput = await run(http, url, headers, args.requests, args.concurrency)
+                    print(f"{_common.summarize(f'{label} {stack}', samples)} {throughput:8.0f} req/s")
+
+            await asyncio.sleep(0.1)
+            with _common.Timer() as timer:
+                scrape = await http.get("/metrics")
+            scrape.raise_for_status()
+            print(f"scrape: {len(scrape.content)} bytes in {timer.elapsed * 1000:.2f}ms ({scrape.headers['content-type']})")
+            for line in scrape.text.splitlines():
+                if line.startswith(SHOWN):
+                    print(f"  {line}")
+    finally:
+        sampler.cancel()
+        monitor.cancel()
+        use_stack(current)
+        await dispose_engines()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
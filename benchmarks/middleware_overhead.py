@@ -0,0 +1,108 @@
+"""Requests/sec through the middleware stack on /health and an
+authenticated GET, with the old function-style error handler and with the
+pure ASGI stack.
+
+    python benchmarks/middleware_overhead.py [--requests 2000] [--concurrency 20]
+
+before: error handling registered with app.middleware("http"), which runs
+        every request through BaseHTTPMiddleware (a task and a memory stream
+        per request, and the body re-chunked). No request-id or timing.
+after:  ErrorHandlerMiddleware, TimingMiddleware and RequestIdMiddleware as
+        plain ASGI callables, as registered in app/main.py.
+
+Both stacks are built from the same app in one process by swapping the user
+middleware list and rebuilding the stack. Requests go through the ASGI
+transport, so there is no socket or server in the numbers.
+"""
+import argparse
+import asyncio
+import logging
+
+import httpx
+from fastapi import status
+from fastapi.responses import JSONResponse
+from starlette.middleware import Middleware
+from starlette.middleware.base import BaseHTTPMiddleware
+
+import _common
+from _common import API, create_schema, signup
+
+from app.database import dispose_engines
+from app.main import app
+from app.middleware import ErrorHandlerMiddleware, RequestIdMiddleware, TimingMiddleware
+from app.utils import ApiResponse
+
+
+async def legacy_error_handler(request, call_next):
+    try:
+        return await call_next(request)
+    except Exception:
+        return JSONResponse(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            content=ApiResponse.error("Internal server error")
+        )
+
+
+def use_stack(middleware) -> None:
+    app.user_middleware = middleware
+    app.middleware_stack = app.build_middleware_stack()
+
+
+def legacy_stack(current):
+    replaced = []
+    for entry in current:
+        if entry.cls is ErrorHandlerMiddleware:
+            replaced.append(Middleware(BaseHTTPMiddleware, dispatch=legacy_error_handler))
+        elif entry.cls not in (RequestIdMiddleware, TimingMiddleware):
+            replaced.append(entry)
+    return replaced
+
+
+async def run(http: httpx.AsyncClient, url: str, headers: dict, requests: int, concurrency: int):
+    samples = []
+    queue = asyncio.Queue()
+    for _ in range(requests):
+        queue.put_nowait(None)
+
+    async def worker():
+        while not queue.empty():
+            queue.get_nowait()
+            with _common.Timer() as timer:
+                response = await http.get(url, headers=headers)
+            response.raise_for_status()
+            samples.append(timer.elapsed)
+
+    with _common.Timer() as total:
+        await asyncio.gather(*(worker() for _ in range(concurrency)))
+    return samples, requests / total.elapsed
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--requests", type=int, default=2000)
+    parser.add_argument("--concurrency", type=int, default=20)
+    args = parser.parse_args()
+
+    logging.getLogger("httpx").setLevel(logging.WARNING)
+    await create_schema()
+    current = list(app.user_middleware)
+
+    try:
+        async with httpx.AsyncClient(app=app, base_url="http://bench") as http:
+            account = await signup(http, "reader@example.com")
+            auth = {"Authorization": f"Bearer {account['tokens']['access_token']}"}
+            cases = [("/health", "/health", {}), ("GET /users/me", f"{API}/users/me", auth)]
+
+            for label, url, headers in cases:
+                for stack, middleware in [("before", legacy_stack(current)), ("after", current)]:
+                    use_stack(middleware)
+                    await run(http, url, headers, min(200, args.requests), args.concurrency)
+                    samples, throughput = await run(http, url, headers, args.requests, args.concurrency)
+                    print(f"{_common.summarize(f'{label} {stack}', samples)} {throughput:8.0f} req/s")
+    finally:
+        use_stack(current)
+        await dispose_engines()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
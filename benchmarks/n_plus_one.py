@@ -0,0 +1,76 @@
+"""Statement counts and N+1 warnings for the trip and budget read paths on a
+trip with many itinerary days.
+
+    python benchmarks/n_plus_one.py [--days 10] [--items 3]
+
+Every statement shape repeated DB_N_PLUS_ONE_THRESHOLD times or more inside
+one request is logged with the call site that issued it.
+"""
+import argparse
+import asyncio
+import logging
+
+from _common import API, client, create_schema, signup
+
+from app.utils.logger import logger
+
+
+class Collector(logging.Handler):
+    def __init__(self):
+        super().__init__(logging.WARNING)
+        self.messages = []
+
+    def emit(self, record):
+        self.messages.append(record.getMessage())
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--days", type=int, default=10)
+    parser.add_argument("--items", type=int, default=3)
+    args = parser.parse_args()
+
+    logging.getLogger("httpx").setLevel(logging.WARNING)
+    await create_schema()
+    collector = Collector()
+    logger.addHandler(collector)
+
+    async with client() as http:
+        account = await signup(http, "planner@example.com")
+        headers = {"Authorization": f"Bearer {account['tokens']['access_token']}"}
+
+        city = (await http.post(f"{API}/cities", json={"name": "Kyoto", "country": "JP"})).json()["data"]
+        activity = (await http.post(f"{API}/activities", json={
+            "city_id": city["id"], "name": "Fushimi Inari", "category": "activities", "estimated_cost": 10
+        })).json()["data"]
+        trip = (await http.post(f"{API}/trips", headers=headers, json={
+            "title": "Kansai", "start_date": "2026-04-01T00:00:00Z", "end_date": "2026-04-30T00:00:00Z"
+        })).json()["data"]
+        await http.post(f"{API}/budgets", headers=headers, json={"trip_id": trip["id"], "total_budget": 3000})
+        for number in range(1, args.days + 1):
+            day = (await http.post(f"{API}/itinerary/days", headers=headers, json={
+                "trip_id": trip["id"], "city_id": city["id"], "day_number": number,
+                "date": f"2026-04-{number:02d}T00:00:00Z"
+            })).json()["data"]
+            for index in range(args.items):
+                await http.post(f"{API}/itinerary/items", headers=headers, json={
+                    "itinerary_day_id": day["id"], "activity_id": activity["id"], "order_index": index
+                })
+        shared = (await http.post(f"{API}/shared", headers=headers, json={"trip_id": trip["id"]})).json()["data"]
+
+        collector.messages.clear()
+        for url in [
+            f"{API}/trips",
+            f"{API}/trips/{trip['id']}",
+            f"{API}/budgets/trips/{trip['id']}",
+            f"{API}/shared/{shared['share_token']}",
+        ]:
+            response = await http.get(url, headers=headers)
+            print(f"GET {url[len(API):]:<52} {response.status_code}")
+
+    logger.removeHandler(collector)
+    print(f"{len(collector.messages)} budget overrun / repeated statement warning(s)")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
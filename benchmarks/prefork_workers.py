@@ -0,0 +1,122 @@
+"""Memory and throughput of the production launcher (run.py with DEBUG=false)
+with and without preloading the app in the gunicorn master.
+
+    python benchmarks/prefork_workers.py [--workers 4] [--requests 2000] [--max-requests 0]
+
+Each configuration is started as a real server on a local port. Proportional
+set size (Pss, from /proc/<pid>/smaps_rollup, so Linux only) splits pages the
+workers share copy-on-write between them, so the total across workers is
+the memory they actually cost. --max-requests turns on worker recycling and
+reports how many workers were started and how many requests failed while
+workers were being replaced.
+"""
+import argparse
+import os
+import signal
+import subprocess
+import sys
+import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import httpx
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+PORT = 8799
+
+
+def pss_kib(pid: int) -> int:
+    with open(f"/proc/{pid}/smaps_rollup") as rollup:
+        for line in rollup:
+            if line.startswith("Pss:"):
+                return int(line.split()[1])
+    return 0
+
+
+def children(pid: int):
+    with open(f"/proc/{pid}/task/{pid}/children") as listing:
+        return [int(child) for child in listing.read().split()]
+
+
+def wait_ready(workers: int, master: int) -> None:
+    deadline = time.monotonic() + 60
+    while time.monotonic() < deadline:
+        try:
+            if httpx.get(f"http://127.0.0.1:{PORT}/health").status_code == 200 and len(children(master)) >= workers:
+                return
+        except httpx.TransportError:
+            pass
+        time.sleep(0.2)
+    raise RuntimeError("server did not start")
+
+
+def load(requests: int, concurrency: int = 8):
+    def worker(count):
+        ok = failed = 0
+        with httpx.Client(base_url=f"http://127.0.0.1:{PORT}") as http:
+            for _ in range(count):
+                try:
+                    ok += http.get("/health").status_code == 200
+                except httpx.TransportError:
+                    failed += 1
+        return ok, failed
+
+    started = time.perf_counter()
+    with ThreadPoolExecutor(concurrency) as pool:
+        results = list(pool.map(worker, [requests // concurrency] * concurrency))
+    elapsed = time.perf_counter() - started
+    return sum(ok for ok, _ in results), sum(failed for _, failed in results), elapsed
+
+
+def run(label: str, args, preload: bool) -> None:
+    directory = tempfile.mkdtemp(prefix="globetrotter-prefork-")
+    env = {
+        **os.environ,
+        "DATABASE_URL": f"sqlite+aiosqlite:///{os.path.join(directory, 'bench.db')}",
+        "JWT_SECRET_KEY": "benchmark-access-secret-key-0123456789",
+        "JWT_REFRESH_SECRET_KEY": "benchmark-refresh-secret-key-0123456789",
+        "DEBUG": "false",
+        "HOST": "127.0.0.1",
+        "PORT": str(PORT),
+        "WEB_WORKERS": str(args.workers),
+        "WEB_PRELOAD": str(preload).lower(),
+        "WEB_MAX_REQUESTS": str(args.max_requests),
+        "WEB_MAX_REQUESTS_JITTER": str(args.max_requests // 4),
+        "PROMETHEUS_MULTIPROC_DIR": os.path.join(directory, "metrics"),
+        "LOG_FILE": "",
+        "LOG_LEVEL": "WARNING",
+        "REFRESH_TOKEN_PURGE_INTERVAL_SECONDS": "86400",
+        "TRIP_ARCHIVE_INTERVAL_SECONDS": "86400",
+    }
+    log = open(os.path.join(directory, "server.log"), "w")
+    server = subprocess.Popen([sys.executable, "run.py"], cwd=ROOT, env=env, stdout=log, stderr=subprocess.STDOUT)
+    try:
+        wait_ready(args.workers, server.pid)
+        ok, failed, elapsed = load(args.requests)
+        workers = children(server.pid)
+        total = sum(pss_kib(pid) for pid in workers)
+        with open(os.path.join(directory, "server.log")) as output:
+            booted = output.read().count("Booting worker")
+        print(
+            f"{label:<12} workers={len(workers)} pss/worker={total / len(workers) / 1024:6.1f}MiB "
+            f"pss total={total / 1024:6.1f}MiB {ok / elapsed:7.0f} req/s booted={booted} failed={failed}"
+        )
+    finally:
+        server.send_signal(signal.SIGTERM)
+        server.wait(30)
+        log.close()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--workers", type=int, default=4)
+    parser.add_argument("--requests", type=int, default=2000)
+    parser.add_argument("--max-requests", type=int, default=0)
+    args = parser.parse_args()
+
+    run("no preload", args, preload=False)
+    run("preload", args, preload=True)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,55 @@
+"""Read/write routing against a primary and a replica kept as two SQLite files.
+
+    python benchmarks/replica_routing.py
+
+The replica is never written to, so anything served from it is visibly
+stale. That makes it easy to see which engine answered each read.
+"""
+import asyncio
+import os
+import tempfile
+
+workdir = tempfile.mkdtemp(prefix="globetrotter-replica-")
+os.environ["DATABASE_URL"] = f"sqlite+aiosqlite:///{os.path.join(workdir, 'primary.db')}"
+os.environ["DATABASE_REPLICA_URLS"] = f"sqlite+aiosqlite:///{os.path.join(workdir, 'replica.db')}"
+os.environ["READ_YOUR_WRITES_SECONDS"] = "1"
+
+from _common import API, client, create_schema, signup
+
+from app.database import Base, replica_engines, replica_router
+
+
+async def main() -> None:
+    await create_schema()
+    async with replica_engines[0].begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+
+    async with client() as http:
+        account = await signup(http, "reader@example.com")
+        headers = {"Authorization": f"Bearer {account['tokens']['access_token']}"}
+
+        await http.post(f"{API}/trips", headers=headers, json={
+            "title": "Fresh", "start_date": "2026-05-01T00:00:00Z", "end_date": "2026-05-02T00:00:00Z"
+        })
+        trips = (await http.get(f"{API}/trips", headers=headers)).json()["data"]
+        print(f"right after the write (read-your-writes -> primary): {len(trips)} trip(s)")
+
+        await asyncio.sleep(1.1)
+        trips = (await http.get(f"{API}/trips", headers=headers)).json()["data"]
+        print(f"after the window (-> stale replica):                {len(trips)} trip(s)")
+
+        await http.post(f"{API}/cities", json={"name": "Porto", "country": "PT"})
+        cities = (await http.get(f"{API}/cities")).json()["data"]
+        print(f"anonymous catalog search (-> stale replica):         {len(cities)} city(ies)")
+
+        await replica_engines[0].dispose()
+        os.remove(os.path.join(workdir, "replica.db"))
+        os.mkdir(os.path.join(workdir, "replica.db"))
+        cities = (await http.get(f"{API}/cities")).json()["data"]
+        print(f"replica unreachable (-> primary fallback):           {len(cities)} city(ies)")
+
+    print(f"routing: {replica_router.stats()}")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
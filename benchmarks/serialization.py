@@ -0,0 +1,122 @@
+"""Serialization cost of a 1,000-item list response, old path vs. new path.
+
+    python benchmarks/serialization.py [--items 1000] [--rounds 200]
+
+before: per-row from_orm() dict copy + model construction, the envelope as a
+        plain dict, FastAPI validating it against response_model=dict, and
+        JSONResponse encoding with the stdlib json module.
+after:  model_validate() straight from the ORM attributes and the envelope
+        written to bytes by pydantic-core in one pass (EnvelopeResponse).
+
+If orjson is installed it is timed as a reference point. It is not used by
+the app: it writes UTC datetimes as +00:00 instead of Z, which would change
+the wire format, and pydantic-core gets within a few percent without a new
+dependency.
+
+No database is involved; the rows are transient ORM instances carrying the
+computed attributes TripService sets on them.
+"""
+import argparse
+import asyncio
+from datetime import datetime, timedelta, timezone
+
+import _common
+
+from fastapi.responses import JSONResponse
+from fastapi.routing import serialize_response
+from fastapi.utils import create_response_field
+
+from app.models.trip import Trip
+from app.schemas.trip import TripResponse
+from app.utils import ApiResponse
+from app.utils.ids import new_id
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+RESPONSE_FIELD = create_response_field(name="Response_bench", type_=dict)
+
+
+def legacy_from_orm(obj) -> TripResponse:
+    return TripResponse(**{
+        "id": obj.id,
+        "user_id": obj.user_id,
+        "title": obj.title,
+        "description": obj.description,
+        "start_date": obj.start_date,
+        "end_date": obj.end_date,
+        "duration_days": getattr(obj, "duration_days", 0),
+        "total_budget": getattr(obj, "total_budget", 0.0),
+        "total_spent": getattr(obj, "total_spent", 0.0),
+        "remaining_budget": getattr(obj, "remaining_budget", 0.0),
+        "itinerary_days_count": getattr(obj, "itinerary_days_count", 0),
+        "cities_count": getattr(obj, "cities_count", 0),
+        "activities_count": getattr(obj, "activities_count", 0),
+        "created_at": obj.created_at,
+        "updated_at": obj.updated_at,
+    })
+
+
+def make_trips(count: int):
+    now = datetime.now(timezone.utc)
+    user_id = new_id()
+    trips = []
+    for index in range(count):
+        trip = Trip(
+            id=new_id(), user_id=user_id, title=f"Trip {index}", description="A long weekend",
+            start_date=now, end_date=now + timedelta(days=3), created_at=now, updated_at=now
+        )
+        trip.duration_days = 4
+        trip.total_budget = 1200.0
+        trip.total_spent = 310.5
+        trip.remaining_budget = 889.5
+        trip.itinerary_days_count = 4
+        trip.cities_count = 2
+        trip.activities_count = 7
+        trips.append(trip)
+    return trips
+
+
+async def before(trips) -> bytes:
+    envelope = {"success": True, "data": [legacy_from_orm(trip) for trip in trips], "error": None}
+    content = await serialize_response(field=RESPONSE_FIELD, response_content=envelope, is_coroutine=True)
+    return JSONResponse(content).body
+
+
+async def after(trips) -> bytes:
+    return ApiResponse.success([TripResponse.model_validate(trip) for trip in trips]).body
+
+
+async def after_orjson(trips) -> bytes:
+    data = [TripResponse.model_validate(trip).model_dump() for trip in trips]
+    return orjson.dumps({"success": True, "data": data, "error": None})
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--items", type=int, default=1000)
+    parser.add_argument("--rounds", type=int, default=200)
+    args = parser.parse_args()
+
+    trips = make_trips(args.items)
+    variants = [("before: from_orm + json", before), ("after: to_json envelope", after)]
+    if orjson is not None:
+        variants.append(("model_dump + orjson", after_orjson))
+
+    baseline = None
+    for label, render in variants:
+        body = await render(trips)
+        samples = []
+        for _ in range(args.rounds):
+            with _common.Timer() as timer:
+                await render(trips)
+            samples.append(timer.elapsed)
+        median = _common.percentile(samples, 0.50)
+        baseline = baseline or median
+        print(f"{_common.summarize(label, samples)} bytes={len(body):<8} speedup={baseline / median:5.2f}x")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,101 @@
+"""Statements, selected columns, payload size and latency of the list
+endpoints with and without a ?fields= sparse fieldset.
+
+    python benchmarks/sparse_fields.py [--trips 50] [--days 3] [--rounds 20]
+
+Each sparse response is also checked against the matching keys of the full
+response, so a fieldset only ever drops data.
+"""
+import argparse
+import asyncio
+import logging
+
+from sqlalchemy import event
+
+import _common
+from _common import API, client, create_schema, signup
+
+from app.database import engine
+
+statements = []
+
+
+@event.listens_for(engine.sync_engine, "before_cursor_execute")
+def _record(conn, cursor, statement, parameters, context, executemany):
+    statements.append(" ".join(statement.split()))
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--trips", type=int, default=50)
+    parser.add_argument("--days", type=int, default=3)
+    parser.add_argument("--rounds", type=int, default=20)
+    args = parser.parse_args()
+
+    logging.getLogger("httpx").setLevel(logging.WARNING)
+    await create_schema()
+
+    async with client() as http:
+        account = await signup(http, "mobile@example.com")
+        headers = {"Authorization": f"Bearer {account['tokens']['access_token']}"}
+
+        city = (await http.post(f"{API}/cities", json={
+            "name": "Lisbon", "country": "PT", "description": "Seven hills. " * 40
+        })).json()["data"]
+        activity = (await http.post(f"{API}/activities", json={
+            "city_id": city["id"], "name": "Tram 28", "category": "sightseeing", "estimated_cost": 3,
+            "description": "Yellow tram. " * 40
+        })).json()["data"]
+        for index in range(args.trips):
+            trip = (await http.post(f"{API}/trips", headers=headers, json={
+                "title": f"Trip {index}", "description": "Long description. " * 40,
+                "start_date": "2026-05-01T00:00:00Z", "end_date": "2026-05-10T00:00:00Z"
+            })).json()["data"]
+            await http.post(f"{API}/budgets", headers=headers, json={"trip_id": trip["id"], "total_budget": 900})
+            for number in range(1, args.days + 1):
+                day = (await http.post(f"{API}/itinerary/days", headers=headers, json={
+                    "trip_id": trip["id"], "city_id": city["id"], "day_number": number,
+                    "date": f"2026-05-{number:02d}T00:00:00Z", "notes": "Pack light. " * 20
+                })).json()["data"]
+                await http.post(f"{API}/itinerary/items", headers=headers, json={
+                    "itinerary_day_id": day["id"], "activity_id": activity["id"], "order_index": 0
+                })
+
+        cases = [
+            ("trips", f"{API}/trips", "id,title,start_date,end_date"),
+            ("trips + spend", f"{API}/trips", "id,title,total_spent"),
+            ("cities", f"{API}/cities", "id,name,country"),
+            ("activities", f"{API}/activities?city_id={city['id']}", "id,name,estimated_cost"),
+            ("itinerary days", f"{API}/itinerary/trips/{trip['id']}/days", "id,day_number,date"),
+            ("itinerary items", f"{API}/itinerary/days/{day['id']}/items", "id,order_index"),
+        ]
+        for label, url, fields in cases:
+            separator = "&" if "?" in url else "?"
+            full = None
+            for variant, target in [("full", url), ("fields", f"{url}{separator}fields={fields}")]:
+                samples = []
+                for _ in range(args.rounds):
+                    statements.clear()
+                    with _common.Timer() as timer:
+                        response = await http.get(target, headers=headers)
+                    samples.append(timer.elapsed)
+                response.raise_for_status()
+                data = response.json()["data"]
+                if full is None:
+                    full = data
+                    consistent = ""
+                else:
+                    expected = [{key: row[key] for key in fields.split(",")} for row in full]
+                    consistent = f" matches full: {data == expected}"
+                print(
+                    f"{_common.summarize(f'{label} {variant}', samples)} "
+                    f"statements={len(statements):<4} bytes={len(response.content):<8}{consistent}"
+                )
+            print(f"{'':<28} {statements[-1][:150]}")
+
+        response = await http.get(f"{API}/trips?fields=id,secret", headers=headers)
+        print(f"unknown field -> {response.status_code} {response.json()}")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
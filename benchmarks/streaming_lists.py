@@ -0,0 +1,147 @@
+"""Peak memory of the admin list endpoints as the row count grows, buffered
+page vs. server-side cursor stream.
+
+    python benchmarks/streaming_lists.py [--rows 1000 5000]
+
+buffered: the old path, the whole page loaded into a list, every trip enriched
+          with per-trip queries and the envelope rendered in one go.
+streamed: GET /admin/trips and GET /users, rows fetched DB_STREAM_YIELD_PER at
+          a time through stream()/stream_scalars() and the envelope written out
+          in STREAM_CHUNK_BYTES chunks.
+
+Requests are driven straight through the ASGI app with a send() that only
+counts bytes, so the client never holds the body. Peak memory is measured
+with tracemalloc around each request. The streamed body is also checked
+against the buffered one byte for byte.
+"""
+import argparse
+import asyncio
+import tracemalloc
+from datetime import datetime, timedelta, timezone
+
+import _common
+from _common import API, create_schema
+
+from sqlalchemy import insert
+
+from app.database import AsyncSessionLocal, dispose_engines, engine
+from app.main import app
+from app.models.budget import Budget
+from app.models.city import City
+from app.models.itinerary_day import ItineraryDay
+from app.models.trip import Trip
+from app.models.user import Role, User
+from app.schemas.trip import TripResponse
+from app.schemas.user import UserResponse
+from app.services.trip_service import TripService
+from app.services.user_service import UserService
+from app.utils import ApiResponse, create_access_token
+from app.utils.ids import new_id
+
+
+async def seed(rows: int) -> str:
+    now = datetime.now(timezone.utc)
+    admin_id = new_id()
+    users = [{
+        "id": admin_id, "email": "admin@example.com", "password": "x", "name": "Admin",
+        "role": Role.ADMIN, "created_at": now, "updated_at": now
+    }]
+    users += [{
+        "id": new_id(), "email": f"user{index}@example.com", "password": "x", "name": f"User {index}", "role": Role.USER,
+        "created_at": now + timedelta(microseconds=index + 1), "updated_at": now
+    } for index in range(rows - 1)]
+    trips = [{
+        "id": new_id(), "user_id": admin_id, "title": f"Trip {index}", "description": "A long weekend",
+        "start_date": now, "end_date": now + timedelta(days=3),
+        "created_at": now + timedelta(microseconds=index), "updated_at": now
+    } for index in range(rows)]
+    budgets = [{"id": new_id(), "trip_id": trip["id"], "total_budget": 1000.0} for trip in trips[::2]]
+    city = {"id": new_id(), "name": "Kyoto", "country": "JP"}
+    days = [{
+        "id": new_id(), "trip_id": trip["id"], "city_id": city["id"], "day_number": 1, "date": now
+    } for trip in trips[::3]]
+
+    async with engine.begin() as conn:
+        for model, values in [(User, users), (City, [city]), (Trip, trips), (Budget, budgets), (ItineraryDay, days)]:
+            for start in range(0, len(values), 5000):
+                await conn.execute(insert(model), values[start:start + 5000])
+    return create_access_token({"user_id": admin_id, "email": "admin@example.com", "role": "ADMIN"})
+
+
+async def call(path: str, token: str, body: bytearray = None) -> dict:
+    path, _, query = path.partition("?")
+    scope = {
+        "type": "http", "asgi": {"version": "3.0"}, "http_version": "1.1", "method": "GET",
+        "scheme": "http", "path": path, "raw_path": path.encode(), "root_path": "",
+        "query_string": query.encode(), "server": ("bench", 80), "client": ("127.0.0.1", 1),
+        "headers": [(b"host", b"bench"), (b"authorization", f"Bearer {token}".encode())],
+    }
+    received = {"status": None, "bytes": 0, "chunks": 0}
+    requested = asyncio.Event()
+
+    async def receive():
+        if not requested.is_set():
+            requested.set()
+            return {"type": "http.request", "body": b"", "more_body": False}
+        await asyncio.Event().wait()
+
+    async def send(message):
+        if message["type"] == "http.response.start":
+            received["status"] = message["status"]
+        elif message["type"] == "http.response.body":
+            received["bytes"] += len(message.get("body", b""))
+            received["chunks"] += 1
+            if body is not None:
+                body.extend(message.get("body", b""))
+
+    await app(scope, receive, send)
+    return received
+
+
+async def load(kind: str, rows: int):
+    async with AsyncSessionLocal() as db:
+        if kind == "trips":
+            return [TripResponse.model_validate(trip) for trip in await TripService(db).get_all_trips(0, rows)]
+        return [UserResponse.model_validate(user) for user in await UserService(db).get_all_users(0, rows)]
+
+
+async def buffered(kind: str, rows: int) -> dict:
+    return {"bytes": len(ApiResponse.success(await load(kind, rows)).body)}
+
+
+async def measure(label: str, run) -> None:
+    tracemalloc.start()
+    with _common.Timer() as timer:
+        result = await run()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    print(f"{label:<16} peak={peak / 1024 / 1024:8.2f}MiB time={timer.elapsed * 1000:9.1f}ms {result}")
+
+
+async def identical(kind: str, path: str, token: str, rows: int) -> bool:
+    expected = ApiResponse.success(await load(kind, rows)).body
+    streamed = bytearray()
+    await call(f"{path}?limit={rows}", token, streamed)
+    return bytes(streamed) == expected
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--rows", type=int, nargs="+", default=[1000, 5000])
+    args = parser.parse_args()
+
+    try:
+        for rows in args.rows:
+            await create_schema()
+            token = await seed(rows)
+            print(f"--- {rows} rows")
+            for kind, path in [("trips", f"{API}/admin/trips"), ("users", f"{API}/users")]:
+                await measure(f"buffered {kind}", lambda: buffered(kind, rows))
+                await measure(f"streamed {kind}", lambda: call(f"{path}?limit={rows}", token))
+                print(f"{'':<16} identical to buffered: {await identical(kind, path, token, min(rows, 1000))}")
+    finally:
+        await dispose_engines()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
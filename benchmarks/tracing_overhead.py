@@ -0,0 +1,100 @@
+"""Latency of a trip listing with tracing off, on without export, and on with
+every request exported to an OTLP/JSON file; then one exported trace printed
+as a tree and a few Server-Timing headers.
+
+    python benchmarks/tracing_overhead.py [--trips 40] [--requests 500] [--concurrency 10]
+
+The Server-Timing split comes from self time: a span's duration minus its
+children, summed per category, so SQL issued while authenticating counts as
+db and not twice.
+"""
+import argparse
+import asyncio
+import json
+import logging
+import os
+import tempfile
+
+import _common
+from _common import API, client, create_schema, signup
+
+from app.config import settings
+from app.utils.tracing import span_exporter
+
+
+async def run(http, url: str, headers: dict, requests: int, concurrency: int):
+    samples = []
+    timings = []
+    queue = asyncio.Queue()
+    for _ in range(requests):
+        queue.put_nowait(None)
+
+    async def worker():
+        while not queue.empty():
+            queue.get_nowait()
+            with _common.Timer() as timer:
+                response = await http.get(url, headers=headers)
+            response.raise_for_status()
+            samples.append(timer.elapsed)
+            timings.append(response.headers.get("server-timing"))
+
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    return samples, timings
+
+
+def print_tree(spans) -> None:
+    children = {}
+    for span in spans:
+        children.setdefault(span.get("parentSpanId"), []).append(span)
+    ids = {span["spanId"] for span in spans}
+
+    def show(span, depth):
+        duration = (int(span["endTimeUnixNano"]) - int(span["startTimeUnixNano"])) / 1e6
+        print(f"  {'  ' * depth}{span['name']:<{48 - depth * 2}} {duration:8.2f}ms")
+        for child in sorted(children.get(span["spanId"], []), key=lambda item: int(item["startTimeUnixNano"])):
+            show(child, depth + 1)
+
+    for root in (span for span in spans if span.get("parentSpanId") not in ids):
+        show(root, 0)
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--trips", type=int, default=10)
+    parser.add_argument("--requests", type=int, default=500)
+    parser.add_argument("--concurrency", type=int, default=10)
+    args = parser.parse_args()
+
+    logging.getLogger("httpx").setLevel(logging.WARNING)
+    settings.TRACE_EXPORT_PATH = os.path.join(tempfile.mkdtemp(prefix="globetrotter-traces-"), "traces.jsonl")
+    await create_schema()
+
+    async with client() as http:
+        account = await signup(http, "traveller@example.com")
+        headers = {"Authorization": f"Bearer {account['tokens']['access_token']}"}
+        for index in range(args.trips):
+            await http.post(f"{API}/trips", headers=headers, json={
+                "title": f"Trip {index}", "start_date": "2026-06-01T00:00:00Z", "end_date": "2026-06-08T00:00:00Z"
+            })
+
+        url = f"{API}/trips"
+        cases = [("tracing off", False, "", 0.0), ("tracing on", True, "", 0.0), ("tracing + export all", True, "file", 1.0)]
+        for label, enabled, export, rate in cases:
+            settings.TRACING_ENABLED, settings.TRACE_EXPORT, settings.TRACE_SAMPLE_RATE = enabled, export, rate
+            await run(http, url, headers, 50, args.concurrency)
+            samples, timings = await run(http, url, headers, args.requests, args.concurrency)
+            print(_common.summarize(label, samples))
+        print(f"Server-Timing: {timings[-1]}")
+
+        span_exporter.shutdown()
+        print(f"exporter: {span_exporter.stats()}")
+        with open(settings.TRACE_EXPORT_PATH) as exported:
+            batch = json.loads(exported.readline())
+        spans = batch["resourceSpans"][0]["scopeSpans"][0]["spans"]
+        trace_id = spans[-1]["traceId"]
+        print(f"trace {trace_id}:")
+        print_tree([span for span in spans if span["traceId"] == trace_id])
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,74 @@
+"""Primary-key index size and insert throughput: text UUIDv4 keys (before)
+vs. native UUID keys with UUIDv7 defaults (after).
+
+    python benchmarks/uuid_keys.py [--rows 200000] [--batch 1000] [--url postgresql+psycopg2://...]
+
+Runs against a throwaway SQLite file by default. On SQLite, sa.Uuid falls
+back to CHAR(32), so most of the difference there comes from key ordering.
+Point --url at Postgres to see the 16-byte native type as well.
+"""
+import argparse
+import os
+import tempfile
+import time
+import uuid
+
+import _common  # noqa: F401
+
+from sqlalchemy import Column, MetaData, String, Table, Uuid, create_engine, text
+
+from app.utils.ids import new_id
+
+VARIANTS = [
+    ("text + uuid4 (before)", String(), lambda: str(uuid.uuid4())),
+    ("uuid + uuid4", Uuid(as_uuid=False), lambda: str(uuid.uuid4())),
+    ("uuid + uuid7 (after)", Uuid(as_uuid=False), new_id),
+]
+
+
+def index_size(conn, table: str) -> int:
+    if conn.dialect.name == "postgresql":
+        return conn.execute(text(f"SELECT pg_relation_size('{table}_pkey')")).scalar()
+    return conn.execute(
+        text("SELECT sum(pgsize) FROM dbstat WHERE name = :name"), {"name": f"sqlite_autoindex_{table}_1"}
+    ).scalar()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--rows", type=int, default=200000)
+    parser.add_argument("--batch", type=int, default=1000)
+    parser.add_argument("--url", default=None)
+    args = parser.parse_args()
+
+    url = args.url or f"sqlite:///{os.path.join(tempfile.mkdtemp(prefix='globetrotter-uuid-'), 'keys.db')}"
+    engine = create_engine(url)
+    metadata = MetaData()
+    tables = [
+        Table(f"bench_keys_{i}", metadata, Column("id", type_, primary_key=True), Column("payload", String))
+        for i, (_, type_, _) in enumerate(VARIANTS)
+    ]
+    metadata.drop_all(engine)
+    metadata.create_all(engine)
+
+    try:
+        for (label, _, make_id), table in zip(VARIANTS, tables):
+            started = time.perf_counter()
+            for offset in range(0, args.rows, args.batch):
+                rows = [{"id": make_id(), "payload": "x"} for _ in range(min(args.batch, args.rows - offset))]
+                with engine.begin() as conn:
+                    conn.execute(table.insert(), rows)
+            elapsed = time.perf_counter() - started
+
+            with engine.connect() as conn:
+                size = index_size(conn, table.name)
+            print(
+                f"{label:<24} rows={args.rows} inserts/s={args.rows / elapsed:10.0f} "
+                f"pk index={size / 1024 / 1024:8.2f} MiB ({size / args.rows:5.1f} B/row)"
+            )
+    finally:
+        metadata.drop_all(engine)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,141 @@
+"""Statement count for every write endpoint, checked against the budget the
+route declares with statement_budget().
+
+    python benchmarks/write_query_counts.py
+
+Runs with DB_STATEMENT_BUDGET_STRICT on, so a route that goes over its budget
+fails the request. Exits non-zero when that happens or when an endpoint
+re-reads a row it has just written (a SELECT on a table after an
+INSERT/UPDATE to it in the same request), which is what a post-write
+refresh() looks like on the wire.
+"""
+import asyncio
+import os
+import re
+import sys
+
+from sqlalchemy import event
+
+os.environ["DB_STATEMENT_BUDGET_STRICT"] = "true"
+
+from _common import API, client, create_schema, signup
+
+from app.database import engine
+from app.main import app
+from app.middleware import route_statement_budget
+
+WRITE = re.compile(r"^\s*(?:INSERT INTO|UPDATE|DELETE FROM)\s+(\w+)", re.IGNORECASE)
+READ = re.compile(r"^\s*SELECT\b.*?\bFROM\s+(\w+)", re.IGNORECASE | re.DOTALL)
+
+PATH_PARAM = re.compile(r"\{\w+\}")
+
+statements = []
+
+
+def route_budgets():
+    budgets = {}
+    for route in app.routes:
+        budget = route_statement_budget(route)
+        if budget is None:
+            continue
+        path = PATH_PARAM.sub("{id}", route.path[len(API):])
+        for method in route.methods:
+            budgets[f"{method} {path}"] = budget
+    return budgets
+
+
+@event.listens_for(engine.sync_engine, "before_cursor_execute")
+def _record(conn, cursor, statement, parameters, context, executemany):
+    statements.append(statement)
+
+
+def rereads(recorded):
+    written = set()
+    found = []
+    for statement in recorded:
+        write = WRITE.match(statement)
+        if write:
+            written.add(write.group(1))
+            continue
+        read = READ.match(statement)
+        if read and read.group(1) in written:
+            found.append(" ".join(statement.split())[:100])
+    return found
+
+
+async def main() -> int:
+    await create_schema()
+    results = {}
+
+    async with client() as http:
+        account = await signup(http, "writer@example.com")
+        headers = {"Authorization": f"Bearer {account['tokens']['access_token']}"}
+
+        async def call(name, method, url, auth=None, **kwargs):
+            statements.clear()
+            response = await http.request(method, url, headers=auth or headers, **kwargs)
+            results[name] = (len(statements), rereads(statements), response.status_code)
+            response.raise_for_status()
+            return response.json()["data"]
+
+        churn = await call("POST /auth/signup", "POST", f"{API}/auth/signup", json={
+            "email": "churn@example.com", "password": "benchmark-password", "name": "Churn"
+        })
+        await call("POST /auth/login", "POST", f"{API}/auth/login", json={
+            "email": "churn@example.com", "password": "benchmark-password"
+        })
+        tokens = await call("POST /auth/refresh", "POST", f"{API}/auth/refresh", json={
+            "refresh_token": churn["tokens"]["refresh_token"]
+        })
+        churn_headers = {"Authorization": f"Bearer {tokens['tokens']['access_token']}"}
+        await call("PUT /users/me", "PUT", f"{API}/users/me", auth=churn_headers, json={"name": "Renamed"})
+
+        city = await call("POST /cities", "POST", f"{API}/cities", json={"name": "Lisbon", "country": "PT"})
+        await call("PUT /cities/{id}", "PUT", f"{API}/cities/{city['id']}", json={"description": "Hills"})
+        activity = await call("POST /activities", "POST", f"{API}/activities", json={
+            "city_id": city["id"], "name": "Tram 28", "category": "activities", "estimated_cost": 3
+        })
+        await call("PUT /activities/{id}", "PUT", f"{API}/activities/{activity['id']}", json={"estimated_cost": 4})
+        trip = await call("POST /trips", "POST", f"{API}/trips", json={
+            "title": "Lisbon", "start_date": "2026-05-01T00:00:00Z", "end_date": "2026-05-04T00:00:00Z"
+        })
+        await call("PUT /trips/{id}", "PUT", f"{API}/trips/{trip['id']}", json={"title": "Lisbon again"})
+        budget = await call("POST /budgets", "POST", f"{API}/budgets", json={"trip_id": trip["id"], "total_budget": 500})
+        await call("PUT /budgets/{id}", "PUT", f"{API}/budgets/{budget['id']}", json={"food": 120})
+        day = await call("POST /itinerary/days", "POST", f"{API}/itinerary/days", json={
+            "trip_id": trip["id"], "city_id": city["id"], "day_number": 1, "date": "2026-05-01T00:00:00Z"
+        })
+        await call("PUT /itinerary/days/{id}", "PUT", f"{API}/itinerary/days/{day['id']}", json={"notes": "Arrive"})
+        item = await call("POST /itinerary/items", "POST", f"{API}/itinerary/items", json={
+            "itinerary_day_id": day["id"], "activity_id": activity["id"], "order_index": 0
+        })
+        await call("PUT /itinerary/items/{id}", "PUT", f"{API}/itinerary/items/{item['id']}", json={"custom_title": "Tram"})
+        shared = await call("POST /shared", "POST", f"{API}/shared", json={"trip_id": trip["id"]})
+
+        await call("DELETE /shared/{id}", "DELETE", f"{API}/shared/{shared['id']}")
+        await call("DELETE /itinerary/items/{id}", "DELETE", f"{API}/itinerary/items/{item['id']}")
+        await call("DELETE /itinerary/days/{id}", "DELETE", f"{API}/itinerary/days/{day['id']}")
+        await call("DELETE /budgets/{id}", "DELETE", f"{API}/budgets/{budget['id']}")
+        await call("DELETE /activities/{id}", "DELETE", f"{API}/activities/{activity['id']}")
+        await call("DELETE /cities/{id}", "DELETE", f"{API}/cities/{city['id']}")
+        await call("DELETE /trips/{id}", "DELETE", f"{API}/trips/{trip['id']}")
+        await call("DELETE /users/me", "DELETE", f"{API}/users/me", auth=churn_headers)
+
+    budgets = route_budgets()
+    failed = False
+    for name, (count, found, status) in results.items():
+        budget = budgets.get(name)
+        if budget is None:
+            print(f"{name:<30} NO BUDGET DECLARED")
+            failed = True
+            continue
+        ok = count <= budget and status < 500 and not found
+        failed = failed or not ok
+        print(f"{name:<30} statements={count:<3} budget={budget:<3} {'ok' if ok else 'FAIL'}")
+        for statement in found:
+            print(f"{'':<30} re-read: {statement}")
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(asyncio.run(main()))